@@ -0,0 +1,88 @@
+import math
+import threading
+import time
+from contextlib import contextmanager
+
+class Overloaded(Exception):
+    """Raised when a lane has no free slot and its queue is full."""
+
+    def __init__(self, lane, retry_after):
+        super().__init__(f"{lane} lane is overloaded")
+        self.lane = lane
+        self.retry_after = retry_after
+
+class AdmissionLane:
+    """Run at most `limit` requests at once, with up to `queue_size` more waiting.
+
+    Requests beyond that, or ones that wait longer than `queue_timeout`
+    seconds, are rejected with Overloaded instead of tying up a worker
+    thread. Each lane has its own capacity, so a burst in one cannot use up
+    the threads another needs.
+    """
+
+    def __init__(self, name, limit, queue_size, queue_timeout):
+        self.name = name
+        self.limit = limit
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout
+        self._cond = threading.Condition()
+        self.active = 0
+        self.waiting = 0
+        self.admitted = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self.max_waiting = 0
+        # Moving average of how long an admitted request holds its slot
+        self.service_time = None
+
+    def retry_after(self):
+        # Seconds until the current queue should have drained
+        service_time = self.service_time if self.service_time is not None else 1.0
+        return max(1, math.ceil(service_time * (self.waiting + 1) / self.limit))
+
+    @contextmanager
+    def admit(self):
+        with self._cond:
+            if self.active >= self.limit:
+                if self.waiting >= self.queue_size:
+                    self.rejected += 1
+                    raise Overloaded(self.name, self.retry_after())
+                self.waiting += 1
+                self.max_waiting = max(self.max_waiting, self.waiting)
+                try:
+                    admitted = self._cond.wait_for(lambda: self.active < self.limit, self.queue_timeout)
+                finally:
+                    self.waiting -= 1
+                if not admitted:
+                    self.rejected += 1
+                    self.timed_out += 1
+                    raise Overloaded(self.name, self.retry_after())
+            self.active += 1
+            self.admitted += 1
+
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            elapsed = time.monotonic() - start
+            with self._cond:
+                self.active -= 1
+                if self.service_time is None:
+                    self.service_time = elapsed
+                else:
+                    self.service_time = 0.8 * self.service_time + 0.2 * elapsed
+                self._cond.notify()
+
+    def status(self):
+        with self._cond:
+            return {
+                "limit": self.limit,
+                "queue_size": self.queue_size,
+                "active": self.active,
+                "queue_depth": self.waiting,
+                "max_queue_depth": self.max_waiting,
+                "admitted": self.admitted,
+                "rejected": self.rejected,
+                "timed_out": self.timed_out,
+                "avg_service_seconds": round(self.service_time, 3) if self.service_time is not None else None
+            }
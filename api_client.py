@@ -0,0 +1,393 @@
+"""Client side of the writer API for the desktop app.
+
+RemoteWriterStats gives the desktop app the same interface as its local
+WriterStats, backed by the Flask API. Edits are applied to a local copy
+straight away and queued. A background thread sends the queue to
+POST /writers/batch and keeps the copy current through /writers/changes.
+The copy and any unsent edits are cached on disk, so the app opens with
+the last known data and keeps edits made while the server is unreachable.
+"""
+import gzip
+import http.client
+import json
+import logging
+import os
+import queue
+import threading
+import time
+import uuid
+from pathlib import Path
+from urllib.parse import urlsplit
+
+# Seconds between polls of /writers/changes when there is nothing to send
+POLL_INTERVAL = 5.0
+# Seconds to wait after an edit before sending, so quick edits share a batch
+FLUSH_DELAY = 0.5
+# Most edits sent in one batch request
+BATCH_SIZE = 100
+# Longest wait between retries while the server is unreachable
+MAX_BACKOFF = 60.0
+# Writers added locally get this id prefix until the server assigns their real id
+LOCAL_ID_PREFIX = "local-"
+# Methods the pool may resend on a fresh connection; a resent POST could be applied twice
+IDEMPOTENT_METHODS = {"GET", "HEAD", "PUT", "DELETE"}
+
+logger = logging.getLogger(__name__)
+
+class ApiError(Exception):
+    def __init__(self, status, body, retry_after=None):
+        super().__init__(f"HTTP {status}: {body.get('error', body) if isinstance(body, dict) else body}")
+        self.status = status
+        self.body = body
+        self.retry_after = retry_after
+
+class ConnectionPool:
+    """Keep-alive HTTP connections to one API, shared between threads.
+
+    `base_url` may carry a path prefix, such as /t/<tenant>, which is added
+    to every request path.
+    """
+
+    def __init__(self, base_url, size=2, timeout=30):
+        parts = urlsplit(base_url)
+        self._connection_class = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        self._host = parts.hostname
+        self._port = parts.port
+        self._prefix = parts.path.rstrip("/")
+        self._timeout = timeout
+        self._idle = queue.LifoQueue(maxsize=size)
+
+    def _connect(self):
+        return self._connection_class(self._host, self._port, timeout=self._timeout)
+
+    def request(self, method, path, body=None, headers=None):
+        """Send a request and return its decoded JSON body.
+
+        Raises ApiError for error statuses and OSError or HTTPException when
+        the server cannot be reached.
+        """
+        headers = {"Accept-Encoding": "gzip", **(headers or {})}
+        payload = None
+        if body is not None:
+            payload = json.dumps(body).encode()
+            headers["Content-Type"] = "application/json"
+
+        try:
+            connection = self._idle.get_nowait()
+            reused = True
+        except queue.Empty:
+            connection, reused = self._connect(), False
+        try:
+            try:
+                connection.request(method, self._prefix + path, body=payload, headers=headers)
+                response = connection.getresponse()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                if not reused or method not in IDEMPOTENT_METHODS:
+                    raise
+                # The server closed an idle keep-alive connection; retry once on a new one
+                connection.close()
+                connection = self._connect()
+                connection.request(method, self._prefix + path, body=payload, headers=headers)
+                response = connection.getresponse()
+            data = response.read()
+        except Exception:
+            connection.close()
+            raise
+
+        if response.will_close:
+            connection.close()
+        else:
+            try:
+                self._idle.put_nowait(connection)
+            except queue.Full:
+                connection.close()
+
+        if response.getheader("Content-Encoding") == "gzip":
+            data = gzip.decompress(data)
+        decoded = json.loads(data) if data else None
+        if response.status >= 400:
+            retry_after = response.getheader("Retry-After")
+            raise ApiError(response.status, decoded, float(retry_after) if retry_after else None)
+        return decoded
+
+    def close(self):
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+class RemoteWriterStats:
+    """The writer store of an API server, cached locally with background sync.
+
+    Reads never touch the network. `revision` goes up whenever the local
+    copy changes, so a UI can poll it cheaply and redraw only when needed.
+    """
+
+    def __init__(self, base_url, cache_file=Path("writer_cache.json"), poll_interval=POLL_INTERVAL,
+                 flush_delay=FLUSH_DELAY, pool_size=2):
+        self.base_url = base_url
+        self.cache_file = Path(cache_file)
+        self.poll_interval = poll_interval
+        self.flush_delay = flush_delay
+        self.pool = ConnectionPool(base_url, size=pool_size)
+        self._lock = threading.RLock()
+        # The server's rows as of `version`, by id
+        self._confirmed = {}
+        self.version = None
+        # Edits not yet accepted by the server, oldest first
+        self._pending = []
+        self._next_local_id = 1
+        # The confirmed rows with the pending edits applied; what the UI shows
+        self._rows = {}
+        self.revision = 0
+        self.online = False
+        self.last_error = None
+        self._cache_dirty = False
+        self._wake = threading.Event()
+        self._stopping = False
+        self._load_cache()
+        self._thread = threading.Thread(target=self._run, name="writer-sync", daemon=True)
+        self._thread.start()
+
+    def _load_cache(self):
+        if not self.cache_file.exists():
+            return
+        with open(self.cache_file, 'r') as f:
+            cache = json.load(f)
+        # A cache of another server's data is no use; its unsent edits would go to the wrong place
+        if cache.get("base_url") != self.base_url:
+            return
+        self._confirmed = {row["id"]: row for row in cache["writers"]}
+        self.version = cache["version"]
+        self._pending = cache["pending"]
+        self._next_local_id = cache["next_local_id"]
+        self._rebuild()
+
+    def _save_cache(self):
+        with self._lock:
+            if not self._cache_dirty:
+                return
+            payload = json.dumps({
+                "base_url": self.base_url,
+                "version": self.version,
+                "writers": list(self._confirmed.values()),
+                "pending": self._pending,
+                "next_local_id": self._next_local_id
+            })
+            self._cache_dirty = False
+        # Write to a temp file and rename so a crash never leaves a partial cache
+        tmp_file = self.cache_file.with_name(self.cache_file.name + ".tmp")
+        with open(tmp_file, 'w') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.cache_file)
+
+    def _rebuild(self):
+        # Called with the lock held
+        rows = {writer_id: dict(row) for writer_id, row in self._confirmed.items()}
+        for operation in self._pending:
+            apply_operation(rows, operation)
+        self._rows = rows
+        self.revision += 1
+        self._cache_dirty = True
+
+    def _queue(self, operation):
+        with self._lock:
+            self._pending.append(operation)
+            apply_operation(self._rows, operation)
+            self.revision += 1
+            self._cache_dirty = True
+        self._wake.set()
+
+    def add_writer(self, name):
+        with self._lock:
+            writer_id = f"{LOCAL_ID_PREFIX}{self._next_local_id}"
+            self._next_local_id += 1
+            self._queue({"op": "add", "id": writer_id, "name": name})
+        return writer_id
+
+    def update_stats(self, writer_id, articles, views):
+        self._queue({"op": "update", "id": writer_id, "articles": articles, "views": views})
+
+    def remove_writer(self, writer_id):
+        self._queue({"op": "remove", "id": writer_id})
+
+    def get_stats(self, writer_id):
+        with self._lock:
+            row = self._rows.get(writer_id)
+            return {"articles": row["articles"], "views": row["views"]} if row else {"articles": 0, "views": 0}
+
+    def get_writer_stats(self):
+        with self._lock:
+            rows = list(self._rows.values())
+        return sorted((
+            {**row, "avg_views": round(row["views"] / row["articles"]) if row["articles"] > 0 else 0}
+            for row in rows
+        ), key=lambda x: (x["articles"], x["views"]), reverse=True)
+
+    @property
+    def pending_count(self):
+        with self._lock:
+            return len(self._pending)
+
+    def sync(self):
+        """Send queued edits, then fetch what changed on the server.
+
+        Runs on the background thread; call it directly to sync right away.
+        Raises OSError, HTTPException or ApiError if the server cannot be used.
+        """
+        while self._send_batch():
+            pass
+        self.refresh()
+
+    def refresh(self):
+        """Bring the confirmed rows up to the server's current version."""
+        with self._lock:
+            version = self.version
+        if version is not None:
+            changes = self.pool.request("GET", f"/writers/changes?since={version}")
+            if not changes.get("resync"):
+                self._apply_delta(changes)
+                return
+        full = self.pool.request("GET", "/writers")
+        with self._lock:
+            self._confirmed = {w["id"]: plain_row(w) for w in full["writers"]}
+            self.version = full["version"]
+            self._rebuild()
+
+    def _apply_delta(self, delta):
+        with self._lock:
+            if self.version is None or delta["since"] > self.version:
+                # A gap we cannot fill from this delta; the next refresh catches up
+                return False
+            if delta["version"] <= self.version:
+                return True
+            for writer_id in delta["removed"]:
+                self._confirmed.pop(writer_id, None)
+            for writer in delta["writers"]:
+                self._confirmed[writer["id"]] = plain_row(writer)
+            self.version = delta["version"]
+            self._rebuild()
+            return True
+
+    def _send_batch(self):
+        """Send the oldest queued edits in one request; return whether any were sent.
+
+        The edits are tagged with a batch id the first time they are sent.
+        A batch that may have reached the server (say the response timed
+        out) is resent with the same edits and id, and the server answers
+        it without applying it twice.
+        """
+        with self._lock:
+            batch_id = self._pending[0].get("batch") if self._pending else None
+            if batch_id is not None:
+                batch = [operation for operation in self._pending if operation.get("batch") == batch_id]
+            else:
+                batch = []
+                for operation in self._pending[:BATCH_SIZE]:
+                    # Edits to a writer added in this batch have to wait for its real id
+                    if operation["op"] != "add" and operation["id"].startswith(LOCAL_ID_PREFIX):
+                        break
+                    batch.append(operation)
+                if not batch:
+                    return False
+                batch_id = uuid.uuid4().hex
+                for operation in batch:
+                    operation["batch"] = batch_id
+                self._cache_dirty = True
+
+        body = {"batch_id": batch_id, "operations": [
+            {k: v for k, v in operation.items() if k != "batch" and not (operation["op"] == "add" and k == "id")}
+            for operation in batch
+        ]}
+        try:
+            result = self.pool.request("POST", "/writers/batch", body, {"Prefer": "return=representation"})
+        except ApiError as e:
+            if e.status != 400:
+                raise
+            # The server will never accept these edits; drop them rather than retry forever
+            result = None
+            self.last_error = str(e)
+
+        with self._lock:
+            del self._pending[:len(batch)]
+            if result is None:
+                self._rebuild()
+                return True
+            # Give locally added writers their server ids, in queued edits too
+            for operation, writer_id in zip(batch, result["ids"]):
+                if operation["op"] == "add":
+                    self._rename(operation["id"], writer_id)
+            # Without a usable delta the shown rows stay as they are until the refresh that follows
+            if not result.get("resync"):
+                self._apply_delta(result)
+        return True
+
+    def _rename(self, local_id, writer_id):
+        # Called with the lock held
+        for operation in self._pending:
+            if operation["id"] == local_id:
+                operation["id"] = writer_id
+
+    def _run(self):
+        backoff = 1.0
+        while not self._stopping:
+            try:
+                self.sync()
+                self.online = True
+                self.last_error = None
+                backoff = 1.0
+                timeout = self.poll_interval
+            except ApiError as e:
+                self.online = e.status != 503
+                self.last_error = str(e)
+                timeout = e.retry_after or backoff
+                backoff = min(backoff * 2, MAX_BACKOFF)
+            except (OSError, http.client.HTTPException) as e:
+                self.online = False
+                self.last_error = str(e)
+                timeout = backoff
+                backoff = min(backoff * 2, MAX_BACKOFF)
+            try:
+                self._save_cache()
+            except OSError as e:
+                # Shown like a sync error, and saved again on the next pass
+                with self._lock:
+                    self._cache_dirty = True
+                self.last_error = f"Error saving writer cache: {e}"
+                logger.warning("Error saving writer cache: %s", e)
+            if self._wake.wait(timeout) and not self._stopping:
+                # Give quick successive edits a moment to join the same batch
+                time.sleep(self.flush_delay)
+            self._wake.clear()
+
+    def close(self, timeout=10):
+        """Try to send queued edits, stop syncing and save the cache."""
+        self._stopping = True
+        self._wake.set()
+        self._thread.join(timeout)
+        if not self._thread.is_alive():
+            try:
+                while self._send_batch():
+                    pass
+            except (ApiError, OSError, http.client.HTTPException) as e:
+                # Unsent edits stay in the cache and go out on the next start
+                self.last_error = str(e)
+        self._save_cache()
+        self.pool.close()
+
+def plain_row(writer):
+    return {"id": writer["id"], "name": writer["name"], "articles": writer["articles"], "views": writer["views"]}
+
+def apply_operation(rows, operation):
+    """Apply one queued edit to a dict of rows by id."""
+    if operation["op"] == "add":
+        rows.setdefault(operation["id"], {"id": operation["id"], "name": operation["name"], "articles": 0, "views": 0})
+    elif operation["op"] == "update":
+        # Like the server, an update to an unknown writer is kept but not listed
+        if operation["id"] in rows:
+            rows[operation["id"]].update(articles=operation["articles"], views=operation["views"])
+    else:
+        rows.pop(operation["id"], None)
@@ -1,83 +1,301 @@
-from flask import Flask, jsonify, request, send_file
+from flask import Blueprint, Flask, Response, current_app, g, jsonify, request, send_file
 from flask_cors import CORS
+import gc
 import json
+import logging
+import os
+import atexit
+import threading
+import time
+from collections import OrderedDict, deque
 from pathlib import Path
-from datetime import datetime
-from PIL import Image, ImageDraw, ImageFont
+from datetime import date, datetime, timedelta
 import io
+import gzip
+from medals import MEDAL_ATLAS, load_medals
+from report_svg import generate_report_svg
+from snapshots import SnapshotStore, compare_snapshots, freeze_rows, period_key, rerank
+from artifacts import ReportArtifacts, fingerprint, next_period_close, standard_periods
+from tenants import DEFAULT_TENANT, TenantPrefixMiddleware, TenantRegistry
+from rwlock import ReadWriteLock
+from admission import AdmissionLane, Overloaded
+from search import NameIndex
+from rankings import DEFAULT_SORT, SORT_KEYS, Rankings
+from statsfile import StatsFile, encode as encode_stats, iter_rows
+from report_cache import RenderCache, RenderedReport
+from eventlog import log_event
 
-app = Flask(__name__)
-CORS(app)
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Routes live on a blueprint so create_app() can build the app after warming shared state
+api = Blueprint("api", __name__, cli_group=None)
+
+# Seconds to coalesce store mutations into one write; 0 keeps writes synchronous
+WRITE_DELAY = float(os.environ.get("WRITER_STATS_WRITE_DELAY", "0"))
+# Set to "binary" to keep each store in writer_stats.bin (see statsfile.py) instead of writer_stats.json
+STATS_FILENAME = "writer_stats.bin" if os.environ.get("WRITER_STATS_FORMAT", "json") == "binary" else "writer_stats.json"
+# Number of recent mutations remembered for /writers/changes
+CHANGE_LOG_SIZE = int(os.environ.get("WRITER_STATS_CHANGE_LOG_SIZE", "1000"))
+# Seconds between keep-alive comments on an idle /writers/stream connection
+STREAM_HEARTBEAT = float(os.environ.get("WRITER_STATS_STREAM_HEARTBEAT", "15"))
+# JSON bodies smaller than this many bytes are sent uncompressed
+COMPRESS_MIN_SIZE = int(os.environ.get("COMPRESS_MIN_SIZE", "1024"))
+# Directory holding the frozen leaderboards of closed report periods
+SNAPSHOT_DIR = Path(os.environ.get("SNAPSHOT_DIR", "snapshots"))
+# Directory of pre-rendered reports for the standard (last week / last month) periods
+REPORT_ARTIFACT_DIR = Path(os.environ.get("REPORT_ARTIFACT_DIR", "reports"))
+# Set to 1 to pre-render the standard period reports from a background thread
+REPORT_SCHEDULER = os.environ.get("REPORT_SCHEDULER", "0") == "1"
+# Each tenant other than the default one keeps its store, snapshots and reports in TENANT_DIR/<tenant>
+TENANT_DIR = Path(os.environ.get("TENANT_DIR", "tenants"))
+# Most tenants kept in memory at once; the least recently used are unloaded first
+TENANT_CACHE_SIZE = int(os.environ.get("TENANT_CACHE_SIZE", "32"))
+# Estimated bytes of memory the loaded tenants may use together
+TENANT_MEMORY_BUDGET = int(os.environ.get("TENANT_MEMORY_BUDGET", str(256 * 1024 * 1024)))
+# Estimated bytes one tenant may use and still be kept loaded between requests
+TENANT_MEMORY_LIMIT = int(os.environ.get("TENANT_MEMORY_LIMIT", str(64 * 1024 * 1024)))
+# Rough resident size of one writer in WriterStats, used for the memory budget
+WRITER_MEMORY_ESTIMATE = 600
+# Report renders allowed at once, and how many more may wait (and for how many seconds) before getting a 503.
+# Keep the two together, plus STREAM_CONCURRENCY, below the worker's thread count so reads always have threads left.
+EXPORT_CONCURRENCY = int(os.environ.get("EXPORT_CONCURRENCY", "2"))
+EXPORT_QUEUE_SIZE = int(os.environ.get("EXPORT_QUEUE_SIZE", "2"))
+EXPORT_QUEUE_TIMEOUT = float(os.environ.get("EXPORT_QUEUE_TIMEOUT", "30"))
+# The same for the read endpoints, which get their own capacity
+READ_CONCURRENCY = int(os.environ.get("READ_CONCURRENCY", "4"))
+READ_QUEUE_SIZE = int(os.environ.get("READ_QUEUE_SIZE", "32"))
+READ_QUEUE_TIMEOUT = float(os.environ.get("READ_QUEUE_TIMEOUT", "5"))
+# Open /writers/stream connections allowed at once; each holds a worker thread, so
+# further ones get a 503 right away and the dashboard polls /writers/changes instead
+STREAM_CONCURRENCY = int(os.environ.get("STREAM_CONCURRENCY", "2"))
+# Most rows GET /export/preview draws
+PREVIEW_MAX_ROWS = 50
+# Memory for keeping the last drawn PNG report of each period, so the next export only redraws changed rows
+REPORT_IMAGE_CACHE_BYTES = int(os.environ.get("REPORT_IMAGE_CACHE_BYTES", str(256 * 1024 * 1024)))
 
 class WriterStats:
-    def __init__(self):
-        self.data_file = Path("writer_stats.json")
+    def __init__(self, data_file=Path("writer_stats.json"), write_delay=WRITE_DELAY):
+        self.data_file = Path(data_file)
+        # Seconds to coalesce mutations before writing them out; 0 writes synchronously
+        self.write_delay = write_delay
+        # Reads share the lock; mutations take it exclusively
+        self._lock = ReadWriteLock()
+        self._changed = threading.Condition()
+        # Guards the pending-save state below
+        self._save_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._dirty = False
+        self._save_timer = None
+        self._generation = 0
+        self._written_generation = 0
+        # Versions start from the load time so they keep increasing across restarts
+        self.version = int(time.time() * 1000)
+        self.changes = deque(maxlen=CHANGE_LOG_SIZE)
+        # Recently applied batch ids and the ids they returned, so a resent batch is not applied twice
+        self.batches = OrderedDict()
+        # Stores ending in .bin use the binary format and are read through mmap
+        self.binary = self.data_file.suffix == ".bin"
         self.writers = self.load_data()
+        # The name index and rankings are built on first use, so opening a large store stays cheap
+        self._names = None
+        self._rankings = None
+        self._index_lock = threading.Lock()
+        atexit.register(self.flush)
 
     def load_data(self):
+        if self.binary:
+            # Writers are decoded from the mapped file as they are read, until a mutation copies them
+            return StatsFile(self.data_file) if self.data_file.exists() else {"writers": [], "stats": {}}
         if self.data_file.exists():
             with open(self.data_file, 'r') as f:
                 data = json.load(f)
-                # Fix any duplicate IDs
-                used_ids = set()
-                next_id = 1
-                fixed_writers = []
-                fixed_stats = {}
-                
-                for writer in data["writers"]:
-                    old_id = writer["id"]
-                    # If ID is already used, assign a new one
-                    while str(next_id) in used_ids:
-                        next_id += 1
-                    new_id = str(next_id)
-                    used_ids.add(new_id)
-                    
-                    # Update writer with new ID
-                    writer["id"] = new_id
-                    fixed_writers.append(writer)
-                    
-                    # Transfer stats to new ID if they exist
-                    if old_id in data["stats"]:
-                        fixed_stats[new_id] = data["stats"][old_id]
-                    else:
-                        fixed_stats[new_id] = {"articles": 0, "views": 0}
-                    
+            # Fix any duplicate IDs
+            used_ids = set()
+            next_id = 1
+            fixed_writers = []
+            fixed_stats = {}
+            changed = False
+            
+            for writer in data["writers"]:
+                old_id = writer["id"]
+                # If ID is already used, assign a new one
+                while str(next_id) in used_ids:
                     next_id += 1
+                new_id = str(next_id)
+                used_ids.add(new_id)
                 
-                data["writers"] = fixed_writers
-                data["stats"] = fixed_stats
+                # Update writer with new ID
+                changed = changed or new_id != old_id
+                writer["id"] = new_id
+                fixed_writers.append(writer)
                 
-                # Save the fixed data
-                with open(self.data_file, 'w') as f:
-                    json.dump(data, f, indent=2)
+                # Transfer stats to new ID if they exist
+                if old_id in data["stats"]:
+                    fixed_stats[new_id] = data["stats"][old_id]
+                else:
+                    fixed_stats[new_id] = {"articles": 0, "views": 0}
                 
-                return data
+                next_id += 1
+            
+            changed = changed or fixed_stats != data["stats"]
+            data["writers"] = fixed_writers
+            data["stats"] = fixed_stats
+            
+            # The file is closed by now, as Windows cannot replace an open file.
+            # Save the fixed data, leaving the file alone when nothing needed fixing
+            if changed:
+                self._write_file(json.dumps(data, indent=2))
+            
+            return data
         return {
             "writers": [],
             "stats": {}
         }
 
     def save_data(self):
-        with open(self.data_file, 'w') as f:
-            json.dump(self.writers, f, indent=2)
+        # Called after the mutation has released the write lock, since
+        # flushing needs a read lock to serialize
+        with self._save_lock:
+            self._dirty = True
+            if self.write_delay > 0:
+                if self._save_timer is None:
+                    # Later mutations within the delay are picked up by this same write
+                    self._save_timer = threading.Timer(self.write_delay, self.flush)
+                    self._save_timer.daemon = True
+                    self._save_timer.start()
+                return
+        self.flush()
+
+    def flush(self):
+        """Write pending changes to disk, if there are any."""
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if not self._dirty:
+                return
+            with self._lock.read():
+                payload = encode_stats(self.writers) if self.binary else json.dumps(self.writers, indent=2)
+            self._dirty = False
+            self._generation += 1
+            generation = self._generation
+        with self._write_lock:
+            # A flush that serialized later may have already reached the disk
+            if generation > self._written_generation:
+                self._write_file(payload)
+                self._written_generation = generation
+
+    def close(self):
+        """Flush pending changes and stop tracking this store for shutdown."""
+        self.flush()
+        atexit.unregister(self.flush)
+        if isinstance(self.writers, StatsFile):
+            self.writers.close()
+
+    def _write_file(self, payload):
+        # Write to a temp file and rename so readers never see a partial file
+        self.data_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.data_file.with_name(self.data_file.name + ".tmp")
+        with open(tmp_file, 'wb' if isinstance(payload, bytes) else 'w') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.data_file)
+
+    @property
+    def names(self):
+        if self._names is None:
+            with self._index_lock:
+                if self._names is None:
+                    self._names = NameIndex((writer_id, name) for writer_id, name, _, _ in iter_rows(self.writers))
+        return self._names
+
+    @property
+    def rankings(self):
+        if self._rankings is None:
+            with self._index_lock:
+                if self._rankings is None:
+                    self._rankings = Rankings(iter_rows(self.writers))
+        return self._rankings
+
+    def _thaw(self):
+        # Called with the write lock held: copy a mapped store into plain dicts before changing it
+        if isinstance(self.writers, StatsFile):
+            mapped = self.writers
+            self.writers = mapped.to_dict()
+            mapped.close()
 
     def add_writer(self, name):
+        with self._lock.write():
+            self._thaw()
+            new_id = self._add_writer(name)
+        self.save_data()
+        return new_id
+
+    def update_stats(self, writer_id, articles, views):
+        with self._lock.write():
+            self._thaw()
+            self._update_stats(writer_id, articles, views)
+        self.save_data()
+
+    def remove_writer(self, writer_id):
+        with self._lock.write():
+            self._thaw()
+            self._remove_writer(writer_id)
+        self.save_data()
+
+    def apply(self, operations, batch_id=None):
+        """Apply a list of edits under one lock and one save.
+
+        Each operation is {"op": "add", "name"}, {"op": "update", "id",
+        "articles", "views"} or {"op": "remove", "id"}, already validated.
+        Returns the id each operation touched, in order. A batch whose
+        `batch_id` was already applied (one of the last CHANGE_LOG_SIZE) is
+        not applied again; the ids from the first time are returned.
+        """
+        ids = []
+        with self._lock.write():
+            if batch_id is not None and batch_id in self.batches:
+                return self.batches[batch_id]
+            self._thaw()
+            for operation in operations:
+                if operation["op"] == "add":
+                    ids.append(self._add_writer(operation["name"]))
+                elif operation["op"] == "update":
+                    self._update_stats(operation["id"], operation["articles"], operation["views"])
+                    ids.append(operation["id"])
+                else:
+                    self._remove_writer(operation["id"])
+                    ids.append(operation["id"])
+            if batch_id is not None:
+                self.batches[batch_id] = ids
+                while len(self.batches) > CHANGE_LOG_SIZE:
+                    self.batches.popitem(last=False)
+        if operations:
+            self.save_data()
+        return ids
+
+    def _add_writer(self, name):
+        # The mutations below are called with the write lock held
         # Get all existing IDs
         existing_ids = {w["id"] for w in self.writers["writers"]}
         next_id = 1
-        
+
         # Find the next available ID
         while str(next_id) in existing_ids:
             next_id += 1
-        
+
         new_id = str(next_id)
-        
+
         # Add writer with unique ID
         self.writers["writers"].append({
             "id": new_id,
             "name": name
         })
-        
+
         # Initialize stats
         if "stats" not in self.writers:
             self.writers["stats"] = {}
@@ -85,43 +303,189 @@ class WriterStats:
             "articles": 0,
             "views": 0
         }
-        
-        self.save_data()
+        self.names.add(new_id, name)
+        self.rankings.add(new_id, name)
+
+        self.record_change(new_id)
         return new_id
 
-    def update_stats(self, writer_id, articles, views):
+    def _update_stats(self, writer_id, articles, views):
         if "stats" not in self.writers:
             self.writers["stats"] = {}
-        
+
         self.writers["stats"][writer_id] = {
             "articles": articles,
             "views": views
         }
-        self.save_data()
+        self.rankings.update(writer_id, articles, views)
+        self.record_change(writer_id)
 
-    def remove_writer(self, writer_id):
+    def _remove_writer(self, writer_id):
         # Remove writer from writers list
         self.writers["writers"] = [w for w in self.writers["writers"] if w["id"] != writer_id]
         # Remove writer's stats
         if writer_id in self.writers["stats"]:
             del self.writers["stats"][writer_id]
-        self.save_data()
+        self.names.remove(writer_id)
+        self.rankings.remove(writer_id)
+        self.record_change(writer_id)
 
-    def get_writer_stats(self):
-        stats = []
-        for writer in self.writers["writers"]:
-            writer_id = writer["id"]
-            writer_stats = self.writers["stats"].get(writer_id, {"articles": 0, "views": 0})
-            stats.append({
-                "id": writer_id,
-                "name": writer["name"],
-                "articles": writer_stats["articles"],
-                "views": writer_stats["views"],
-                "avg_views": round(writer_stats["views"] / writer_stats["articles"]) if writer_stats["articles"] > 0 else 0
-            })
-        return sorted(stats, key=lambda x: (x["articles"], x["views"]), reverse=True)
+    def record_change(self, writer_id):
+        # Called with the write lock held
+        self.version += 1
+        self.changes.append((self.version, writer_id))
+        with self._changed:
+            self._changed.notify_all()
 
-def generate_report_image(writer_stats, start_date=None, end_date=None):
+    def wait_for_change(self, version, timeout):
+        """Block until the store moves past `version` or `timeout` elapses."""
+        with self._changed:
+            self._changed.wait_for(lambda: self.version > version, timeout)
+            return self.version
+
+    def get_writer_stats(self, sort=DEFAULT_SORT):
+        return self.get_versioned_writer_stats(sort)[1]
+
+    def get_versioned_writer_stats(self, sort=DEFAULT_SORT):
+        """Return the current version and the rows as of that version, best
+        first by `sort` (one of SORT_KEYS)."""
+        with self._lock.read():
+            return self.version, self.rankings.rows(sort)
+
+    def search(self, query, limit=20):
+        """Find writers by name prefix, then by fuzzy match.
+
+        Returns the version searched and the matching rows, each with its
+        current rank, how it matched and a similarity score.
+        """
+        with self._lock.read():
+            version = self.version
+            rankings = self.rankings
+            results = [
+                {**rankings.row(writer_id), "rank": rankings.rank(writer_id), "match": match, "score": score}
+                for writer_id, match, score in self.names.search(query, limit)
+            ]
+        return version, results
+
+    def changes_since(self, since):
+        """Return the writers changed after version `since`, with their ranks.
+
+        Returns None when `since` is older than the change log (or from another
+        process), in which case the caller has to resync the full list.
+        """
+        with self._lock.read():
+            oldest = self.changes[0][0] if self.changes else self.version + 1
+            if since > self.version or since < oldest - 1:
+                return None
+            changed = set()
+            for version, writer_id in reversed(self.changes):
+                if version <= since:
+                    break
+                changed.add(writer_id)
+            version = self.version
+            rankings = self.rankings
+            writers = [
+                {**rankings.row(writer_id), "rank": rankings.rank(writer_id)}
+                for writer_id in changed if writer_id in rankings
+            ]
+            summary = rankings.summary()
+
+        writers.sort(key=lambda w: w["rank"])
+        present = {w["id"] for w in writers}
+        return {
+            "since": since,
+            "version": version,
+            "writers": writers,
+            "removed": sorted(changed - present),
+            "summary": summary
+        }
+
+class Tenant:
+    """One publication's writer store, with its snapshots, pre-rendered
+    reports and cached response bodies."""
+
+    def __init__(self, key):
+        self.key = key
+        if key == DEFAULT_TENANT:
+            # The default tenant keeps the single-publication file layout
+            data_file, snapshot_dir, artifact_dir = Path(STATS_FILENAME), SNAPSHOT_DIR, REPORT_ARTIFACT_DIR
+        else:
+            root = TENANT_DIR / key
+            data_file, snapshot_dir, artifact_dir = root / STATS_FILENAME, root / "snapshots", root / "reports"
+        self.stats = WriterStats(data_file)
+        self.snapshots = SnapshotStore(snapshot_dir)
+        self.artifacts = ReportArtifacts(artifact_dir)
+        # Encoded response bodies keyed by (name, encoding), each tagged with its data version
+        self.encoded_bodies = {}
+        self.encoded_bodies_lock = threading.Lock()
+        # One lock per cached body, held while it is built or compressed
+        self.encoded_build_locks = {}
+        self.closed = False
+
+    def memory_estimate(self):
+        with self.encoded_bodies_lock:
+            cached = sum(len(body) for _, body in self.encoded_bodies.values())
+        return len(self.stats.writers["writers"]) * WRITER_MEMORY_ESTIMATE + cached
+
+    def close(self):
+        self.closed = True
+        self.stats.close()
+
+def known_tenants():
+    """Return the default tenant and every tenant with a store in TENANT_DIR."""
+    keys = [DEFAULT_TENANT]
+    if TENANT_DIR.exists():
+        keys += sorted(p.parent.name for p in TENANT_DIR.glob(f"*/{STATS_FILENAME}"))
+    return keys
+
+def summarize_writers(writer_stats):
+    total_articles = sum(w["articles"] for w in writer_stats)
+    total_views = sum(w["views"] for w in writer_stats)
+    return {
+        "total_writers": len(writer_stats),
+        "total_articles": total_articles,
+        "total_views": total_views,
+        "avg_views_per_article": round(total_views / total_articles) if total_articles > 0 else 0
+    }
+
+_report_fonts = None
+_report_fonts_lock = threading.Lock()
+
+def load_report_fonts():
+    """Load the PNG report fonts once per process: (title, header, normal, small)."""
+    global _report_fonts
+    with _report_fonts_lock:
+        if _report_fonts is None:
+            from PIL import ImageFont
+            
+            # Use Windows system fonts directly for better rendering
+            WINDOWS_FONT_PATH = "C:/Windows/Fonts/"
+            
+            try:
+                # Use bold fonts for headers and titles
+                _report_fonts = (
+                    ImageFont.truetype(WINDOWS_FONT_PATH + "arialbd.ttf", 44),  # Arial Bold
+                    ImageFont.truetype(WINDOWS_FONT_PATH + "arialbd.ttf", 32),  # Arial Bold
+                    ImageFont.truetype(WINDOWS_FONT_PATH + "arial.ttf", 24),    # Arial Regular
+                    ImageFont.truetype(WINDOWS_FONT_PATH + "arialbd.ttf", 16)   # Arial Bold
+                )
+            except Exception as e:
+                log_event("report_fonts_fallback", logging.WARNING, error=str(e))
+                # Fallback to basic fonts with larger sizes
+                _report_fonts = (ImageFont.load_default(),) * 4
+        return _report_fonts
+
+def draw_report_image(writer_stats, start_date=None, end_date=None, max_rows=None, previous=None):
+    """Draw the report layout, optionally only the top `max_rows` rows.
+
+    Returns the image and a RenderedReport describing it. When `previous`
+    has the same layout (size, period and row count), its image is drawn on
+    in place and only the cards and the rows whose contents changed are
+    redrawn; otherwise the report is drawn from scratch.
+    """
+    # Pillow is imported on first use so workers that never render boot faster
+    from PIL import Image, ImageDraw
+    
     # Fixed width
     width = 1000
     
@@ -133,14 +497,26 @@ def generate_report_image(writer_stats, start_date=None, end_date=None):
     row_spacing = 8
     
     # Calculate needed height for all writers
-    num_writers = len(writer_stats["writers"])
+    rows = writer_stats["writers"][:max_rows]
+    num_writers = len(rows)
     writers_section_height = (row_height + row_spacing) * num_writers - row_spacing  # Subtract last spacing
     
     # Total height with minimum of 800px
     total_height = max(800, header_height + cards_section_height + table_header_height + writers_section_height + 40)  # 40px bottom padding
     
+    header_key = (start_date, end_date)
+    incremental = (
+        previous is not None
+        and previous.image.size == (width, total_height)
+        and previous.header_key == header_key
+        and len(previous.row_keys) == num_writers
+    )
+    
     # Create image with white background
-    img = Image.new('RGB', (width, total_height), 'white')
+    if incremental:
+        img = previous.image
+    else:
+        img = Image.new('RGB', (width, total_height), 'white')
     
     # Verify image dimensions
     assert img.size == (width, total_height), f"Image dimensions mismatch. Expected {width}x{total_height}, got {img.size[0]}x{img.size[1]}"
@@ -153,31 +529,21 @@ def generate_report_image(writer_stats, start_date=None, end_date=None):
     text_gray = '#374151'    # Darker gray for better readability
     row_alt_bg = '#E8EDF5'   # More distinct alternate row color
     border_color = '#D1D5DB' # Border color for cards and table
+    up_green = '#16A34A'     # Rank and views gains
+    down_red = '#DC2626'     # Rank and views losses
     
-    # Use Windows system fonts directly for better rendering
-    WINDOWS_FONT_PATH = "C:/Windows/Fonts/"
+    title_font, header_font, normal_font, small_font = load_report_fonts()
     
-    try:
-        # Use bold fonts for headers and titles
-        title_font = ImageFont.truetype(WINDOWS_FONT_PATH + "arialbd.ttf", 44)  # Arial Bold
-        header_font = ImageFont.truetype(WINDOWS_FONT_PATH + "arialbd.ttf", 32)  # Arial Bold
-        normal_font = ImageFont.truetype(WINDOWS_FONT_PATH + "arial.ttf", 24)    # Arial Regular
-    except Exception as e:
-        print(f"Error loading fonts: {str(e)}")
-        # Fallback to basic fonts with larger sizes
-        title_font = ImageFont.load_default()
-        header_font = ImageFont.load_default()
-        normal_font = ImageFont.load_default()
-    
-    # Draw blue header background
-    draw.rectangle([0, 0, width, header_height], fill=header_blue)
-    
-    # Draw title
-    draw.text((40, 20), "Writer Reports", fill='white', font=title_font)
-    
-    # Draw date range
-    if start_date and end_date:
-        draw.text((40, 65), f"{start_date} - {end_date}", fill='white', font=header_font)
+    if not incremental:
+        # Draw blue header background
+        draw.rectangle([0, 0, width, header_height], fill=header_blue)
+        
+        # Draw title
+        draw.text((40, 20), "Writer Reports", fill='white', font=title_font)
+        
+        # Draw date range
+        if start_date and end_date:
+            draw.text((40, 65), f"{start_date} - {end_date}", fill='white', font=header_font)
     
     # Calculate summary stats
     total_writers = len(writer_stats["writers"])
@@ -198,55 +564,91 @@ def generate_report_image(writer_stats, start_date=None, end_date=None):
         ("Avg Views/Article", str(avg_views))
     ]
     
+    # Period-over-period movement, present when a previous snapshot was found
+    movements = writer_stats.get("movements")
+    views_growth = writer_stats.get("views_growth")
+    
     # Calculate total cards width and start position to center them
     total_cards_width = (card_width * 4) + (card_spacing * 3)
     cards_start_x = (width - total_cards_width) // 2
     
-    for i, (label, value) in enumerate(stats):
-        x = cards_start_x + i * (card_width + card_spacing)
-        # Draw enhanced card with border
-        # Shadow
-        draw.rectangle([x+3, cards_y+3, x + card_width+3, cards_y + card_height+3], fill='#E5E7EB')
-        # Background
-        draw.rectangle([x, cards_y, x + card_width, cards_y + card_height], fill='white')
-        # Border
-        draw.rectangle([x, cards_y, x + card_width, cards_y + card_height], outline=border_color, width=2)
-        # Stats with increased padding
-        value_bbox = header_font.getbbox(value)
-        value_width = value_bbox[2] - value_bbox[0]
-        value_x = x + (card_width - value_width) // 2  # Center text horizontally
-        draw.text((value_x, cards_y + 25), value, fill='black', font=header_font)
-        label_bbox = normal_font.getbbox(label)
-        label_width = label_bbox[2] - label_bbox[0]
-        label_x = x + (card_width - label_width) // 2  # Center text horizontally
-        draw.text((label_x, cards_y + 70), label, fill=text_gray, font=normal_font)
+    card_key = (tuple(stats), views_growth)
+    redraw_cards = not incremental or card_key != previous.card_key
+    if redraw_cards:
+        if incremental:
+            # Clear the cards and their shadows before redrawing them
+            draw.rectangle([0, cards_y, width, cards_y + card_height + 3], fill='white')
+        
+        for i, (label, value) in enumerate(stats):
+            x = cards_start_x + i * (card_width + card_spacing)
+            # Draw enhanced card with border
+            # Shadow
+            draw.rectangle([x+3, cards_y+3, x + card_width+3, cards_y + card_height+3], fill='#E5E7EB')
+            # Background
+            draw.rectangle([x, cards_y, x + card_width, cards_y + card_height], fill='white')
+            # Border
+            draw.rectangle([x, cards_y, x + card_width, cards_y + card_height], outline=border_color, width=2)
+            # Stats with increased padding
+            value_bbox = header_font.getbbox(value)
+            value_width = value_bbox[2] - value_bbox[0]
+            value_x = x + (card_width - value_width) // 2  # Center text horizontally
+            draw.text((value_x, cards_y + 25), value, fill='black', font=header_font)
+            label_bbox = normal_font.getbbox(label)
+            label_width = label_bbox[2] - label_bbox[0]
+            label_x = x + (card_width - label_width) // 2  # Center text horizontally
+            draw.text((label_x, cards_y + 70), label, fill=text_gray, font=normal_font)
+        
+            if label == "Total Views" and views_growth is not None:
+                growth_text = f"{views_growth:+d}% vs last period"
+                growth_bbox = small_font.getbbox(growth_text)
+                growth_x = x + (card_width - (growth_bbox[2] - growth_bbox[0])) // 2
+                draw.text((growth_x, cards_y + 97), growth_text, fill=up_green if views_growth >= 0 else down_red, font=small_font)
+    
     
     # Draw writer leaderboard with increased spacing
     y = cards_y + 160
     
-    # Draw "Writer Leaderboard" heading with more padding
-    draw.text((40, y), "Writer Leaderboard", fill='black', font=header_font)
+    if not incremental:
+        # Draw "Writer Leaderboard" heading with more padding
+        draw.text((40, y), "Writer Leaderboard", fill='black', font=header_font)
     y += 60
     
     # Draw table headers with wider spacing for larger width
     headers = ["Writer", "Articles", "Views", "Avg Views/Article"]
     header_positions = [40, 400, 600, 780]
     
-    for header, x in zip(headers, header_positions):
-        draw.text((x, y), header, fill=text_gray, font=normal_font)
+    if not incremental:
+        for header, x in zip(headers, header_positions):
+            draw.text((x, y), header, fill=text_gray, font=normal_font)
     y += 35
     
-    # Draw table border and separator
-    # Top border
-    draw.line([40, y - 5, width - 40, y - 5], fill=border_color, width=2)
-    # Bottom border of header
-    draw.line([40, y + 30, width - 40, y + 30], fill=border_color, width=2)
+    if not incremental:
+        # Draw table border and separator
+        # Top border
+        draw.line([40, y - 5, width - 40, y - 5], fill=border_color, width=2)
+        # Bottom border of header
+        draw.line([40, y + 30, width - 40, y + 30], fill=border_color, width=2)
     y += 40
     
     # Draw writer stats with consistent spacing
-    for i, writer in enumerate(writer_stats["writers"]):
+    medals = load_medals()
+    row_keys = []
+    rows_drawn = 0
+    for i, writer in enumerate(rows):
         row_y = y + (row_height + row_spacing) * i
         
+        # A row is redrawn when anything shown in it differs from the previous image at this position
+        movement = movements[i] if movements else None
+        row_key = (writer["name"], writer["articles"], writer["views"], writer["avg_views"],
+                   tuple(sorted(movement.items())) if movement else None)
+        row_keys.append(row_key)
+        if incremental:
+            if previous.row_keys[i] == row_key:
+                continue
+            # Clear the row and the spacing below it
+            draw.rectangle([0, row_y, width, row_y + row_height + row_spacing - 1], fill='white')
+        rows_drawn += 1
+        
         # Draw alternating row background
         if i % 2 == 1:
             draw.rectangle([40, row_y, width - 40, row_y + row_height], fill=row_alt_bg)
@@ -257,25 +659,45 @@ def generate_report_image(writer_stats, start_date=None, end_date=None):
         # Center text vertically within row (using approximate font height)
         text_y = row_y + (row_height - 30) // 2  # 30 is approximate height for 24px font
         
-        # Draw writer stats with improved alignment
-        text = f"{i+1}. {writer['name']}"
-        draw.text((40, text_y), text, fill='black', font=normal_font)
+        # Top three get a medal sprite and the next ranks a badge instead of their rank number
+        if i < len(medals):
+            medal = medals[i]
+            img.paste(medal, (40, row_y + (row_height - medal.height) // 2), medal)
+            draw.text((40 + medal.width + 8, text_y), writer['name'], fill='black', font=normal_font)
+        else:
+            text = f"{i+1}. {writer['name']}"
+            draw.text((40, text_y), text, fill='black', font=normal_font)
         
         # Draw stats with proper alignment
         draw.text((400, text_y), str(writer["articles"]), fill='black', font=normal_font)
         draw.text((600, text_y), f"{writer['views']:,}", fill='black', font=normal_font)
         draw.text((780, text_y), str(writer["avg_views"]), fill='black', font=normal_font)
-    
-    # Convert to bytes with maximum quality
-    img_bytes = io.BytesIO()
-    # Debug logging before save
-    print(f"Final image size before save: {img.size[0]}x{img.size[1]}")
-    print(f"Image mode: {img.mode}")
+        
+        if movement:
+            growth_x = 600 + normal_font.getbbox(f"{writer['views']:,}")[2] + 8
+            draw_movement(draw, movement, row_y, row_height, growth_x, small_font, (up_green, down_red, header_blue))
     
     # Verify final dimensions before saving
     if img.size != (width, total_height):
         raise ValueError(f"Image dimensions changed during processing. Expected {width}x{total_height}, got {img.size[0]}x{img.size[1]}")
     
+    rendered = RenderedReport(img, header_key, card_key, row_keys)
+    rendered.rows_drawn = rows_drawn
+    return img, rendered
+
+# Last drawn PNG report per period, reused by the next export of that period
+report_images = RenderCache(REPORT_IMAGE_CACHE_BYTES)
+
+def generate_report_image(writer_stats, start_date=None, end_date=None):
+    # Take the cached image so no other request draws on it while this one does
+    cache_key = (start_date, end_date)
+    started = time.perf_counter()
+    img, rendered = draw_report_image(writer_stats, start_date, end_date, previous=report_images.take(cache_key))
+    drawn = time.perf_counter()
+    
+    # Convert to bytes with maximum quality
+    img_bytes = io.BytesIO()
+    
     # Save with maximum quality and no compression
     img.save(
         img_bytes,
@@ -286,29 +708,357 @@ def generate_report_image(writer_stats, start_date=None, end_date=None):
         compress_level=0
     )
     img_bytes.seek(0)
+    report_images.put(cache_key, rendered)
+    log_event(
+        "report_png_rendered",
+        rows=len(rendered.row_keys),
+        rows_drawn=rendered.rows_drawn,
+        width=img.width,
+        height=img.height,
+        draw_ms=round((drawn - started) * 1000, 1),
+        encode_ms=round((time.perf_counter() - drawn) * 1000, 1),
+        bytes=img_bytes.getbuffer().nbytes
+    )
     
     return img_bytes
 
-# Initialize WriterStats
-stats = WriterStats()
+def generate_report_preview(writer_stats, start_date=None, end_date=None, max_rows=10):
+    """Render the header, cards and top rows at half scale as a quick preview."""
+    img = draw_report_image(writer_stats, start_date, end_date, max_rows=max_rows)[0].reduce(2)
+    
+    img_bytes = io.BytesIO()
+    img.save(img_bytes, format='PNG', compress_level=1)
+    img_bytes.seek(0)
+    
+    return img_bytes
 
-@app.route('/writers', methods=['GET'])
+def draw_movement(draw, movement, row_y, row_height, growth_x, font, colors):
+    """Draw a row's rank change (▲/▼ or NEW) and its views growth."""
+    up_color, down_color, new_color = colors
+    mid_y = row_y + row_height // 2
+    text_y = mid_y - 9
+    change = movement["rank_change"]
+    
+    # Triangles are drawn as shapes since the fallback fonts have no arrow glyphs
+    if movement["is_new"]:
+        draw.text((330, text_y), "NEW", fill=new_color, font=font)
+    elif change > 0:
+        draw.polygon([(330, mid_y + 6), (344, mid_y + 6), (337, mid_y - 6)], fill=up_color)
+        draw.text((348, text_y), str(change), fill=up_color, font=font)
+    elif change < 0:
+        draw.polygon([(330, mid_y - 6), (344, mid_y - 6), (337, mid_y + 6)], fill=down_color)
+        draw.text((348, text_y), str(-change), fill=down_color, font=font)
+    
+    growth = movement["views_growth"]
+    if growth is not None:
+        draw.text((growth_x, text_y), f"{growth:+d}%", fill=up_color if growth >= 0 else down_color, font=font)
+
+def add_movements(tenant, writer_stats, start_date, sort=DEFAULT_SORT):
+    """Annotate report rows with movement against the previous snapshot."""
+    if not start_date:
+        return writer_stats
+    previous = tenant.snapshots.previous(start_date)
+    if previous is None:
+        return writer_stats
+    if sort != DEFAULT_SORT:
+        # Snapshots are ranked by the default ordering; compare like with like
+        previous = rerank(previous, SORT_KEYS[sort])
+    
+    current = freeze_rows(writer_stats["writers"])
+    total_views = sum(r[3] for r in current)
+    previous_views = sum(r[3] for r in previous)
+    return {
+        **writer_stats,
+        "movements": compare_snapshots(current, previous),
+        "views_growth": round((total_views - previous_views) * 100 / previous_views) if previous_views > 0 else None
+    }
+
+def build_report_stats(tenant, start_date, compare=True, sort=DEFAULT_SORT):
+    writer_stats = {
+        "writers": tenant.stats.get_writer_stats(sort)
+    }
+    if compare:
+        writer_stats = add_movements(tenant, writer_stats, start_date, sort)
+    return writer_stats
+
+def report_renderers():
+    """Map each available export format to its mimetype and render function."""
+    renderers = {
+        "png": ("image/png", generate_report_image),
+        "svg": ("image/svg+xml", generate_report_svg)
+    }
+    try:
+        # reportlab is only imported once a PDF is first asked for
+        from report_pdf import generate_report_pdf
+    except ImportError:
+        pass
+    else:
+        renderers["pdf"] = ("application/pdf", generate_report_pdf)
+    return renderers
+
+def freeze_closed_periods(tenant, today=None):
+    """Freeze a tenant's standard periods that closed yesterday.
+
+    A snapshot holds the leaderboard as it is when it is frozen, so periods
+    that closed earlier are left to POST /snapshots rather than frozen with
+    later numbers.
+    """
+    today = today or date.today()
+    frozen = []
+    for start_date, end_date in standard_periods(today):
+        if date.fromisoformat(end_date) != today - timedelta(days=1):
+            continue
+        try:
+            frozen.append(tenant.snapshots.freeze(tenant.stats.get_writer_stats(), start_date, end_date))
+        except FileExistsError:
+            pass
+    return frozen
+
+def pregenerate_reports(tenant, today=None, fmt="png"):
+    """Render and store a tenant's reports for the standard periods that have closed."""
+    _, render = report_renderers()[fmt]
+    generated = []
+    for start_date, end_date in standard_periods(today):
+        writer_stats = build_report_stats(tenant, start_date)
+        data_fingerprint = fingerprint(writer_stats, start_date, end_date, fmt)
+        key = f"{period_key(start_date, end_date)}.{fmt}"
+        if tenant.artifacts.lookup(key, data_fingerprint) is None:
+            report = render(writer_stats, start_date, end_date)
+            tenant.artifacts.store(key, report.getvalue(), data_fingerprint, start_date, end_date, fmt)
+            generated.append(key)
+    return generated
+
+def pregenerate_all_reports(today=None):
+    generated = []
+    for key in known_tenants():
+        tenant = tenants.acquire(key)
+        try:
+            for period in freeze_closed_periods(tenant, today):
+                log_event("snapshot_frozen", tenant=key, period=period)
+            generated += [f"{key}/{report}" for report in pregenerate_reports(tenant, today)]
+        finally:
+            tenants.release(key)
+    return generated
+
+def run_report_scheduler():
+    while True:
+        try:
+            pregenerate_all_reports()
+        except Exception as e:
+            log_event("report_pregeneration_failed", logging.ERROR, exc_info=True)
+        # Wake up shortly after the next week or month closes
+        delay = (next_period_close() - datetime.now()).total_seconds() + 60
+        time.sleep(max(delay, 60))
+
+export_lane = AdmissionLane("export", EXPORT_CONCURRENCY, EXPORT_QUEUE_SIZE, EXPORT_QUEUE_TIMEOUT)
+read_lane = AdmissionLane("read", READ_CONCURRENCY, READ_QUEUE_SIZE, READ_QUEUE_TIMEOUT)
+stream_lane = AdmissionLane("stream", STREAM_CONCURRENCY, 0, 0)
+
+# Tenants (and their WriterStats) are loaded on first use
+tenants = TenantRegistry(
+    Tenant, max_tenants=TENANT_CACHE_SIZE, memory_budget=TENANT_MEMORY_BUDGET, tenant_budget=TENANT_MEMORY_LIMIT
+)
+
+_scheduler_started = False
+_scheduler_lock = threading.Lock()
+
+def start_report_scheduler():
+    """Start the pre-render thread in this process, once.
+
+    This runs on a worker's first request, not at import: under
+    `gunicorn --preload` the import happens in the master, whose store never
+    sees the workers' edits, and workers would be forked while the thread
+    held the font or render-cache locks.
+    """
+    global _scheduler_started
+    with _scheduler_lock:
+        if not _scheduler_started:
+            threading.Thread(target=run_report_scheduler, name="report-scheduler", daemon=True).start()
+            _scheduler_started = True
+
+@api.cli.command("pregenerate-reports")
+def pregenerate_reports_command():
+    """Freeze the periods that closed yesterday and render every tenant's
+    reports for the last closed week and month (run from cron)."""
+    for key in pregenerate_all_reports():
+        print(f"Generated report {key}")
+
+@api.before_request
+def start_scheduler_in_worker():
+    if REPORT_SCHEDULER and not _scheduler_started:
+        start_report_scheduler()
+
+@api.before_request
+def load_tenant():
+    key = request.environ.get('writer_reports.tenant') or request.headers.get('X-Tenant') or DEFAULT_TENANT
+    try:
+        g.tenant = tenants.acquire(key)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+@api.teardown_request
+def release_tenant(exc):
+    # Streamed responses are iterated after this, so a stream does not keep its tenant loaded
+    tenant = g.pop('tenant', None)
+    if tenant is not None:
+        tenants.release(tenant.key)
+
+@api.app_errorhandler(Overloaded)
+def overloaded(e):
+    response = jsonify({"error": str(e), "retry_after": e.retry_after})
+    response.status_code = 503
+    response.headers['Retry-After'] = str(e.retry_after)
+    return response
+
+@api.route('/admission', methods=['GET'])
+def admission_status():
+    """Queue depth and rejection counts of the admission lanes."""
+    return jsonify({lane.name: lane.status() for lane in (export_lane, read_lane, stream_lane)})
+
+def negotiate_encoding(size):
+    if size < COMPRESS_MIN_SIZE:
+        return "identity"
+    accepted = request.accept_encodings
+    if brotli is not None and accepted.quality("br") > 0:
+        return "br"
+    if accepted.quality("gzip") > 0:
+        return "gzip"
+    return "identity"
+
+def encode_body(body, encoding):
+    if encoding == "br":
+        return brotli.compress(body, quality=9)
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=9)
+    return body
+
+def cached_response(tenant, name, version, build, mimetype='application/json'):
+    """Serve the body returned by `build()`, compressed to match the client's
+    Accept-Encoding.
+
+    `build` returns `(version, body_bytes)`. The encoded bytes are reused for
+    every request until the version changes. Building and compressing take a
+    per-(name, encoding) lock, and the cache is checked again once it is
+    held, so concurrent pollers of the same version cost a single
+    serialization and compression.
+    """
+    def cached(encoding, make):
+        key = (name, encoding)
+        with tenant.encoded_bodies_lock:
+            entry = tenant.encoded_bodies.get(key)
+            if entry is not None and entry[0] == version:
+                return entry
+            build_lock = tenant.encoded_build_locks.setdefault(key, threading.Lock())
+        with build_lock:
+            with tenant.encoded_bodies_lock:
+                entry = tenant.encoded_bodies.get(key)
+            if entry is None or entry[0] != version:
+                entry = make()
+                with tenant.encoded_bodies_lock:
+                    tenant.encoded_bodies[key] = entry
+            return entry
+
+    identity = cached("identity", build)
+    # `build` may report a newer version than asked for; the encodings follow it
+    version = identity[0]
+    body = identity[1]
+    encoding = negotiate_encoding(len(body))
+    if encoding != "identity":
+        body = cached(encoding, lambda: (version, encode_body(identity[1], encoding)))[1]
+
+    response = Response(body, mimetype=mimetype)
+    response.vary.add('Accept-Encoding')
+    if encoding != "identity":
+        response.headers['Content-Encoding'] = encoding
+    response.set_etag(f"{name}-{version}-{encoding}")
+    return response.make_conditional(request)
+
+def sort_argument(value):
+    """Check a `sort` option; returns (sort, None) or (None, error response)."""
+    sort = value or DEFAULT_SORT
+    if sort not in SORT_KEYS:
+        return None, (jsonify({"error": f"Unsupported sort '{sort}', expected one of: {', '.join(SORT_KEYS)}"}), 400)
+    return sort, None
+
+def date_argument(value, name):
+    """Check an optional date option; returns (date string, None) or (None, error response)."""
+    if not value:
+        return None, None
+    try:
+        return date.fromisoformat(value).isoformat(), None
+    except (TypeError, ValueError):
+        return None, (jsonify({"error": f"{name} must be a date as YYYY-MM-DD"}), 400)
+
+def period_arguments(start_value, end_value):
+    """Check the optional `start_date` and `end_date` of a report."""
+    start_date, error = date_argument(start_value, "start_date")
+    if error:
+        return None, None, error
+    end_date, error = date_argument(end_value, "end_date")
+    if error:
+        return None, None, error
+    if start_date and end_date and start_date > end_date:
+        return None, None, (jsonify({"error": "start_date must not be after end_date"}), 400)
+    return start_date, end_date, None
+
+@api.route('/writers', methods=['GET'])
 def get_writers():
-    writer_stats = stats.get_writer_stats()
-    total_articles = sum(w["articles"] for w in writer_stats)
-    total_views = sum(w["views"] for w in writer_stats)
+    stats = g.tenant.stats
+    sort, error = sort_argument(request.args.get('sort'))
+    if error:
+        return error
+
+    def build():
+        version, writer_stats = stats.get_versioned_writer_stats(sort)
+        return version, current_app.json.dumps({
+            "writers": writer_stats,
+            "summary": summarize_writers(writer_stats),
+            "sort": sort,
+            "version": version
+        }).encode()
+
+    with read_lane.admit():
+        return cached_response(g.tenant, f"writers-{sort}", stats.version, build)
+
+@api.route('/writers/changes', methods=['GET'])
+def get_writer_changes():
+    since = request.args.get('since', type=int)
+    if since is None:
+        return jsonify({"error": "since must be an integer version"}), 400
     
-    return jsonify({
-        "writers": writer_stats,
-        "summary": {
-            "total_writers": len(writer_stats),
-            "total_articles": total_articles,
-            "total_views": total_views,
-            "avg_views_per_article": round(total_views / total_articles) if total_articles > 0 else 0
-        }
-    })
+    stats = g.tenant.stats
+    with read_lane.admit():
+        changes = stats.changes_since(since)
+    if changes is None:
+        # The client is too far behind; it has to reload GET /writers
+        return jsonify({"resync": True, "version": stats.version})
+    return jsonify(changes)
+
+@api.route('/writers/search', methods=['GET'])
+def search_writers():
+    query = request.args.get('q', '').strip()
+    if not query:
+        return jsonify({"error": "q is required"}), 400
+    limit = min(max(request.args.get('limit', default=20, type=int), 1), 100)
+    
+    with read_lane.admit():
+        version, writers = g.tenant.stats.search(query, limit)
+    return jsonify({"query": query, "version": version, "writers": writers})
+
+def with_state(body, since, writer_id):
+    """Add the resulting leaderboard delta to a mutation response when the
+    client asks for it with `Prefer: return=representation`."""
+    if 'return=representation' not in request.headers.get('Prefer', ''):
+        return body
+    
+    stats = g.tenant.stats
+    changes = stats.changes_since(since)
+    if changes is None:
+        return {**body, "resync": True, "version": stats.version}
+    rank = next((w["rank"] for w in changes["writers"] if w["id"] == writer_id), None)
+    return {**body, **changes, "rank": rank}
 
-@app.route('/writers', methods=['POST'])
+@api.route('/writers', methods=['POST'])
 def add_writer():
     data = request.get_json()
     name = data.get('name', '').strip()
@@ -316,10 +1066,12 @@ def add_writer():
     if not name:
         return jsonify({"error": "Name is required"}), 400
         
+    stats = g.tenant.stats
+    since = stats.version
     writer_id = stats.add_writer(name)
-    return jsonify({"id": writer_id, "name": name}), 201
+    return jsonify(with_state({"id": writer_id, "name": name}, since, writer_id)), 201
 
-@app.route('/writers/<writer_id>', methods=['PUT'])
+@api.route('/writers/<writer_id>', methods=['PUT'])
 def update_writer_stats(writer_id):
     data = request.get_json()
     articles = data.get('articles', 0)
@@ -328,56 +1080,309 @@ def update_writer_stats(writer_id):
     if not isinstance(articles, int) or not isinstance(views, int):
         return jsonify({"error": "Articles and views must be integers"}), 400
         
+    stats = g.tenant.stats
+    since = stats.version
     stats.update_stats(writer_id, articles, views)
-    return jsonify({"success": True})
+    return jsonify(with_state({"success": True}, since, writer_id))
 
-@app.route('/writers/<writer_id>', methods=['DELETE'])
+@api.route('/writers/<writer_id>', methods=['DELETE'])
 def remove_writer(writer_id):
+    stats = g.tenant.stats
+    since = stats.version
     stats.remove_writer(writer_id)
-    return jsonify({"success": True})
+    return jsonify(with_state({"success": True}, since, writer_id))
+
+@api.route('/writers/batch', methods=['POST'])
+def apply_writer_batch():
+    """Apply several edits in order, in one request and one save.
+
+    Takes {"operations": [...]} where each operation is {"op": "add", "name"},
+    {"op": "update", "id", "articles", "views"} or {"op": "remove", "id"}.
+    A batch with any invalid operation is rejected as a whole. An optional
+    "batch_id" chosen by the client makes resending the batch safe.
+    """
+    data = request.get_json(silent=True) or {}
+    operations = data.get('operations')
+    if not isinstance(operations, list):
+        return jsonify({"error": "operations must be a list"}), 400
+    batch_id = data.get('batch_id')
+    if batch_id is not None and (not isinstance(batch_id, str) or not 0 < len(batch_id) <= 64):
+        return jsonify({"error": "batch_id must be a string of at most 64 characters"}), 400
+
+    checked = []
+    for index, operation in enumerate(operations):
+        op = operation.get('op') if isinstance(operation, dict) else None
+        if op == 'add':
+            name = operation.get('name')
+            if not isinstance(name, str) or not name.strip():
+                return jsonify({"error": f"Operation {index}: name is required"}), 400
+            checked.append({"op": "add", "name": name.strip()})
+        elif op == 'update':
+            articles = operation.get('articles', 0)
+            views = operation.get('views', 0)
+            if not isinstance(operation.get('id'), str):
+                return jsonify({"error": f"Operation {index}: id is required"}), 400
+            if not isinstance(articles, int) or not isinstance(views, int):
+                return jsonify({"error": f"Operation {index}: articles and views must be integers"}), 400
+            checked.append({"op": "update", "id": operation['id'], "articles": articles, "views": views})
+        elif op == 'remove':
+            if not isinstance(operation.get('id'), str):
+                return jsonify({"error": f"Operation {index}: id is required"}), 400
+            checked.append({"op": "remove", "id": operation['id']})
+        else:
+            return jsonify({"error": f"Operation {index}: op must be add, update or remove"}), 400
+
+    stats = g.tenant.stats
+    since = stats.version
+    ids = stats.apply(checked, batch_id)
+    return jsonify(with_state({"ids": ids}, since, None))
+
+def format_event(event, data, event_id=None):
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(data, separators=(',', ':'))}")
+    return "\n".join(lines) + "\n\n"
+
+@api.route('/writers/stream', methods=['GET'])
+def stream_writers():
+    tenant = g.tenant
+    stats = tenant.stats
+    # EventSource sends Last-Event-ID when it reconnects
+    since = request.headers.get('Last-Event-ID', type=int)
+    if since is None:
+        since = request.args.get('since', default=stats.version, type=int)
+
+    # The slot is held until the response is closed, which is when the stream ends
+    slot = stream_lane.admit()
+    slot.__enter__()
+
+    def events():
+        version = since
+        yield "retry: 3000\n\n"
+        while not tenant.closed:
+            stats.wait_for_change(version, STREAM_HEARTBEAT)
+            changes = stats.changes_since(version)
+            if changes is None:
+                version = stats.version
+                yield format_event("resync", {"version": version}, version)
+            elif changes["version"] > version:
+                version = changes["version"]
+                yield format_event("change", changes, version)
+            else:
+                yield ": heartbeat\n\n"
+
+    response = Response(
+        events(),
+        mimetype='text/event-stream',
+        headers={
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no'
+        }
+    )
+    response.call_on_close(lambda: slot.__exit__(None, None, None))
+    return response
+
+@api.route('/snapshots', methods=['GET'])
+def list_snapshots():
+    return jsonify({
+        "snapshots": [{"start_date": start, "end_date": end} for start, end in g.tenant.snapshots.periods()]
+    })
+
+@api.route('/snapshots/previous', methods=['GET'])
+def previous_snapshot():
+    """The snapshot a report starting on `start_date` is compared with, for
+    clients that draw the report themselves. Snapshots never change, so the
+    body is built once and then served from the encoded cache."""
+    start_date, error = date_argument(request.args.get('start_date'), "start_date")
+    if error:
+        return error
+    if not start_date:
+        return jsonify({"error": "start_date is required"}), 400
+    
+    snapshots = g.tenant.snapshots
+    key = snapshots.previous_key(start_date)
+    if key is None:
+        return jsonify({"period": None, "writers": []})
+    
+    def build():
+        return key, current_app.json.dumps({"period": key, "writers": snapshots.load(key)}).encode()
+    
+    return cached_response(g.tenant, "snapshot", key, build)
+
+@api.route('/snapshots', methods=['POST'])
+def create_snapshot():
+    data = request.get_json(silent=True)
+    start_date = (data or {}).get('start_date')
+    end_date = (data or {}).get('end_date')
+    
+    if not start_date or not end_date:
+        return jsonify({"error": "start_date and end_date are required"}), 400
+    # Snapshots can never be replaced, so only freeze well-formed periods
+    try:
+        start, end = date.fromisoformat(start_date), date.fromisoformat(end_date)
+    except (TypeError, ValueError):
+        return jsonify({"error": "start_date and end_date must be dates as YYYY-MM-DD"}), 400
+    if start > end:
+        return jsonify({"error": "start_date must not be after end_date"}), 400
+    start_date, end_date = start.isoformat(), end.isoformat()
+    
+    try:
+        key = g.tenant.snapshots.freeze(g.tenant.stats.get_writer_stats(), start_date, end_date)
+    except FileExistsError:
+        return jsonify({"error": f"Period {period_key(start_date, end_date)} is already frozen"}), 409
+    return jsonify({"period": key}), 201
+
+@api.route('/export/svg', methods=['GET'])
+def export_svg():
+    """Report as an inline SVG for the dashboard; cacheable, unlike POST /export."""
+    start_date, end_date, error = period_arguments(request.args.get('start_date'), request.args.get('end_date'))
+    if error:
+        return error
+    sort, error = sort_argument(request.args.get('sort'))
+    if error:
+        return error
+    with export_lane.admit():
+        writer_stats = build_report_stats(g.tenant, start_date, request.args.get('compare', '1') != '0', sort)
+        version = fingerprint(writer_stats, start_date, end_date, "svg")
+
+        def build():
+            return version, generate_report_svg(writer_stats, start_date, end_date).getvalue()
+
+        return cached_response(g.tenant, "report.svg", version, build, mimetype='image/svg+xml')
+
+@api.route('/export/preview', methods=['GET'])
+def export_preview():
+    start_date, end_date, error = period_arguments(request.args.get('start_date'), request.args.get('end_date'))
+    if error:
+        return error
+    # A preview stays small; more rows would make it a full render
+    max_rows = min(max(request.args.get('rows', default=10, type=int), 0), PREVIEW_MAX_ROWS)
+    sort, error = sort_argument(request.args.get('sort'))
+    if error:
+        return error
+    
+    with export_lane.admit():
+        writer_stats = build_report_stats(g.tenant, start_date, request.args.get('compare', '1') != '0', sort)
+        preview = generate_report_preview(writer_stats, start_date, end_date, max_rows=max_rows)
+    return send_file(
+        preview,
+        mimetype='image/png',
+        etag=fingerprint(writer_stats, start_date, end_date, f"preview-{max_rows}")
+    )
 
-def log_image_info(img):
-    """Debug helper to log image details"""
-    print(f"Image Details:")
-    print(f"Size: {img.size}")
-    print(f"Mode: {img.mode}")
-    print(f"Format: {img.format if hasattr(img, 'format') else 'N/A'}")
-    print(f"Info: {img.info if hasattr(img, 'info') else 'N/A'}")
+@api.route('/export/medals.png', methods=['GET'])
+def export_medals():
+    """The medal sprite atlas, for clients that draw the report themselves."""
+    if not MEDAL_ATLAS.exists():
+        return jsonify({"error": "Medal atlas not found"}), 404
+    return send_file(MEDAL_ATLAS, mimetype='image/png', max_age=86400)
 
-@app.route('/export', methods=['POST', 'OPTIONS'])
+@api.route('/export', methods=['POST', 'OPTIONS'])
 def export_report():
     if request.method == 'OPTIONS':
-        response = app.make_default_options_response()
-        response.headers['Access-Control-Allow-Headers'] = 'Content-Type'
+        response = current_app.make_default_options_response()
+        response.headers['Access-Control-Allow-Headers'] = 'Content-Type, X-Tenant'
         return response
 
     data = request.get_json()
     if not data:
         return jsonify({"error": "No JSON data provided"}), 400
 
-    start_date = data.get('start_date')
-    end_date = data.get('end_date')
+    start_date, end_date, error = period_arguments(data.get('start_date'), data.get('end_date'))
+    if error:
+        return error
+    fmt = data.get('format', 'png')
     
-    writer_stats = {
-        "writers": stats.get_writer_stats()
-    }
+    renderers = report_renderers()
+    if fmt not in renderers:
+        return jsonify({"error": f"Unsupported format '{fmt}', expected one of: {', '.join(renderers)}"}), 400
+    mimetype, render = renderers[fmt]
+    sort, error = sort_argument(data.get('sort'))
+    if error:
+        return error
     
+    started = time.perf_counter()
     try:
-        print("Starting report generation...")
-        img_bytes = generate_report_image(writer_stats, start_date, end_date)
-        print("Report generation completed successfully")
+        writer_stats = build_report_stats(g.tenant, start_date, data.get('compare', True), sort)
+        
+        # Reports for the standard periods are pre-rendered, or kept after the first render
+        report = None
+        is_standard = (start_date, end_date) in standard_periods() and sort == DEFAULT_SORT
+        if is_standard:
+            key = f"{period_key(start_date, end_date)}.{fmt}"
+            data_fingerprint = fingerprint(writer_stats, start_date, end_date, fmt)
+            report = g.tenant.artifacts.lookup(key, data_fingerprint)
+        
+        source = "artifact"
+        if report is None:
+            with export_lane.admit():
+                report = render(writer_stats, start_date, end_date)
+            source = "render"
+            if is_standard:
+                g.tenant.artifacts.store(key, report.getvalue(), data_fingerprint, start_date, end_date, fmt)
         
+        # send_file streams the report to the client in blocks
         response = send_file(
-            img_bytes,
-            mimetype='image/png',
+            report,
+            mimetype=mimetype,
             as_attachment=True,
-            download_name=f'writer_report_{start_date}_to_{end_date}.png'
+            download_name=f'writer_report_{start_date}_to_{end_date}.{fmt}'
         )
         response.headers['Access-Control-Allow-Origin'] = '*'
+        log_event(
+            "report_exported",
+            route="/export",
+            tenant=g.tenant.key,
+            format=fmt,
+            sort=sort,
+            source=source,
+            writers=len(writer_stats["writers"]),
+            duration_ms=round((time.perf_counter() - started) * 1000, 1)
+        )
         return response
-    except Exception as e:
-        print(f"Error generating report: {str(e)}")
+    except Overloaded:
+        raise
+    except Exception:
+        log_event("report_export_failed", logging.ERROR, route="/export", tenant=g.tenant.key, format=fmt, exc_info=True)
         return jsonify({"error": "Failed to generate report"}), 500
 
+def warm_up():
+    """Load what the first requests would otherwise have to: the default
+    tenant's store, name index and leaderboard orderings, Pillow and the
+    report fonts, the medal sprites and the report renderers."""
+    stats = tenants.get(DEFAULT_TENANT).stats
+    stats.names
+    for sort in SORT_KEYS:
+        # Each ordering is sorted on first use; sort them here so workers share them
+        stats.get_writer_stats(sort)
+    load_report_fonts()
+    load_medals()
+    report_renderers()
+    # Keep the collector from writing to (and so copying) objects shared with forked workers
+    gc.collect()
+    gc.freeze()
+
+def create_app(warm=True):
+    """Build the Flask app, by default with its shared state already loaded.
+
+    Serve it with `gunicorn --preload 'app:create_app()'` so the warm-up
+    runs once in the gunicorn master and every worker it forks (including
+    replacements) starts with the parsed store, fonts and renderers in
+    copy-on-write memory instead of loading them itself.
+    """
+    app = Flask(__name__)
+    CORS(app, expose_headers=["Retry-After"])
+    app.register_blueprint(api)
+    # Requests under /t/<tenant>/ are served from that tenant's store
+    app.wsgi_app = TenantPrefixMiddleware(app.wsgi_app)
+    if warm:
+        warm_up()
+    return app
+
+# Module-level app for `gunicorn app:app` and `flask`; state loads on first use
+app = create_app(warm=False)
+
 if __name__ == '__main__':
     app.run(debug=True)
@@ -0,0 +1,93 @@
+import hashlib
+import json
+import os
+import threading
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+def standard_periods(today=None):
+    """Return the report periods that have closed as of `today`: the last full
+    Monday-Sunday week and the last full calendar month, as date strings."""
+    today = today or date.today()
+    week_end = today - timedelta(days=today.weekday() + 1)
+    week_start = week_end - timedelta(days=6)
+    month_end = today.replace(day=1) - timedelta(days=1)
+    month_start = month_end.replace(day=1)
+    return [
+        (week_start.isoformat(), week_end.isoformat()),
+        (month_start.isoformat(), month_end.isoformat())
+    ]
+
+def next_period_close(now=None):
+    """Return when the next standard period closes (the next Monday or 1st of the month)."""
+    now = now or datetime.now()
+    tomorrow = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+    next_monday = tomorrow + timedelta(days=(7 - tomorrow.weekday()) % 7)
+    next_month = (now.replace(day=28) + timedelta(days=4)).replace(day=1)
+    next_month = datetime.combine(next_month, datetime.min.time())
+    return min(next_monday, next_month)
+
+def fingerprint(writer_stats, start_date, end_date, fmt="png"):
+    """Hash everything a rendered report depends on."""
+    payload = json.dumps([writer_stats, start_date, end_date, fmt], sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+class ReportArtifacts:
+    """Pre-rendered reports stored under their content hash.
+
+    manifest.json maps a period key to the artifact file and the fingerprint
+    of the data it was rendered from, so a lookup only hits when the report
+    would come out identical.
+    """
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self.manifest_file = self.directory / "manifest.json"
+        self._lock = threading.Lock()
+
+    def load_manifest(self):
+        if not self.manifest_file.exists():
+            return {}
+        with open(self.manifest_file, 'r') as f:
+            return json.load(f)
+
+    def _write_atomic(self, path, data):
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def lookup(self, key, data_fingerprint):
+        """Return the artifact path for `key` if it matches the fingerprint."""
+        entry = self.load_manifest().get(key)
+        if not entry or entry["fingerprint"] != data_fingerprint:
+            return None
+        path = self.directory / entry["file"]
+        return path.resolve() if path.exists() else None
+
+    def store(self, key, data, data_fingerprint, start_date, end_date, extension="png"):
+        digest = hashlib.sha256(data).hexdigest()
+        filename = f"{digest}.{extension}"
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            path = self.directory / filename
+            if not path.exists():
+                self._write_atomic(path, data)
+
+            manifest = self.load_manifest()
+            replaced = manifest.get(key)
+            manifest[key] = {
+                "file": filename,
+                "fingerprint": data_fingerprint,
+                "start_date": start_date,
+                "end_date": end_date,
+                "size": len(data),
+                "created": datetime.now().isoformat(timespec='seconds')
+            }
+            self._write_atomic(self.manifest_file, json.dumps(manifest, indent=2).encode())
+
+            # Drop the previous artifact unless another period still points at it
+            if replaced and replaced["file"] != filename:
+                if all(entry["file"] != replaced["file"] for entry in manifest.values()):
+                    (self.directory / replaced["file"]).unlink(missing_ok=True)
+        return path
@@ -0,0 +1,86 @@
+"""Draw the medal sprite atlas used by the report renderers.
+
+The atlas is a single row of MEDAL_SIZE x MEDAL_SIZE RGBA sprites: medals for
+ranks 1, 2 and 3, then round rank badges up to LAST_BADGE_RANK. It is committed as assets/medals.png; rerun this script only to
+change the artwork:
+
+    python assets/build_medals.py
+"""
+from pathlib import Path
+
+from PIL import Image, ImageDraw, ImageFont
+
+MEDAL_SIZE = 40
+# Sprites are drawn large and scaled down for smooth edges
+SUPERSAMPLE = 4
+
+MEDALS = [
+    # (face, rim, ribbon)
+    ("#F5C542", "#B8860B", "#2563EB"),
+    ("#D9DEE4", "#8A939E", "#2563EB"),
+    ("#E0955A", "#9A5B2C", "#2563EB"),
+]
+
+# Ranks after the medals get a numbered badge, up to this one
+LAST_BADGE_RANK = 10
+BADGE_FACE = "#DBEAFE"
+BADGE_RIM = "#2563EB"
+
+def load_font(size):
+    try:
+        return ImageFont.truetype("arialbd.ttf", size)
+    except OSError:
+        try:
+            return ImageFont.truetype("DejaVuSans-Bold.ttf", size)
+        except OSError:
+            return ImageFont.load_default()
+
+def draw_medal(rank, face, rim, ribbon):
+    size = MEDAL_SIZE * SUPERSAMPLE
+    sprite = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(sprite)
+
+    # Ribbon tails behind the medal
+    draw.polygon([(size * 0.22, 0), (size * 0.44, 0), (size * 0.58, size * 0.45), (size * 0.36, size * 0.45)], fill=ribbon)
+    draw.polygon([(size * 0.56, 0), (size * 0.78, 0), (size * 0.64, size * 0.45), (size * 0.42, size * 0.45)], fill="#1E40AF")
+
+    # Medal face with a rim
+    box = [size * 0.18, size * 0.3, size * 0.82, size * 0.94]
+    draw.ellipse(box, fill=rim)
+    inset = size * 0.05
+    draw.ellipse([box[0] + inset, box[1] + inset, box[2] - inset, box[3] - inset], fill=face)
+
+    center = ((box[0] + box[2]) / 2, (box[1] + box[3]) / 2)
+    draw.text(center, str(rank), fill=rim, font=load_font(int(size * 0.36)), anchor="mm")
+
+    return sprite.resize((MEDAL_SIZE, MEDAL_SIZE), Image.LANCZOS)
+
+def draw_badge(rank):
+    size = MEDAL_SIZE * SUPERSAMPLE
+    sprite = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(sprite)
+
+    # Same footprint as a medal face, without the ribbon
+    box = [size * 0.14, size * 0.14, size * 0.86, size * 0.86]
+    draw.ellipse(box, fill=BADGE_RIM)
+    inset = size * 0.05
+    draw.ellipse([box[0] + inset, box[1] + inset, box[2] - inset, box[3] - inset], fill=BADGE_FACE)
+
+    # Two-digit ranks need a smaller font to stay inside the rim
+    font = load_font(int(size * (0.36 if rank < 10 else 0.3)))
+    draw.text((size / 2, size / 2), str(rank), fill=BADGE_RIM, font=font, anchor="mm")
+
+    return sprite.resize((MEDAL_SIZE, MEDAL_SIZE), Image.LANCZOS)
+
+def main():
+    sprites = [draw_medal(i + 1, *colors) for i, colors in enumerate(MEDALS)]
+    sprites += [draw_badge(rank) for rank in range(len(MEDALS) + 1, LAST_BADGE_RANK + 1)]
+    atlas = Image.new("RGBA", (MEDAL_SIZE * len(sprites), MEDAL_SIZE), (0, 0, 0, 0))
+    for i, sprite in enumerate(sprites):
+        atlas.paste(sprite, (i * MEDAL_SIZE, 0))
+    path = Path(__file__).with_name("medals.png")
+    atlas.save(path, optimize=True)
+    print(f"Saved {path}")
+
+if __name__ == "__main__":
+    main()
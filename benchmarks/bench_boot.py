@@ -0,0 +1,137 @@
+"""Measure gunicorn boot: time to the first response and memory per worker.
+
+Run from the repository root (Linux, needs gunicorn installed):
+
+    python benchmarks/bench_boot.py --writers 20000
+    python benchmarks/bench_boot.py --writers 20000 --preload --app "app:create_app()"
+
+Each run starts gunicorn in a temporary directory with a synthetic
+writer_stats.json and reports, as JSON, the seconds until the first
+GET /writers and the first report preview (which needs Pillow and the
+fonts) succeed, and each process's RSS and PSS (shared pages split
+between the processes that map them). It then kills the workers and
+times how long the master takes to have a replacement serving again.
+"""
+import argparse
+import http.client
+import json
+import os
+import random
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from loadtest import REPO_ROOT, free_port, seed_stats
+
+def request(port, method, path, body=None):
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=60)
+    headers = {"Content-Type": "application/json"} if body is not None else {}
+    conn.request(method, path, body=json.dumps(body) if body is not None else None, headers=headers)
+    response = conn.getresponse()
+    response.read()
+    conn.close()
+    return response.status
+
+def wait_for(port, deadline):
+    while time.monotonic() < deadline:
+        try:
+            if request(port, "GET", "/writers") == 200:
+                return
+        except OSError:
+            pass
+        time.sleep(0.01)
+    raise RuntimeError("no response before the deadline")
+
+def memory_kb(pid):
+    """Return (rss, pss) of a process in KiB."""
+    values = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            name, _, rest = line.partition(":")
+            if name in ("Rss", "Pss"):
+                values[name] = int(rest.split()[0])
+    return values["Rss"], values["Pss"]
+
+def children(pid):
+    found = []
+    for entry in os.listdir("/proc"):
+        if entry.isdigit():
+            try:
+                with open(f"/proc/{entry}/stat") as f:
+                    # The parent pid follows the parenthesised command name
+                    if int(f.read().rsplit(")", 1)[1].split()[1]) == pid:
+                        found.append(int(entry))
+            except (OSError, IndexError, ValueError):
+                continue
+    return sorted(found)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--app", default="app:app", help="gunicorn app spec")
+    parser.add_argument("--preload", action="store_true", help="load the app in the master before forking")
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--writers", type=int, default=20000, help="writers in the seeded store")
+    parser.add_argument("--repo", default=str(REPO_ROOT), help="checkout to run, e.g. an older worktree")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        seed_stats(Path(workdir) / "writer_stats.json", args.writers, random.Random(1))
+        port = free_port()
+        command = [
+            sys.executable, "-m", "gunicorn",
+            "--chdir", workdir,
+            "--pythonpath", args.repo,
+            "--bind", f"127.0.0.1:{port}",
+            "--workers", str(args.workers),
+            "--worker-class", "gthread",
+            "--threads", "4",
+            "--log-level", "warning",
+        ]
+        if args.preload:
+            command.append("--preload")
+        command.append(args.app)
+
+        start = time.monotonic()
+        server = subprocess.Popen(command, stdout=subprocess.DEVNULL)
+        try:
+            wait_for(port, start + 120)
+            first_response = time.monotonic() - start
+            status = request(port, "GET", "/export/preview?start_date=2024-12-01&end_date=2024-12-31")
+            first_preview = time.monotonic() - start
+            # Touch every worker so each has served a read
+            for _ in range(args.workers * 4):
+                request(port, "GET", "/writers")
+
+            master_rss, master_pss = memory_kb(server.pid)
+            workers = [dict(zip(("pid", "rss_kb", "pss_kb"), (pid, *memory_kb(pid)))) for pid in children(server.pid)]
+
+            killed = time.monotonic()
+            for worker in workers:
+                os.kill(worker["pid"], signal.SIGKILL)
+            # Wait for the old workers to be gone before timing their replacements
+            while set(children(server.pid)) & {w["pid"] for w in workers}:
+                time.sleep(0.01)
+            wait_for(port, killed + 120)
+            respawn = time.monotonic() - killed
+        finally:
+            server.terminate()
+            server.wait(timeout=30)
+
+    print(json.dumps({
+        "app": args.app,
+        "preload": args.preload,
+        "writers": args.writers,
+        "first_response_seconds": round(first_response, 3),
+        "first_preview_seconds": round(first_preview, 3),
+        "preview_status": status,
+        "respawn_seconds": round(respawn, 3),
+        "master": {"rss_kb": master_rss, "pss_kb": master_pss},
+        "workers": workers,
+        "total_pss_kb": master_pss + sum(w["pss_kb"] for w in workers)
+    }, indent=2))
+
+if __name__ == "__main__":
+    main()
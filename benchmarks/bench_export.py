@@ -0,0 +1,48 @@
+"""Compare PNG and PDF report size and render time for growing rosters.
+
+Run from the repository root:
+
+    python benchmarks/bench_export.py 100 1000 5000
+"""
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+# The renderer logs font fallbacks and every render; keep them out of the results
+os.environ.setdefault("LOG_LEVEL", "ERROR")
+
+from app import generate_report_image
+from report_pdf import generate_report_pdf
+
+def synthetic_stats(count):
+    writers = []
+    for i in range(count):
+        articles = (i * 7) % 40 + 1
+        views = (i * 7919) % 250000
+        writers.append({
+            "id": str(i + 1),
+            "name": f"Writer {i + 1}",
+            "articles": articles,
+            "views": views,
+            "avg_views": round(views / articles)
+        })
+    writers.sort(key=lambda w: (w["articles"], w["views"]), reverse=True)
+    return {"writers": writers}
+
+def measure(render, writer_stats):
+    start = time.perf_counter()
+    size = len(render(writer_stats, "2024-12-23", "2024-12-29").getvalue())
+    return size, time.perf_counter() - start
+
+def main(sizes):
+    print(f"{'writers':>8} {'png KB':>10} {'png ms':>9} {'pdf KB':>8} {'pdf ms':>8}")
+    for count in sizes:
+        writer_stats = synthetic_stats(count)
+        png_size, png_time = measure(generate_report_image, writer_stats)
+        pdf_size, pdf_time = measure(generate_report_pdf, writer_stats)
+        print(f"{count:>8} {png_size / 1024:>10.0f} {png_time * 1000:>9.0f} {pdf_size / 1024:>8.0f} {pdf_time * 1000:>8.0f}")
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [100, 1000, 5000])
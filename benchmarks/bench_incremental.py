@@ -0,0 +1,57 @@
+"""Compare a full PNG report draw with an incremental redraw after some
+writers' stats change.
+
+Run from the repository root:
+
+    python benchmarks/bench_incremental.py 2000
+
+For each share of updated writers the roster is re-ranked, so rows that
+moved count as changed too. Timings cover drawing only; the PNG encode
+that follows costs the same either way. Every incremental image is checked
+pixel for pixel against a full draw.
+"""
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+# The renderer logs font fallbacks and every render; keep them out of the results
+os.environ.setdefault("LOG_LEVEL", "ERROR")
+
+from PIL import ImageChops
+
+from app import draw_report_image
+from bench_export import synthetic_stats
+
+START, END = "2024-12-01", "2024-12-31"
+
+def update_writers(writer_stats, share, rng):
+    writers = [dict(w) for w in writer_stats["writers"]]
+    for w in rng.sample(writers, round(len(writers) * share)):
+        w["views"] += rng.randint(1, 500)
+        w["avg_views"] = round(w["views"] / w["articles"])
+    writers.sort(key=lambda w: (w["articles"], w["views"]), reverse=True)
+    return {"writers": writers}
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+def main(count):
+    rng = random.Random(1)
+    base = synthetic_stats(count)
+    print(f"{'updated':>8} {'rows redrawn':>13} {'full ms':>8} {'incr ms':>8} {'speedup':>8}")
+    for share in [0, 0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0]:
+        changed = update_writers(base, share, rng)
+        (_, previous), _ = timed(lambda: draw_report_image(base, START, END))
+        (full, _), full_time = timed(lambda: draw_report_image(changed, START, END))
+        (incremental, rendered), incr_time = timed(lambda: draw_report_image(changed, START, END, previous=previous))
+        if ImageChops.difference(full, incremental).getbbox() is not None:
+            raise AssertionError(f"incremental image differs from full render at {share:.1%} updated")
+        print(f"{share:>8.1%} {rendered.rows_drawn:>13} {full_time * 1000:>8.0f} {incr_time * 1000:>8.0f} {full_time / incr_time:>7.1f}x")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,70 @@
+"""Compare opening the writer store from JSON and from the binary format.
+
+Run from the repository root (Linux):
+
+    python benchmarks/bench_statsfile.py 1000000
+
+A synthetic store is written in both formats. Each format is then opened
+in a fresh process, which reports the seconds to open the store, the
+seconds until the first ranked list is ready (what GET /writers needs),
+and the process's RSS after each step.
+"""
+import json
+import random
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from loadtest import REPO_ROOT, seed_stats
+
+sys.path.insert(0, str(REPO_ROOT))
+
+from statsfile import convert
+
+MEASURE = """
+import json, sys, time
+sys.path.insert(0, {repo!r})
+from app import WriterStats
+
+def rss_mb():
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) // 1024
+
+baseline = rss_mb()
+start = time.perf_counter()
+stats = WriterStats({path!r}, write_delay=0)
+opened = time.perf_counter() - start
+open_rss = rss_mb()
+stats.get_writer_stats()
+ranked = time.perf_counter() - start
+print(json.dumps({{
+    "open_seconds": round(opened, 3),
+    "open_rss_mb": open_rss - baseline,
+    "first_ranking_seconds": round(ranked, 3),
+    "ranking_rss_mb": rss_mb() - baseline
+}}))
+"""
+
+def measure(path):
+    output = subprocess.run(
+        [sys.executable, "-c", MEASURE.format(repo=str(REPO_ROOT), path=str(path))],
+        cwd=path.parent, check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def main(count):
+    with tempfile.TemporaryDirectory() as workdir:
+        json_path = Path(workdir) / "writer_stats.json"
+        bin_path = Path(workdir) / "writer_stats.bin"
+        seed_stats(json_path, count, random.Random(1))
+        convert(json_path, bin_path)
+        results = {"writers": count}
+        for name, path in (("json", json_path), ("binary", bin_path)):
+            results[name] = {"file_mb": round(path.stat().st_size / 2**20, 1), **measure(path)}
+    print(json.dumps(results, indent=2))
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
@@ -0,0 +1,227 @@
+"""Replay a weighted mix of API calls against a local gunicorn and report
+throughput, latency percentiles and error rates as JSON.
+
+Run from the repository root (needs gunicorn installed):
+
+    python benchmarks/loadtest.py --writers 2000 --rate 50 --duration 30
+    python benchmarks/loadtest.py --mix get=80,put=10,post=5,export=5 --threads 16
+
+The app runs in a temporary directory seeded with a synthetic
+writer_stats.json, so the real data file is never touched. Requests are
+sent on a fixed schedule (open loop) and latency is measured from the
+scheduled send time, so a slow server shows up as latency rather than as
+a lower request rate.
+"""
+import argparse
+import http.client
+import json
+import os
+import queue
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+DEFAULT_MIX = "get=70,put=15,post=5,export=10"
+
+def seed_stats(path, count, rng):
+    writers = []
+    stats = {}
+    for i in range(count):
+        writer_id = str(i + 1)
+        writers.append({"id": writer_id, "name": f"Writer {i + 1}"})
+        stats[writer_id] = {"articles": rng.randint(0, 40), "views": rng.randint(0, 250000)}
+    with open(path, 'w') as f:
+        json.dump({"writers": writers, "stats": stats}, f)
+
+def parse_mix(text):
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        if name not in ("get", "put", "post", "export"):
+            raise ValueError(f"Unknown call '{name}' in mix")
+        mix[name] = float(weight)
+    return mix
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def start_server(workdir, port, threads, env):
+    command = [
+        sys.executable, "-m", "gunicorn",
+        "--chdir", str(workdir),
+        "--pythonpath", str(REPO_ROOT),
+        "--bind", f"127.0.0.1:{port}",
+        "--worker-class", "gthread",
+        "--threads", str(threads),
+        "--log-level", "warning",
+        # The same preloaded app factory as render.yaml
+        "--preload",
+        "app:create_app()",
+    ]
+    server = subprocess.Popen(command, env=env, stdout=subprocess.DEVNULL)
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError("gunicorn exited during startup")
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+            conn.request("GET", "/admission")
+            conn.getresponse().read()
+            conn.close()
+            return server
+        except OSError:
+            time.sleep(0.1)
+    server.terminate()
+    raise RuntimeError("gunicorn did not start within 30 seconds")
+
+def build_request(call, rng, writer_count):
+    if call == "get":
+        return "GET", "/writers", None
+    if call == "put":
+        articles = rng.randint(0, 40)
+        body = {"articles": articles, "views": articles * rng.randint(0, 10000)}
+        return "PUT", f"/writers/{rng.randint(1, writer_count)}", body
+    if call == "post":
+        return "POST", "/writers", {"name": f"Load {rng.getrandbits(32):08x}"}
+    return "POST", "/export", {"start_date": "2024-12-01", "end_date": "2024-12-31"}
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return round(sorted_values[index] * 1000, 2)
+
+def summarize(samples, elapsed):
+    latencies = sorted(s["latency"] for s in samples)
+    statuses = {}
+    for s in samples:
+        statuses[str(s["status"])] = statuses.get(str(s["status"]), 0) + 1
+    errors = sum(1 for s in samples if not (200 <= s["status"] < 400))
+    return {
+        "requests": len(samples),
+        "throughput_rps": round(len(samples) / elapsed, 2) if elapsed else 0,
+        "error_rate": round(errors / len(samples), 4) if samples else 0,
+        "status": statuses,
+        "latency_ms": {
+            "p50": percentile(latencies, 50),
+            "p90": percentile(latencies, 90),
+            "p99": percentile(latencies, 99),
+            "max": percentile(latencies, 100)
+        }
+    }
+
+def run_load(port, mix, rate, duration, concurrency, writer_count, seed):
+    """Send requests at `rate` per second for `duration` seconds."""
+    jobs = queue.Queue()
+    samples = []
+    samples_lock = threading.Lock()
+    calls = list(mix)
+    weights = [mix[c] for c in calls]
+
+    def client():
+        rng = random.Random(seed + threading.get_ident())
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=120)
+        while True:
+            job = jobs.get()
+            if job is None:
+                break
+            call, scheduled = job
+            method, path, body = build_request(call, rng, writer_count)
+            headers = {"Content-Type": "application/json"} if body is not None else {}
+            try:
+                conn.request(method, path, body=json.dumps(body) if body is not None else None, headers=headers)
+                response = conn.getresponse()
+                response.read()
+                status = response.status
+                if response.getheader("Connection", "").lower() == "close":
+                    conn.close()
+            except (OSError, http.client.HTTPException):
+                # Count the failure and reconnect for the next request
+                status = 0
+                conn.close()
+            finished = time.monotonic()
+            with samples_lock:
+                samples.append({"call": call, "status": status, "latency": finished - scheduled})
+        conn.close()
+
+    clients = [threading.Thread(target=client, daemon=True) for _ in range(concurrency)]
+    for t in clients:
+        t.start()
+
+    rng = random.Random(seed)
+    start = time.monotonic()
+    total = int(rate * duration)
+    for i in range(total):
+        scheduled = start + i / rate
+        delay = scheduled - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        jobs.put((rng.choices(calls, weights)[0], scheduled))
+    for _ in clients:
+        jobs.put(None)
+    for t in clients:
+        t.join()
+    elapsed = time.monotonic() - start
+
+    report = {"overall": summarize(samples, elapsed), "calls": {}}
+    for call in calls:
+        report["calls"][call] = summarize([s for s in samples if s["call"] == call], elapsed)
+    return report
+
+def fetch_json(port, path):
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+    conn.request("GET", path)
+    data = json.loads(conn.getresponse().read())
+    conn.close()
+    return data
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--writers", type=int, default=1000, help="writers in the seeded store")
+    parser.add_argument("--rate", type=float, default=20, help="requests per second")
+    parser.add_argument("--duration", type=float, default=20, help="seconds to send requests for")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"call weights (default {DEFAULT_MIX})")
+    parser.add_argument("--concurrency", type=int, default=32, help="client connections")
+    parser.add_argument("--threads", type=int, default=8, help="gunicorn threads")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="also write the JSON report to this file")
+    args = parser.parse_args()
+
+    mix = parse_mix(args.mix)
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory() as workdir:
+        seed_stats(Path(workdir) / "writer_stats.json", args.writers, rng)
+        port = free_port()
+        server = start_server(workdir, port, args.threads, dict(os.environ))
+        try:
+            report = run_load(port, mix, args.rate, args.duration, args.concurrency, args.writers, args.seed)
+            report["admission"] = fetch_json(port, "/admission")
+        finally:
+            server.terminate()
+            server.wait(timeout=30)
+
+    report["config"] = {
+        "writers": args.writers,
+        "rate": args.rate,
+        "duration": args.duration,
+        "mix": mix,
+        "concurrency": args.concurrency,
+        "threads": args.threads
+    }
+    output = json.dumps(report, indent=2)
+    print(output)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output)
+
+if __name__ == "__main__":
+    main()
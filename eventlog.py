@@ -0,0 +1,110 @@
+"""Structured log events, written off the request path.
+
+log_event() puts a record on an in-memory queue and returns; a listener
+thread formats each record as one JSON line and writes it to stderr. A
+request thread therefore never waits on a slow log consumer. If the queue
+is full, events are dropped and the count is attached to the next event
+that gets through.
+
+LOG_LEVEL sets the lowest level logged (default INFO). LOG_SAMPLE_RATE
+keeps that share of the sampled events (default 1, all of them).
+Warnings and errors are never sampled.
+"""
+import atexit
+import json
+import logging
+import os
+import queue
+import random
+import sys
+import traceback
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+
+LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO").upper()
+LOG_SAMPLE_RATE = float(os.environ.get("LOG_SAMPLE_RATE", "1"))
+# Events held for the listener before new ones are dropped
+LOG_QUEUE_SIZE = int(os.environ.get("LOG_QUEUE_SIZE", "10000"))
+
+logger = logging.getLogger("writer_reports")
+logger.setLevel(LOG_LEVEL)
+# Events go to our own handler only, not to whatever the root logger prints
+logger.propagate = False
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record):
+        event = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "event": record.msg,
+            **getattr(record, "fields", {})
+        }
+        if record.exc_text:
+            event["error"] = record.exc_text
+        return json.dumps(event, default=str)
+
+class DroppingQueueHandler(QueueHandler):
+    """Queue records as they are, dropping them when the queue is full."""
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record):
+        # Formatting happens on the listener; only a traceback has to be captured now
+        if record.exc_info:
+            record.exc_text = "".join(traceback.format_exception(*record.exc_info)).rstrip()
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record):
+        if self.dropped:
+            record.fields = {**getattr(record, "fields", {}), "dropped_events": self.dropped}
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+        else:
+            self.dropped = 0
+
+_handler = DroppingQueueHandler(queue.Queue(LOG_QUEUE_SIZE))
+logger.addHandler(_handler)
+_listener = None
+
+def start():
+    """Start the listener thread for this process."""
+    global _listener
+    output = logging.StreamHandler(sys.stderr)
+    output.setFormatter(JsonFormatter())
+    _listener = QueueListener(_handler.queue, output)
+    _listener.start()
+
+def stop():
+    """Write out the queued events and stop the listener."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+def _restart_after_fork():
+    # A forked worker has the parent's queue but not its listener thread
+    global _listener
+    _handler.queue = queue.Queue(LOG_QUEUE_SIZE)
+    _handler.dropped = 0
+    start()
+
+def log_event(event, level=logging.INFO, sample=True, exc_info=False, **fields):
+    """Log `event` with `fields` as a structured record.
+
+    Returns at once when the level is disabled or the event is sampled
+    out, so calls on hot paths cost a comparison or two.
+    """
+    if not logger.isEnabledFor(level):
+        return
+    if sample and level < logging.WARNING and LOG_SAMPLE_RATE < 1 and random.random() >= LOG_SAMPLE_RATE:
+        return
+    logger.log(level, event, exc_info=exc_info, extra={"fields": fields})
+
+start()
+os.register_at_fork(after_in_child=_restart_after_fork)
+atexit.register(stop)
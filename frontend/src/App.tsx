@@ -1,73 +1,98 @@
-import React, { useState, useEffect } from 'react';
+import React, { memo, useCallback, useState, useEffect, useRef } from 'react';
 import axios from 'axios';
 import config from './config';
 import { PlusIcon, ArrowDownTrayIcon } from '@heroicons/react/24/outline';
+import Leaderboard from './Leaderboard';
+import { canDrawReport, loadMedals, renderReport } from './reportCanvas';
+import { MutationResult, PreviousSnapshot, RankedWriter, SearchResult, Summary, Writer, WriterData, WriterDelta } from './types';
 
 // Main application component for Writer Reports
 // This will trigger the initial deployment to create gh-pages branch
 
-interface Writer {
-  id: string;
-  name: string;
-  articles: number;
-  views: number;
-  avg_views: number;
-}
+const returnState = { headers: { Prefer: 'return=representation' } };
+// How often to poll /writers/changes when the server refuses a stream
+const POLL_INTERVAL = 5000;
 
-interface Summary {
-  total_writers: number;
-  total_articles: number;
-  total_views: number;
-  avg_views_per_article: number;
-}
+const applyDelta = (current: WriterData, delta: WriterDelta): WriterData => {
+  // Skip deltas we already have, or that start after our version
+  if (delta.since > current.version || delta.version <= current.version) {
+    return current;
+  }
 
-interface WriterData {
-  writers: Writer[];
-  summary: Summary;
-}
+  const changedIds = new Set(delta.removed);
+  delta.writers.forEach((writer) => changedIds.add(writer.id));
+  const writers = current.writers.filter((writer) => !changedIds.has(writer.id));
 
-function App() {
-  const [data, setData] = useState<WriterData | null>(null);
-  const [newWriterName, setNewWriterName] = useState('');
-  const [isAddingWriter, setIsAddingWriter] = useState(false);
-  const [isUpdatingWriter, setIsUpdatingWriter] = useState(false);
-  const [selectedWriter, setSelectedWriter] = useState<Writer | null>(null);
-  const [updateArticles, setUpdateArticles] = useState('');
-  const [updateViews, setUpdateViews] = useState('');
+  // Unchanged writers keep their relative order, so inserting the changed ones
+  // at their new ranks (lowest first) reproduces the server's ordering
+  const ranked = delta.writers.slice().sort((a, b) => a.rank - b.rank);
+  ranked.forEach(({ rank, ...writer }) => {
+    writers.splice(rank - 1, 0, writer);
+  });
+
+  return { writers, summary: delta.summary, version: delta.version };
+};
+
+// Each panel below keeps its own form state, so typing in one does not
+// re-render the leaderboard
+
+const SummaryCards = memo(({ summary }: { summary: Summary }) => (
+  <div className="grid grid-cols-1 gap-5 sm:grid-cols-4 mb-8">
+    {[
+      { label: 'Total Writers', value: summary.total_writers },
+      { label: 'Total Articles', value: summary.total_articles },
+      { label: 'Total Views', value: summary.total_views.toLocaleString() },
+      { label: 'Avg Views/Article', value: summary.avg_views_per_article },
+    ].map((stat) => (
+      <div key={stat.label} className="bg-white overflow-hidden shadow rounded-lg">
+        <div className="px-4 py-5 sm:p-6">
+          <dt className="text-sm font-medium text-gray-500 truncate">{stat.label}</dt>
+          <dd className="mt-1 text-3xl font-semibold text-gray-900">{stat.value}</dd>
+        </div>
+      </div>
+    ))}
+  </div>
+));
+
+const ExportPanel = ({ getData }: { getData: () => WriterData | null }) => {
   const [startDate, setStartDate] = useState('');
   const [endDate, setEndDate] = useState('');
+  const [reportPreview, setReportPreview] = useState<{ url: string; full: boolean } | null>(null);
+  const reportUrlRef = useRef<string | null>(null);
 
-  useEffect(() => {
-    fetchData();
-  }, []);
+  const showReport = (blob: Blob, full: boolean) => {
+    if (reportUrlRef.current) window.URL.revokeObjectURL(reportUrlRef.current);
+    const url = window.URL.createObjectURL(blob);
+    reportUrlRef.current = url;
+    setReportPreview({ url, full });
+    return url;
+  };
 
-  const fetchData = async () => {
-    try {
-      const response = await axios.get<WriterData>(`${config.apiUrl}/writers`);
-      setData(response.data);
-    } catch (error) {
-      console.error('Error fetching data:', error);
-    }
+  const closeReport = () => {
+    if (reportUrlRef.current) window.URL.revokeObjectURL(reportUrlRef.current);
+    reportUrlRef.current = null;
+    setReportPreview(null);
   };
 
-  const addWriter = async () => {
-    try {
-      await axios.post(`${config.apiUrl}/writers`, { name: newWriterName });
-      setNewWriterName('');
-      setIsAddingWriter(false);
-      fetchData();
-    } catch (error) {
-      console.error('Error adding writer:', error);
-    }
+  const downloadReport = (url: string) => {
+    const link = document.createElement('a');
+    link.href = url;
+    link.setAttribute('download', 'writer-report.png');
+    document.body.appendChild(link);
+    link.click();
+    document.body.removeChild(link);
   };
 
-  const updateStats = async (writerId: string, articles: number, views: number) => {
-    try {
-      await axios.put(`${config.apiUrl}/writers/${writerId}`, { articles, views });
-      fetchData();
-    } catch (error) {
-      console.error('Error updating stats:', error);
-    }
+  // Draw the report here from the leaderboard we already hold; the server
+  // is only asked for the snapshot to compare with, which it caches
+  const drawReportLocally = async (data: WriterData) => {
+    const [previous, medals] = await Promise.all([
+      axios.get<PreviousSnapshot>(`${config.apiUrl}/snapshots/previous`, { params: { start_date: startDate } }),
+      loadMedals(`${config.apiUrl}/export/medals.png`)
+    ]);
+    const snapshot = previous.data.period ? previous.data.writers : null;
+    const report = await renderReport(data.writers, data.summary, startDate, endDate, snapshot, medals);
+    downloadReport(showReport(report, true));
   };
 
   const exportReport = async () => {
@@ -76,6 +101,28 @@ function App() {
       return;
     }
 
+    const data = getData();
+    if (data && canDrawReport(data.writers.length)) {
+      try {
+        await drawReportLocally(data);
+        return;
+      } catch (error) {
+        console.error('Error drawing report, rendering it on the server instead:', error);
+      }
+    }
+
+    // Show a quick low-resolution preview while the full report renders
+    let fullReportShown = false;
+    axios
+      .get(`${config.apiUrl}/export/preview`, {
+        params: { start_date: startDate, end_date: endDate },
+        responseType: 'blob'
+      })
+      .then((response) => {
+        if (!fullReportShown) showReport(response.data, false);
+      })
+      .catch((error) => console.error('Error loading report preview:', error));
+
     try {
       const response = await axios.post(
         `${config.apiUrl}/export`,
@@ -86,32 +133,349 @@ function App() {
         { responseType: 'blob' }
       );
       
-      const url = window.URL.createObjectURL(new Blob([response.data]));
-      const link = document.createElement('a');
-      link.href = url;
-      link.setAttribute('download', 'writer-report.png');
-      document.body.appendChild(link);
-      link.click();
-      document.body.removeChild(link);
+      fullReportShown = true;
+      downloadReport(showReport(response.data, true));
     } catch (error) {
+      if (axios.isAxiosError(error) && error.response?.status === 503) {
+        // The server is shedding load; tell the user when to try again
+        const retryAfter = error.response.headers['retry-after'] || 'a few';
+        alert(`The server is busy rendering other reports. Please try again in ${retryAfter} seconds.`);
+        return;
+      }
       console.error('Error exporting report:', error);
     }
   };
 
-  const deleteWriter = async (writerId: string) => {
-    if (window.confirm('Are you sure you want to delete this writer?')) {
+  return (
+    <>
+      <div className="bg-white p-4 rounded-lg shadow space-y-4">
+        <div className="grid grid-cols-1 sm:grid-cols-2 gap-4">
+          <div className="space-y-2">
+            <label className="block text-sm font-medium text-gray-700">Start Date</label>
+            <input
+              type="date"
+              value={startDate}
+              onChange={(e) => setStartDate(e.target.value)}
+              className="w-full px-3 py-2 border border-gray-300 rounded-md shadow-sm text-sm"
+            />
+          </div>
+          <div className="space-y-2">
+            <label className="block text-sm font-medium text-gray-700">End Date</label>
+            <input
+              type="date"
+              value={endDate}
+              onChange={(e) => setEndDate(e.target.value)}
+              className="w-full px-3 py-2 border border-gray-300 rounded-md shadow-sm text-sm"
+            />
+          </div>
+        </div>
+        <button
+          onClick={exportReport}
+          disabled={!startDate || !endDate}
+          className="w-full sm:w-auto inline-flex items-center justify-center px-4 py-2 border border-transparent rounded-md shadow-sm text-sm font-medium text-white bg-green-600 hover:bg-green-700 disabled:opacity-50 disabled:cursor-not-allowed"
+        >
+          <ArrowDownTrayIcon className="-ml-1 mr-2 h-5 w-5" />
+          Export Report
+        </button>
+      </div>
+
+      {reportPreview && (
+        <div className="bg-white p-4 rounded-lg shadow space-y-2">
+          <div className="flex justify-between items-center">
+            <h2 className="text-sm font-medium text-gray-700">
+              {reportPreview.full ? 'Report' : 'Preview – rendering full report...'}
+            </h2>
+            <button onClick={closeReport} className="text-sm text-gray-500 hover:text-gray-700">
+              Close
+            </button>
+          </div>
+          <img src={reportPreview.url} alt="Writer report" className="w-full border border-gray-200 rounded" />
+        </div>
+      )}
+    </>
+  );
+};
+
+const WriterSearch = ({ dataVersion, onResults }: { dataVersion: number; onResults: (writers: RankedWriter[] | null) => void }) => {
+  const [searchQuery, setSearchQuery] = useState('');
+  const [noMatches, setNoMatches] = useState(false);
+
+  useEffect(() => {
+    const query = searchQuery.trim();
+    if (!query) {
+      setNoMatches(false);
+      onResults(null);
+      return;
+    }
+
+    // Search on the server once typing pauses, and again when the roster changes
+    let cancelled = false;
+    const timer = setTimeout(async () => {
+      try {
+        const response = await axios.get<SearchResult>(`${config.apiUrl}/writers/search`, { params: { q: query } });
+        if (cancelled) return;
+        setNoMatches(response.data.writers.length === 0);
+        onResults(response.data.writers);
+      } catch (error) {
+        console.error('Error searching writers:', error);
+      }
+    }, 200);
+
+    return () => {
+      cancelled = true;
+      clearTimeout(timer);
+    };
+  }, [searchQuery, dataVersion, onResults]);
+
+  return (
+    <div className="mb-4">
+      <input
+        type="search"
+        value={searchQuery}
+        onChange={(e) => setSearchQuery(e.target.value)}
+        placeholder="Search writers by name"
+        className="w-full px-3 py-2 border border-gray-300 rounded-md shadow-sm text-sm"
+      />
+      {noMatches && searchQuery.trim() && (
+        <p className="mt-2 text-sm text-gray-500">No writers match "{searchQuery.trim()}".</p>
+      )}
+    </div>
+  );
+};
+
+const UpdateWriterDialog = ({ writer, onUpdate, onClose }: {
+  writer: Writer;
+  onUpdate: (writerId: string, articles: number, views: number) => void;
+  onClose: () => void;
+}) => {
+  const [updateArticles, setUpdateArticles] = useState(writer.articles.toString());
+  const [updateViews, setUpdateViews] = useState(writer.views.toString());
+
+  return (
+    <div className="fixed inset-0 bg-gray-500 bg-opacity-75 flex items-center justify-center p-4 z-50">
+      <div className="bg-white rounded-lg p-4 sm:p-6 max-w-sm w-full mx-4 sm:mx-auto">
+        <h3 className="text-lg font-medium text-gray-900 mb-4">Update Writer Stats</h3>
+        <div className="space-y-4">
+          <div>
+            <label htmlFor="articles" className="block text-sm font-medium text-gray-700 mb-1">
+              Articles
+            </label>
+            <input
+              type="number"
+              id="articles"
+              value={updateArticles}
+              onChange={(e) => setUpdateArticles(e.target.value)}
+              className="w-full px-3 py-2 border border-gray-300 rounded-md shadow-sm text-sm focus:outline-none focus:ring-blue-500 focus:border-blue-500"
+            />
+          </div>
+          <div>
+            <label htmlFor="views" className="block text-sm font-medium text-gray-700 mb-1">
+              Views
+            </label>
+            <input
+              type="number"
+              id="views"
+              value={updateViews}
+              onChange={(e) => setUpdateViews(e.target.value)}
+              className="w-full px-3 py-2 border border-gray-300 rounded-md shadow-sm text-sm focus:outline-none focus:ring-blue-500 focus:border-blue-500"
+            />
+          </div>
+        </div>
+        <div className="mt-4 flex flex-col sm:flex-row justify-end space-y-2 sm:space-y-0 sm:space-x-3">
+          <button
+            onClick={onClose}
+            className="w-full sm:w-auto px-4 py-2 text-sm font-medium text-gray-700 bg-white border border-gray-300 rounded-md hover:bg-gray-50"
+          >
+            Cancel
+          </button>
+          <button
+            onClick={() => {
+              onUpdate(writer.id, parseInt(updateArticles), parseInt(updateViews));
+              onClose();
+            }}
+            className="w-full sm:w-auto px-4 py-2 text-sm font-medium text-white bg-blue-600 border border-transparent rounded-md hover:bg-blue-700"
+          >
+            Update
+          </button>
+        </div>
+      </div>
+    </div>
+  );
+};
+
+const AddWriterDialog = ({ onAdd, onClose }: { onAdd: (name: string) => Promise<boolean>; onClose: () => void }) => {
+  const [newWriterName, setNewWriterName] = useState('');
+
+  return (
+    <div className="fixed inset-0 bg-gray-500 bg-opacity-75 flex items-center justify-center p-4">
+      <div className="bg-white rounded-lg p-6 max-w-sm w-full mx-auto">
+        <h3 className="text-lg font-medium text-gray-900 mb-4">Add New Writer</h3>
+        <input
+          type="text"
+          value={newWriterName}
+          onChange={(e) => setNewWriterName(e.target.value)}
+          placeholder="Writer name"
+          className="w-full px-3 py-2 border border-gray-300 rounded-md shadow-sm focus:outline-none focus:ring-blue-500 focus:border-blue-500 text-base"
+        />
+        <div className="mt-4 flex justify-end space-x-3">
+          <button
+            onClick={onClose}
+            className="px-4 py-2 text-sm font-medium text-gray-700 bg-white border border-gray-300 rounded-md hover:bg-gray-50"
+          >
+            Cancel
+          </button>
+          <button
+            onClick={async () => {
+              if (await onAdd(newWriterName)) onClose();
+            }}
+            disabled={!newWriterName.trim()}
+            className="px-4 py-2 text-sm font-medium text-white bg-blue-600 border border-transparent rounded-md hover:bg-blue-700 disabled:opacity-50"
+          >
+            Add
+          </button>
+        </div>
+      </div>
+    </div>
+  );
+};
+
+function App() {
+  const [data, setData] = useState<WriterData | null>(null);
+  const [isAddingWriter, setIsAddingWriter] = useState(false);
+  const [selectedWriter, setSelectedWriter] = useState<Writer | null>(null);
+  const [searchResults, setSearchResults] = useState<RankedWriter[] | null>(null);
+  // The latest data for callbacks that must stay stable across renders
+  const dataRef = useRef<WriterData | null>(null);
+  dataRef.current = data;
+
+  const fetchData = useCallback(async () => {
+    try {
+      const response = await axios.get<WriterData>(`${config.apiUrl}/writers`);
+      setData(response.data);
+      return response.data;
+    } catch (error) {
+      console.error('Error fetching data:', error);
+      return null;
+    }
+  }, []);
+
+  useEffect(() => {
+    let source: EventSource | null = null;
+    let pollTimer: ReturnType<typeof setInterval> | null = null;
+    let cancelled = false;
+
+    const pollChanges = async () => {
+      const current = dataRef.current;
+      if (!current) return;
       try {
-        await axios.delete(`${config.apiUrl}/writers/${writerId}`);
+        const response = await axios.get<MutationResult>(`${config.apiUrl}/writers/changes`, {
+          params: { since: current.version }
+        });
+        if (cancelled) return;
+        if (response.data.resync) {
+          fetchData();
+        } else {
+          setData((latest) => (latest ? applyDelta(latest, response.data) : latest));
+        }
+      } catch (error) {
+        console.error('Error polling changes:', error);
+      }
+    };
+
+    fetchData().then((loaded) => {
+      if (!loaded || cancelled) return;
+
+      // Keep the leaderboard live by applying pushed deltas in place
+      source = new EventSource(`${config.apiUrl}/writers/stream?since=${loaded.version}`);
+      source.addEventListener('change', (event) => {
+        const delta: WriterDelta = JSON.parse((event as MessageEvent).data);
+        setData((current) => (current ? applyDelta(current, delta) : current));
+      });
+      source.addEventListener('resync', () => {
         fetchData();
+      });
+      source.onerror = () => {
+        // EventSource gives up on a refused stream (the server caps open streams
+        // with a 503), so poll for changes instead
+        if (source?.readyState === EventSource.CLOSED && !pollTimer && !cancelled) {
+          pollTimer = setInterval(pollChanges, POLL_INTERVAL);
+        }
+      };
+    });
+
+    return () => {
+      cancelled = true;
+      source?.close();
+      if (pollTimer) clearInterval(pollTimer);
+    };
+  }, [fetchData]);
+
+  const applyResult = useCallback(async (result: MutationResult) => {
+    const current = dataRef.current;
+    if (!current || result.resync) {
+      fetchData();
+      return;
+    }
+    if (result.since <= current.version) {
+      setData((latest) => (latest ? applyDelta(latest, result) : latest));
+      return;
+    }
+
+    // Other clients changed the roster since our last update; catch up in one request
+    try {
+      const response = await axios.get<MutationResult>(`${config.apiUrl}/writers/changes`, {
+        params: { since: current.version }
+      });
+      if (response.data.resync) {
+        fetchData();
+      } else {
+        setData((latest) => (latest ? applyDelta(latest, response.data) : latest));
+      }
+    } catch (error) {
+      console.error('Error fetching changes:', error);
+    }
+  }, [fetchData]);
+
+  const addWriter = useCallback(async (name: string) => {
+    try {
+      const response = await axios.post<MutationResult>(`${config.apiUrl}/writers`, { name }, returnState);
+      applyResult(response.data);
+      return true;
+    } catch (error) {
+      console.error('Error adding writer:', error);
+      return false;
+    }
+  }, [applyResult]);
+
+  const updateStats = useCallback(async (writerId: string, articles: number, views: number) => {
+    try {
+      const response = await axios.put<MutationResult>(`${config.apiUrl}/writers/${writerId}`, { articles, views }, returnState);
+      applyResult(response.data);
+    } catch (error) {
+      console.error('Error updating stats:', error);
+    }
+  }, [applyResult]);
+
+  const deleteWriter = useCallback(async (writerId: string) => {
+    if (window.confirm('Are you sure you want to delete this writer?')) {
+      try {
+        const response = await axios.delete<MutationResult>(`${config.apiUrl}/writers/${writerId}`, returnState);
+        applyResult(response.data);
       } catch (error) {
         console.error('Error deleting writer:', error);
       }
     }
-  };
+  }, [applyResult]);
+
+  const closeAddWriter = useCallback(() => setIsAddingWriter(false), []);
+  const closeUpdateWriter = useCallback(() => setSelectedWriter(null), []);
+  const getData = useCallback(() => dataRef.current, []);
 
   if (!data) return <div className="flex items-center justify-center min-h-screen">Loading...</div>;
 
-  const { summary, writers } = data;
+  // Writers that did not change keep their object identity through applyDelta,
+  // so the leaderboard only re-renders the rows that did
+  const writers = searchResults ?? data.writers;
 
   return (
     <div className="min-h-screen bg-gray-50 py-8">
@@ -127,235 +491,25 @@ function App() {
               Add Writer
             </button>
           </div>
-          
-          <div className="bg-white p-4 rounded-lg shadow space-y-4">
-            <div className="grid grid-cols-1 sm:grid-cols-2 gap-4">
-              <div className="space-y-2">
-                <label className="block text-sm font-medium text-gray-700">Start Date</label>
-                <input
-                  type="date"
-                  value={startDate}
-                  onChange={(e) => setStartDate(e.target.value)}
-                  className="w-full px-3 py-2 border border-gray-300 rounded-md shadow-sm text-sm"
-                />
-              </div>
-              <div className="space-y-2">
-                <label className="block text-sm font-medium text-gray-700">End Date</label>
-                <input
-                  type="date"
-                  value={endDate}
-                  onChange={(e) => setEndDate(e.target.value)}
-                  className="w-full px-3 py-2 border border-gray-300 rounded-md shadow-sm text-sm"
-                />
-              </div>
-            </div>
-            <button
-              onClick={exportReport}
-              disabled={!startDate || !endDate}
-              className="w-full sm:w-auto inline-flex items-center justify-center px-4 py-2 border border-transparent rounded-md shadow-sm text-sm font-medium text-white bg-green-600 hover:bg-green-700 disabled:opacity-50 disabled:cursor-not-allowed"
-            >
-              <ArrowDownTrayIcon className="-ml-1 mr-2 h-5 w-5" />
-              Export Report
-            </button>
-          </div>
+
+          <ExportPanel getData={getData} />
         </div>
 
         {/* Stats Summary */}
-        <div className="grid grid-cols-1 gap-5 sm:grid-cols-4 mb-8">
-          {[
-            { label: 'Total Writers', value: summary.total_writers },
-            { label: 'Total Articles', value: summary.total_articles },
-            { label: 'Total Views', value: summary.total_views.toLocaleString() },
-            { label: 'Avg Views/Article', value: summary.avg_views_per_article },
-          ].map((stat) => (
-            <div key={stat.label} className="bg-white overflow-hidden shadow rounded-lg">
-              <div className="px-4 py-5 sm:p-6">
-                <dt className="text-sm font-medium text-gray-500 truncate">{stat.label}</dt>
-                <dd className="mt-1 text-3xl font-semibold text-gray-900">{stat.value}</dd>
-              </div>
-            </div>
-          ))}
-        </div>
+        <SummaryCards summary={data.summary} />
 
-        {/* Writers List/Table */}
-        <div className="space-y-4 sm:space-y-0">
-          {/* Mobile View - Card Layout */}
-          <div className="sm:hidden space-y-4">
-            {writers.map((writer, index) => (
-              <div key={writer.id} className="bg-white shadow rounded-lg p-4">
-                <div className="flex justify-between items-start mb-4">
-                  <div className="text-lg font-medium text-gray-900">
-                    {`${index + 1}. ${writer.name}`}
-                  </div>
-                  <div className="flex gap-2">
-                    <button
-                      onClick={() => {
-                        setSelectedWriter(writer);
-                        setUpdateArticles(writer.articles.toString());
-                        setUpdateViews(writer.views.toString());
-                        setIsUpdatingWriter(true);
-                      }}
-                      className="text-blue-600 hover:text-blue-900"
-                    >
-                      Update
-                    </button>
-                    <button
-                      onClick={() => deleteWriter(writer.id)}
-                      className="text-red-600 hover:text-red-900"
-                    >
-                      Delete
-                    </button>
-                  </div>
-                </div>
-                <div className="grid grid-cols-3 gap-4">
-                  <div>
-                    <div className="text-sm font-medium text-gray-500">Articles</div>
-                    <div className="mt-1 text-sm text-gray-900">{writer.articles}</div>
-                  </div>
-                  <div>
-                    <div className="text-sm font-medium text-gray-500">Views</div>
-                    <div className="mt-1 text-sm text-gray-900">{writer.views.toLocaleString()}</div>
-                  </div>
-                  <div>
-                    <div className="text-sm font-medium text-gray-500">Avg Views</div>
-                    <div className="mt-1 text-sm text-gray-900">{writer.avg_views}</div>
-                  </div>
-                </div>
-              </div>
-            ))}
-          </div>
+        <WriterSearch dataVersion={data.version} onResults={setSearchResults} />
 
-          {/* Desktop View - Table Layout */}
-          <div className="hidden sm:block bg-white shadow rounded-lg">
-            <table className="min-w-full divide-y divide-gray-200">
-              <thead className="bg-gray-50">
-                <tr>
-                  <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">Writer</th>
-                  <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">Articles</th>
-                  <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">Views</th>
-                  <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">Avg Views</th>
-                  <th className="px-6 py-3 text-right text-xs font-medium text-gray-500 uppercase tracking-wider">Actions</th>
-                </tr>
-              </thead>
-              <tbody className="divide-y divide-gray-200">
-                {writers.map((writer, index) => (
-                  <tr key={writer.id}>
-                    <td className="px-6 py-4 whitespace-nowrap">
-                      <div className="text-sm font-medium text-gray-900">
-                        {`${index + 1}.`} {writer.name}
-                      </div>
-                    </td>
-                    <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-500">{writer.articles}</td>
-                    <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-500">{writer.views.toLocaleString()}</td>
-                    <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-500">{writer.avg_views}</td>
-                    <td className="px-6 py-4 whitespace-nowrap text-right text-sm font-medium">
-                      <button
-                        onClick={() => {
-                          setSelectedWriter(writer);
-                          setUpdateArticles(writer.articles.toString());
-                          setUpdateViews(writer.views.toString());
-                          setIsUpdatingWriter(true);
-                        }}
-                        className="text-blue-600 hover:text-blue-900 mr-4"
-                      >
-                        Update
-                      </button>
-                      <button
-                        onClick={() => deleteWriter(writer.id)}
-                        className="text-red-600 hover:text-red-900"
-                      >
-                        Delete
-                      </button>
-                    </td>
-                  </tr>
-                ))}
-              </tbody>
-            </table>
-          </div>
-        </div>
+        {/* Writers List/Table */}
+        <Leaderboard writers={writers} onEdit={setSelectedWriter} onDelete={deleteWriter} />
 
         {/* Update Writer Modal */}
-        {isUpdatingWriter && selectedWriter && (
-          <div className="fixed inset-0 bg-gray-500 bg-opacity-75 flex items-center justify-center p-4 z-50">
-            <div className="bg-white rounded-lg p-4 sm:p-6 max-w-sm w-full mx-4 sm:mx-auto">
-              <h3 className="text-lg font-medium text-gray-900 mb-4">Update Writer Stats</h3>
-              <div className="space-y-4">
-                <div>
-                  <label htmlFor="articles" className="block text-sm font-medium text-gray-700 mb-1">
-                    Articles
-                  </label>
-                  <input
-                    type="number"
-                    id="articles"
-                    value={updateArticles}
-                    onChange={(e) => setUpdateArticles(e.target.value)}
-                    className="w-full px-3 py-2 border border-gray-300 rounded-md shadow-sm text-sm focus:outline-none focus:ring-blue-500 focus:border-blue-500"
-                  />
-                </div>
-                <div>
-                  <label htmlFor="views" className="block text-sm font-medium text-gray-700 mb-1">
-                    Views
-                  </label>
-                  <input
-                    type="number"
-                    id="views"
-                    value={updateViews}
-                    onChange={(e) => setUpdateViews(e.target.value)}
-                    className="w-full px-3 py-2 border border-gray-300 rounded-md shadow-sm text-sm focus:outline-none focus:ring-blue-500 focus:border-blue-500"
-                  />
-                </div>
-              </div>
-              <div className="mt-4 flex flex-col sm:flex-row justify-end space-y-2 sm:space-y-0 sm:space-x-3">
-                <button
-                  onClick={() => setIsUpdatingWriter(false)}
-                  className="w-full sm:w-auto px-4 py-2 text-sm font-medium text-gray-700 bg-white border border-gray-300 rounded-md hover:bg-gray-50"
-                >
-                  Cancel
-                </button>
-                <button
-                  onClick={() => {
-                    updateStats(selectedWriter.id, parseInt(updateArticles), parseInt(updateViews));
-                    setIsUpdatingWriter(false);
-                  }}
-                  className="w-full sm:w-auto px-4 py-2 text-sm font-medium text-white bg-blue-600 border border-transparent rounded-md hover:bg-blue-700"
-                >
-                  Update
-                </button>
-              </div>
-            </div>
-          </div>
+        {selectedWriter && (
+          <UpdateWriterDialog writer={selectedWriter} onUpdate={updateStats} onClose={closeUpdateWriter} />
         )}
 
         {/* Add Writer Modal */}
-        {isAddingWriter && (
-          <div className="fixed inset-0 bg-gray-500 bg-opacity-75 flex items-center justify-center p-4">
-            <div className="bg-white rounded-lg p-6 max-w-sm w-full mx-auto">
-              <h3 className="text-lg font-medium text-gray-900 mb-4">Add New Writer</h3>
-              <input
-                type="text"
-                value={newWriterName}
-                onChange={(e) => setNewWriterName(e.target.value)}
-                placeholder="Writer name"
-                className="w-full px-3 py-2 border border-gray-300 rounded-md shadow-sm focus:outline-none focus:ring-blue-500 focus:border-blue-500 text-base"
-              />
-              <div className="mt-4 flex justify-end space-x-3">
-                <button
-                  onClick={() => setIsAddingWriter(false)}
-                  className="px-4 py-2 text-sm font-medium text-gray-700 bg-white border border-gray-300 rounded-md hover:bg-gray-50"
-                >
-                  Cancel
-                </button>
-                <button
-                  onClick={addWriter}
-                  disabled={!newWriterName.trim()}
-                  className="px-4 py-2 text-sm font-medium text-white bg-blue-600 border border-transparent rounded-md hover:bg-blue-700 disabled:opacity-50"
-                >
-                  Add
-                </button>
-              </div>
-            </div>
-          </div>
-        )}
+        {isAddingWriter && <AddWriterDialog onAdd={addWriter} onClose={closeAddWriter} />}
       </div>
     </div>
   );
@@ -0,0 +1,190 @@
+import React, { memo, useCallback, useEffect, useRef, useState } from 'react';
+import { RankedWriter, Writer } from './types';
+
+// Rows rendered above and below the visible part of the list
+const OVERSCAN = 10;
+// Initial row height guesses; the real heights are measured from the first rendered row
+const TABLE_ROW_HEIGHT = 53;
+const CARD_HEIGHT = 136;
+
+interface RowProps {
+  writer: Writer;
+  rank: number;
+  onEdit: (writer: Writer) => void;
+  onDelete: (writerId: string) => void;
+}
+
+interface LeaderboardProps {
+  // Plain writers are ranked by position; search results carry their own rank
+  writers: (Writer | RankedWriter)[];
+  onEdit: (writer: Writer) => void;
+  onDelete: (writerId: string) => void;
+}
+
+/**
+ * Work out which rows of a fixed-height list are on screen, following the
+ * page scroll. Returns the range to render, the row height, and a ref
+ * callback that measures a rendered row so the height stays exact.
+ */
+const useWindowedRange = (container: React.RefObject<HTMLElement>, count: number, initialRowHeight: number) => {
+  const [rowHeight, setRowHeight] = useState(initialRowHeight);
+  const [range, setRange] = useState({ start: 0, end: Math.min(count, OVERSCAN * 4) });
+
+  useEffect(() => {
+    const update = () => {
+      const element = container.current;
+      // Hidden lists (the other layout) have no box to measure
+      if (!element || element.offsetParent === null) return;
+      const top = element.getBoundingClientRect().top;
+      const start = Math.max(0, Math.floor(-top / rowHeight) - OVERSCAN);
+      const end = Math.min(count, Math.ceil((window.innerHeight - top) / rowHeight) + OVERSCAN);
+      setRange((current) => (current.start === start && current.end === end ? current : { start, end }));
+    };
+
+    update();
+    window.addEventListener('scroll', update, { passive: true });
+    window.addEventListener('resize', update);
+    return () => {
+      window.removeEventListener('scroll', update);
+      window.removeEventListener('resize', update);
+    };
+  }, [container, count, rowHeight]);
+
+  const measure = useCallback((element: HTMLElement | null) => {
+    const height = element?.getBoundingClientRect().height;
+    if (height && Math.abs(height - rowHeight) > 0.5) setRowHeight(height);
+  }, [rowHeight]);
+
+  return { start: range.start, end: Math.min(range.end, count), rowHeight, measure };
+};
+
+const rankOf = (writer: Writer | RankedWriter, index: number) => ('rank' in writer ? writer.rank : index + 1);
+
+// Rows only re-render when their writer object, rank or handlers change; the
+// leaderboard keeps unchanged writer objects when applying deltas
+const WriterTableRow = memo(({ writer, rank, onEdit, onDelete, measure }: RowProps & { measure?: (element: HTMLElement | null) => void }) => (
+  <tr ref={measure}>
+    <td className="px-6 py-4 whitespace-nowrap">
+      <div className="text-sm font-medium text-gray-900">
+        {`${rank}.`} {writer.name}
+      </div>
+    </td>
+    <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-500">{writer.articles}</td>
+    <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-500">{writer.views.toLocaleString()}</td>
+    <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-500">{writer.avg_views}</td>
+    <td className="px-6 py-4 whitespace-nowrap text-right text-sm font-medium">
+      <button onClick={() => onEdit(writer)} className="text-blue-600 hover:text-blue-900 mr-4">
+        Update
+      </button>
+      <button onClick={() => onDelete(writer.id)} className="text-red-600 hover:text-red-900">
+        Delete
+      </button>
+    </td>
+  </tr>
+));
+
+const WriterCard = memo(({ writer, rank, onEdit, onDelete, measure }: RowProps & { measure?: (element: HTMLElement | null) => void }) => (
+  // The slot's bottom padding stands in for the gap between cards, so every slot has the same height
+  <div ref={measure} className="pb-4">
+    <div className="bg-white shadow rounded-lg p-4">
+      <div className="flex justify-between items-start mb-4">
+        <div className="text-lg font-medium text-gray-900 truncate">
+          {`${rank}. ${writer.name}`}
+        </div>
+        <div className="flex gap-2">
+          <button onClick={() => onEdit(writer)} className="text-blue-600 hover:text-blue-900">
+            Update
+          </button>
+          <button onClick={() => onDelete(writer.id)} className="text-red-600 hover:text-red-900">
+            Delete
+          </button>
+        </div>
+      </div>
+      <div className="grid grid-cols-3 gap-4">
+        <div>
+          <div className="text-sm font-medium text-gray-500">Articles</div>
+          <div className="mt-1 text-sm text-gray-900">{writer.articles}</div>
+        </div>
+        <div>
+          <div className="text-sm font-medium text-gray-500">Views</div>
+          <div className="mt-1 text-sm text-gray-900">{writer.views.toLocaleString()}</div>
+        </div>
+        <div>
+          <div className="text-sm font-medium text-gray-500">Avg Views</div>
+          <div className="mt-1 text-sm text-gray-900">{writer.avg_views}</div>
+        </div>
+      </div>
+    </div>
+  </div>
+));
+
+const WriterCardList = ({ writers, onEdit, onDelete }: LeaderboardProps) => {
+  const container = useRef<HTMLDivElement>(null);
+  const { start, end, rowHeight, measure } = useWindowedRange(container, writers.length, CARD_HEIGHT);
+
+  return (
+    <div ref={container} className="sm:hidden">
+      <div style={{ height: start * rowHeight }} />
+      {writers.slice(start, end).map((writer, i) => (
+        <WriterCard
+          key={writer.id}
+          writer={writer}
+          rank={rankOf(writer, start + i)}
+          onEdit={onEdit}
+          onDelete={onDelete}
+          measure={i === 0 ? measure : undefined}
+        />
+      ))}
+      <div style={{ height: (writers.length - end) * rowHeight }} />
+    </div>
+  );
+};
+
+const WriterTable = ({ writers, onEdit, onDelete }: LeaderboardProps) => {
+  const body = useRef<HTMLTableSectionElement>(null);
+  const { start, end, rowHeight, measure } = useWindowedRange(body, writers.length, TABLE_ROW_HEIGHT);
+
+  return (
+    <div className="hidden sm:block bg-white shadow rounded-lg">
+      <table className="min-w-full divide-y divide-gray-200">
+        <thead className="bg-gray-50">
+          <tr>
+            <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">Writer</th>
+            <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">Articles</th>
+            <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">Views</th>
+            <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">Avg Views</th>
+            <th className="px-6 py-3 text-right text-xs font-medium text-gray-500 uppercase tracking-wider">Actions</th>
+          </tr>
+        </thead>
+        <tbody ref={body} className="divide-y divide-gray-200">
+          {start > 0 && <tr style={{ height: start * rowHeight }} />}
+          {writers.slice(start, end).map((writer, i) => (
+            <WriterTableRow
+              key={writer.id}
+              writer={writer}
+              rank={rankOf(writer, start + i)}
+              onEdit={onEdit}
+              onDelete={onDelete}
+              measure={i === 0 ? measure : undefined}
+            />
+          ))}
+          {end < writers.length && <tr style={{ height: (writers.length - end) * rowHeight }} />}
+        </tbody>
+      </table>
+    </div>
+  );
+};
+
+/**
+ * The writer list as cards on small screens and a table on larger ones.
+ * Only the rows near the viewport are rendered, so the cost of a render
+ * does not grow with the roster.
+ */
+const Leaderboard = memo(({ writers, onEdit, onDelete }: LeaderboardProps) => (
+  <div className="space-y-4 sm:space-y-0">
+    <WriterCardList writers={writers} onEdit={onEdit} onDelete={onDelete} />
+    <WriterTable writers={writers} onEdit={onEdit} onDelete={onDelete} />
+  </div>
+));
+
+export default Leaderboard;
@@ -2,8 +2,11 @@ interface Config {
   apiUrl: string;
 }
 
+const baseUrl = process.env.REACT_APP_API_URL || 'http://localhost:5000';
+const tenant = process.env.REACT_APP_TENANT;
+
 const config: Config = {
-  apiUrl: process.env.REACT_APP_API_URL || 'http://localhost:5000'
+  apiUrl: tenant ? `${baseUrl}/t/${encodeURIComponent(tenant)}` : baseUrl
 };
 
 export default config;
@@ -0,0 +1,249 @@
+import { SnapshotRecord, Summary, Writer } from './types';
+
+// The PNG report layout, as drawn by draw_report_image() in app.py
+const WIDTH = 1000;
+const HEADER_HEIGHT = 100;
+const CARDS_SECTION_HEIGHT = 250;
+const TABLE_HEADER_HEIGHT = 140;
+const ROW_HEIGHT = 50;
+const ROW_SPACING = 8;
+const CARD_WIDTH = 230;
+const CARD_HEIGHT = 120;
+const CARD_SPACING = 20;
+const CARDS_Y = 120;
+
+const HEADER_BLUE = '#2563EB';
+const TEXT_GRAY = '#374151';
+const ROW_ALT_BG = '#E8EDF5';
+const BORDER_COLOR = '#D1D5DB';
+const UP_GREEN = '#16A34A';
+const DOWN_RED = '#DC2626';
+
+const TITLE_FONT = 'bold 44px Arial, sans-serif';
+const HEADER_FONT = 'bold 32px Arial, sans-serif';
+const NORMAL_FONT = '24px Arial, sans-serif';
+const SMALL_FONT = 'bold 16px Arial, sans-serif';
+
+// Browsers refuse taller canvases; longer reports are left to POST /export
+const MAX_CANVAS_HEIGHT = 32767;
+
+interface Movement {
+  is_new: boolean;
+  rank_change: number;
+  views_growth: number | null;
+}
+
+// Python's round(), which rounds halves to even, so percentages match the server's reports
+const roundHalfEven = (value: number) => {
+  const rounded = Math.round(value);
+  return Math.abs(value % 1) === 0.5 && rounded % 2 !== 0 ? rounded - 1 : rounded;
+};
+
+const signed = (value: number) => `${value >= 0 ? '+' : ''}${value}`;
+
+/**
+ * Work out each writer's movement against the previous snapshot, like
+ * compare_snapshots() on the server. `writers` are in leaderboard order.
+ */
+const compareWithSnapshot = (writers: Writer[], previous: SnapshotRecord[]) => {
+  const before = new Map(previous.map((record): [string, SnapshotRecord] => [record[0], record]));
+  const movements: Movement[] = writers.map((writer, index) => {
+    const record = before.get(writer.id);
+    if (!record) return { is_new: true, rank_change: 0, views_growth: null };
+    const [, , , views, rank] = record;
+    return {
+      is_new: false,
+      rank_change: rank - (index + 1),
+      views_growth: views > 0 ? roundHalfEven(((writer.views - views) * 100) / views) : null
+    };
+  });
+
+  const totalViews = writers.reduce((total, writer) => total + writer.views, 0);
+  const previousViews = previous.reduce((total, record) => total + record[3], 0);
+  const viewsGrowth = previousViews > 0 ? roundHalfEven(((totalViews - previousViews) * 100) / previousViews) : null;
+  return { movements, viewsGrowth };
+};
+
+const reportHeight = (rows: number) =>
+  Math.max(800, HEADER_HEIGHT + CARDS_SECTION_HEIGHT + TABLE_HEADER_HEIGHT + (ROW_HEIGHT + ROW_SPACING) * rows - ROW_SPACING + 40);
+
+export const canDrawReport = (rows: number) => reportHeight(rows) <= MAX_CANVAS_HEIGHT;
+
+// Pillow boxes include both corners, canvas rectangles do not
+const fillBox = (ctx: CanvasRenderingContext2D, x0: number, y0: number, x1: number, y1: number, color: string) => {
+  ctx.fillStyle = color;
+  ctx.fillRect(x0, y0, x1 - x0 + 1, y1 - y0 + 1);
+};
+
+const drawText = (ctx: CanvasRenderingContext2D, x: number, y: number, text: string, color: string, font: string) => {
+  ctx.font = font;
+  ctx.fillStyle = color;
+  ctx.fillText(text, x, y);
+};
+
+const textWidth = (ctx: CanvasRenderingContext2D, text: string, font: string) => {
+  ctx.font = font;
+  return ctx.measureText(text).width;
+};
+
+const drawTriangle = (ctx: CanvasRenderingContext2D, points: [number, number][], color: string) => {
+  ctx.fillStyle = color;
+  ctx.beginPath();
+  points.forEach(([x, y], i) => (i === 0 ? ctx.moveTo(x, y) : ctx.lineTo(x, y)));
+  ctx.closePath();
+  ctx.fill();
+};
+
+const drawMovement = (ctx: CanvasRenderingContext2D, movement: Movement, rowY: number, growthX: number) => {
+  const midY = rowY + ROW_HEIGHT / 2;
+  const textY = midY - 9;
+  const change = movement.rank_change;
+
+  if (movement.is_new) {
+    drawText(ctx, 330, textY, 'NEW', HEADER_BLUE, SMALL_FONT);
+  } else if (change > 0) {
+    drawTriangle(ctx, [[330, midY + 6], [344, midY + 6], [337, midY - 6]], UP_GREEN);
+    drawText(ctx, 348, textY, String(change), UP_GREEN, SMALL_FONT);
+  } else if (change < 0) {
+    drawTriangle(ctx, [[330, midY - 6], [344, midY - 6], [337, midY + 6]], DOWN_RED);
+    drawText(ctx, 348, textY, String(-change), DOWN_RED, SMALL_FONT);
+  }
+
+  const growth = movement.views_growth;
+  if (growth !== null) {
+    drawText(ctx, growthX, textY, `${signed(growth)}%`, growth >= 0 ? UP_GREEN : DOWN_RED, SMALL_FONT);
+  }
+};
+
+/**
+ * Draw the PNG report layout onto `canvas`, resizing it to fit. `previous`
+ * is the snapshot to show movement against, if any, and `medals` the medal
+ * sprite atlas (without it every row gets its rank number, as on the server).
+ */
+export const drawReport = (
+  canvas: HTMLCanvasElement,
+  writers: Writer[],
+  summary: Summary,
+  startDate: string,
+  endDate: string,
+  previous: SnapshotRecord[] | null,
+  medals: HTMLImageElement | null
+) => {
+  canvas.width = WIDTH;
+  canvas.height = reportHeight(writers.length);
+  const ctx = canvas.getContext('2d');
+  if (!ctx) throw new Error('Canvas 2D context is not available');
+  ctx.textBaseline = 'top';
+  fillBox(ctx, 0, 0, canvas.width - 1, canvas.height - 1, 'white');
+
+  // Header
+  fillBox(ctx, 0, 0, WIDTH, HEADER_HEIGHT, HEADER_BLUE);
+  drawText(ctx, 40, 20, 'Writer Reports', 'white', TITLE_FONT);
+  if (startDate && endDate) {
+    drawText(ctx, 40, 65, `${startDate} - ${endDate}`, 'white', HEADER_FONT);
+  }
+
+  const { movements, viewsGrowth } = previous
+    ? compareWithSnapshot(writers, previous)
+    : { movements: null, viewsGrowth: null };
+
+  // Summary cards, centred
+  const stats: [string, string][] = [
+    ['Total Writers', String(summary.total_writers)],
+    ['Total Articles', String(summary.total_articles)],
+    ['Total Views', summary.total_views.toLocaleString('en-US')],
+    ['Avg Views/Article', String(summary.avg_views_per_article)]
+  ];
+  const cardsStartX = Math.floor((WIDTH - (CARD_WIDTH * 4 + CARD_SPACING * 3)) / 2);
+  stats.forEach(([label, value], i) => {
+    const x = cardsStartX + i * (CARD_WIDTH + CARD_SPACING);
+    fillBox(ctx, x + 3, CARDS_Y + 3, x + CARD_WIDTH + 3, CARDS_Y + CARD_HEIGHT + 3, '#E5E7EB');
+    fillBox(ctx, x, CARDS_Y, x + CARD_WIDTH, CARDS_Y + CARD_HEIGHT, 'white');
+    ctx.strokeStyle = BORDER_COLOR;
+    ctx.lineWidth = 2;
+    ctx.strokeRect(x + 1, CARDS_Y + 1, CARD_WIDTH - 1, CARD_HEIGHT - 1);
+    drawText(ctx, x + Math.floor((CARD_WIDTH - textWidth(ctx, value, HEADER_FONT)) / 2), CARDS_Y + 25, value, 'black', HEADER_FONT);
+    drawText(ctx, x + Math.floor((CARD_WIDTH - textWidth(ctx, label, NORMAL_FONT)) / 2), CARDS_Y + 70, label, TEXT_GRAY, NORMAL_FONT);
+
+    if (label === 'Total Views' && viewsGrowth !== null) {
+      const growthText = `${signed(viewsGrowth)}% vs last period`;
+      const growthX = x + Math.floor((CARD_WIDTH - textWidth(ctx, growthText, SMALL_FONT)) / 2);
+      drawText(ctx, growthX, CARDS_Y + 97, growthText, viewsGrowth >= 0 ? UP_GREEN : DOWN_RED, SMALL_FONT);
+    }
+  });
+
+  // Leaderboard heading, column headers and the header borders
+  let y = CARDS_Y + 160;
+  drawText(ctx, 40, y, 'Writer Leaderboard', 'black', HEADER_FONT);
+  y += 60;
+  const headers: [string, number][] = [['Writer', 40], ['Articles', 400], ['Views', 600], ['Avg Views/Article', 780]];
+  headers.forEach(([header, x]) => drawText(ctx, x, y, header, TEXT_GRAY, NORMAL_FONT));
+  y += 35;
+  fillBox(ctx, 40, y - 6, WIDTH - 40, y - 5, BORDER_COLOR);
+  fillBox(ctx, 40, y + 29, WIDTH - 40, y + 30, BORDER_COLOR);
+  y += 40;
+
+  // Rows; the atlas is one row of square sprites, medals then rank badges
+  const medalSize = medals ? medals.naturalHeight : 0;
+  const medalCount = medals && medalSize ? Math.floor(medals.naturalWidth / medalSize) : 0;
+  writers.forEach((writer, i) => {
+    const rowY = y + (ROW_HEIGHT + ROW_SPACING) * i;
+    if (i % 2 === 1) fillBox(ctx, 40, rowY, WIDTH - 40, rowY + ROW_HEIGHT, ROW_ALT_BG);
+    fillBox(ctx, 40, rowY + ROW_HEIGHT, WIDTH - 40, rowY + ROW_HEIGHT, BORDER_COLOR);
+
+    const textY = rowY + (ROW_HEIGHT - 30) / 2;
+    if (medals && i < medalCount) {
+      const medalY = rowY + Math.floor((ROW_HEIGHT - medalSize) / 2);
+      ctx.drawImage(medals, i * medalSize, 0, medalSize, medalSize, 40, medalY, medalSize, medalSize);
+      drawText(ctx, 40 + medalSize + 8, textY, writer.name, 'black', NORMAL_FONT);
+    } else {
+      drawText(ctx, 40, textY, `${i + 1}. ${writer.name}`, 'black', NORMAL_FONT);
+    }
+
+    const views = writer.views.toLocaleString('en-US');
+    drawText(ctx, 400, textY, String(writer.articles), 'black', NORMAL_FONT);
+    drawText(ctx, 600, textY, views, 'black', NORMAL_FONT);
+    drawText(ctx, 780, textY, String(writer.avg_views), 'black', NORMAL_FONT);
+
+    if (movements) {
+      drawMovement(ctx, movements[i], rowY, 600 + textWidth(ctx, views, NORMAL_FONT) + 8);
+    }
+  });
+};
+
+/** Draw the report on a detached canvas and encode it as a PNG. */
+export const renderReport = (
+  writers: Writer[],
+  summary: Summary,
+  startDate: string,
+  endDate: string,
+  previous: SnapshotRecord[] | null,
+  medals: HTMLImageElement | null
+) =>
+  new Promise<Blob>((resolve, reject) => {
+    const canvas = document.createElement('canvas');
+    drawReport(canvas, writers, summary, startDate, endDate, previous, medals);
+    canvas.toBlob((blob) => (blob ? resolve(blob) : reject(new Error('Could not encode the report'))), 'image/png');
+  });
+
+let medalAtlas: Promise<HTMLImageElement | null> | null = null;
+
+/**
+ * Load the medal atlas once. It comes from the API with CORS headers, so
+ * drawing it does not taint the canvas. Resolves to null if it is missing.
+ */
+export const loadMedals = (url: string) => {
+  if (!medalAtlas) {
+    medalAtlas = new Promise((resolve) => {
+      const image = new Image();
+      image.crossOrigin = 'anonymous';
+      image.onload = () => resolve(image);
+      image.onerror = () => {
+        medalAtlas = null;
+        resolve(null);
+      };
+      image.src = url;
+    });
+  }
+  return medalAtlas;
+};
@@ -0,0 +1,54 @@
+export interface Writer {
+  id: string;
+  name: string;
+  articles: number;
+  views: number;
+  avg_views: number;
+}
+
+export interface Summary {
+  total_writers: number;
+  total_articles: number;
+  total_views: number;
+  avg_views_per_article: number;
+}
+
+export interface WriterData {
+  writers: Writer[];
+  summary: Summary;
+  version: number;
+}
+
+export interface RankedWriter extends Writer {
+  rank: number;
+}
+
+// Writers changed between `since` and `version`, as sent by /writers/changes and /writers/stream
+export interface WriterDelta {
+  since: number;
+  version: number;
+  writers: RankedWriter[];
+  removed: string[];
+  summary: Summary;
+}
+
+export interface SearchResult {
+  query: string;
+  version: number;
+  writers: RankedWriter[];
+}
+
+// Mutation responses carry the resulting delta when asked for it
+export interface MutationResult extends WriterDelta {
+  rank: number | null;
+  resync?: boolean;
+}
+
+// Snapshot records are [id, name, articles, views, rank] tuples sorted by id
+export type SnapshotRecord = [string, string, number, number, number];
+
+// The snapshot a report is compared with, from /snapshots/previous
+export interface PreviousSnapshot {
+  period: string | null;
+  writers: SnapshotRecord[];
+}
@@ -1,5 +1,8 @@
 import sys
+import os
 import json
+import atexit
+import threading
 from datetime import datetime, timedelta
 from pathlib import Path
 from functools import partial
@@ -7,106 +10,169 @@ from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                              QHBoxLayout, QPushButton, QLabel, QTableWidget, 
                              QTableWidgetItem, QDialog, QFormLayout, QLineEdit,
                              QSpinBox, QHeaderView, QFrame, QDateEdit)
-from PySide6.QtCore import Qt, QDate, QRect, QDateTime
+from PySide6.QtCore import Qt, QDate, QRect, QDateTime, QTimer
 from PySide6.QtGui import QPixmap, QPainter, QColor, QFont, QPen, QIcon, QLinearGradient, QBrush
+from api_client import RemoteWriterStats
+
+# Seconds to coalesce edits into one write of the data file
+WRITE_DELAY = 1.0
+# Set to the API's URL (e.g. https://writer-reports-api.onrender.com or .../t/<tenant>) to edit the server's data
+API_URL = os.environ.get("WRITER_REPORTS_API")
+# Milliseconds between checks for data synced from the server
+SYNC_CHECK_INTERVAL = 500
 
 class WriterStats:
-    def __init__(self):
+    def __init__(self, write_delay=WRITE_DELAY):
         self.data_file = Path("writer_stats.json")
+        # Seconds to coalesce mutations before writing them out; 0 writes synchronously
+        self.write_delay = write_delay
+        self._lock = threading.RLock()
+        self._write_lock = threading.Lock()
+        self._dirty = False
+        self._save_timer = None
+        self._generation = 0
+        self._written_generation = 0
         self.writers = self.load_data()
+        atexit.register(self.flush)
 
     def load_data(self):
         if self.data_file.exists():
             with open(self.data_file, 'r') as f:
                 data = json.load(f)
-                # Fix any duplicate IDs
-                used_ids = set()
-                next_id = 1
-                fixed_writers = []
-                fixed_stats = {}
-                
-                for writer in data["writers"]:
-                    old_id = writer["id"]
-                    # If ID is already used, assign a new one
-                    while str(next_id) in used_ids:
-                        next_id += 1
-                    new_id = str(next_id)
-                    used_ids.add(new_id)
-                    
-                    # Update writer with new ID
-                    writer["id"] = new_id
-                    fixed_writers.append(writer)
-                    
-                    # Transfer stats to new ID if they exist
-                    if old_id in data["stats"]:
-                        fixed_stats[new_id] = data["stats"][old_id]
-                    else:
-                        fixed_stats[new_id] = {"articles": 0, "views": 0}
-                    
+            # Fix any duplicate IDs
+            used_ids = set()
+            next_id = 1
+            fixed_writers = []
+            fixed_stats = {}
+            
+            for writer in data["writers"]:
+                old_id = writer["id"]
+                # If ID is already used, assign a new one
+                while str(next_id) in used_ids:
                     next_id += 1
+                new_id = str(next_id)
+                used_ids.add(new_id)
                 
-                data["writers"] = fixed_writers
-                data["stats"] = fixed_stats
+                # Update writer with new ID
+                writer["id"] = new_id
+                fixed_writers.append(writer)
                 
-                # Save the fixed data
-                with open(self.data_file, 'w') as f:
-                    json.dump(data, f, indent=2)
+                # Transfer stats to new ID if they exist
+                if old_id in data["stats"]:
+                    fixed_stats[new_id] = data["stats"][old_id]
+                else:
+                    fixed_stats[new_id] = {"articles": 0, "views": 0}
                 
-                return data
+                next_id += 1
+            
+            data["writers"] = fixed_writers
+            data["stats"] = fixed_stats
+            
+            # The file is closed by now, as Windows cannot replace an open file.
+            # Save the fixed data
+            self._write_file(json.dumps(data, indent=2))
+            
+            return data
         return {
             "writers": [],
             "stats": {}
         }
 
     def save_data(self):
-        with open(self.data_file, 'w') as f:
-            json.dump(self.writers, f, indent=2)
+        with self._lock:
+            self._dirty = True
+            if self.write_delay <= 0:
+                self.flush()
+            elif self._save_timer is None:
+                # Later mutations within the delay are picked up by this same write
+                self._save_timer = threading.Timer(self.write_delay, self.flush)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+
+    def flush(self):
+        """Write pending changes to disk, if there are any."""
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if not self._dirty:
+                return
+            payload = json.dumps(self.writers, indent=2)
+            self._dirty = False
+            self._generation += 1
+            generation = self._generation
+        with self._write_lock:
+            # A flush that serialized later may have already reached the disk
+            if generation > self._written_generation:
+                self._write_file(payload)
+                self._written_generation = generation
+
+    def close(self):
+        """Flush pending changes and stop tracking this store for shutdown."""
+        self.flush()
+        atexit.unregister(self.flush)
+
+    def _write_file(self, payload):
+        # Write to a temp file and rename so readers never see a partial file
+        tmp_file = self.data_file.with_name(self.data_file.name + ".tmp")
+        with open(tmp_file, 'w') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.data_file)
 
     def add_writer(self, name):
-        # Get all existing IDs
-        existing_ids = {w["id"] for w in self.writers["writers"]}
-        next_id = 1
-        
-        # Find the next available ID
-        while str(next_id) in existing_ids:
-            next_id += 1
-        
-        new_id = str(next_id)
-        
-        # Add writer with unique ID
-        self.writers["writers"].append({
-            "id": new_id,
-            "name": name
-        })
-        
-        # Initialize stats
-        if "stats" not in self.writers:
-            self.writers["stats"] = {}
-        self.writers["stats"][new_id] = {
-            "articles": 0,
-            "views": 0
-        }
+        with self._lock:
+            # Get all existing IDs
+            existing_ids = {w["id"] for w in self.writers["writers"]}
+            next_id = 1
+        
+            # Find the next available ID
+            while str(next_id) in existing_ids:
+                next_id += 1
+        
+            new_id = str(next_id)
         
-        self.save_data()
-        return new_id
+            # Add writer with unique ID
+            self.writers["writers"].append({
+                "id": new_id,
+                "name": name
+            })
+        
+            # Initialize stats
+            if "stats" not in self.writers:
+                self.writers["stats"] = {}
+            self.writers["stats"][new_id] = {
+                "articles": 0,
+                "views": 0
+            }
+        
+            self.save_data()
+            return new_id
 
     def update_stats(self, writer_id, articles, views):
-        if "stats" not in self.writers:
-            self.writers["stats"] = {}
+        with self._lock:
+            if "stats" not in self.writers:
+                self.writers["stats"] = {}
         
-        self.writers["stats"][writer_id] = {
-            "articles": articles,
-            "views": views
-        }
-        self.save_data()
+            self.writers["stats"][writer_id] = {
+                "articles": articles,
+                "views": views
+            }
+            self.save_data()
 
     def remove_writer(self, writer_id):
-        # Remove writer from writers list
-        self.writers["writers"] = [w for w in self.writers["writers"] if w["id"] != writer_id]
-        # Remove writer's stats
-        if writer_id in self.writers["stats"]:
-            del self.writers["stats"][writer_id]
-        self.save_data()
+        with self._lock:
+            # Remove writer from writers list
+            self.writers["writers"] = [w for w in self.writers["writers"] if w["id"] != writer_id]
+            # Remove writer's stats
+            if writer_id in self.writers["stats"]:
+                del self.writers["stats"][writer_id]
+            self.save_data()
+
+    def get_stats(self, writer_id):
+        with self._lock:
+            return dict(self.writers["stats"].get(writer_id, {"articles": 0, "views": 0}))
 
     def get_writer_stats(self):
         stats = []
@@ -216,11 +282,32 @@ class UpdateStatsDialog(QDialog):
         layout.addRow(buttons)
 
 class MainWindow(QMainWindow):
-    def __init__(self):
+    def __init__(self, stats=None):
         super().__init__()
-        self.stats = WriterStats()
+        self.stats = stats or WriterStats()
         self.setup_ui()
         self.update_table()
+        if isinstance(self.stats, RemoteWriterStats):
+            # Redraw when the background sync has changed the data, and keep the sync status current
+            self.sync_timer = QTimer(self)
+            self.sync_timer.timeout.connect(self.check_sync)
+            self.sync_timer.start(SYNC_CHECK_INTERVAL)
+
+    def check_sync(self):
+        if self.stats.revision != self.shown_revision:
+            self.update_table()
+        pending = self.stats.pending_count
+        if not self.stats.online:
+            status = f"Offline, {pending} edits waiting" if pending else "Offline"
+        else:
+            status = f"Syncing {pending} edits" if pending else "Synced"
+        self.sync_status.setText(status)
+        # The last sync or cache error, if any, shows on hover
+        self.sync_status.setToolTip(self.stats.last_error or "")
+
+    def closeEvent(self, event):
+        self.stats.close()
+        super().closeEvent(event)
 
     def setup_ui(self):
         self.setWindowTitle("Writer Reports")
@@ -351,6 +438,10 @@ class MainWindow(QMainWindow):
         header.addLayout(date_range)
         header.addStretch()
 
+        self.sync_status = QLabel("")
+        self.sync_status.setStyleSheet("color: #666666;")
+        header.addWidget(self.sync_status)
+
         # Buttons
         add_writer_btn = QPushButton("Add Writer")
         add_writer_btn.clicked.connect(self.add_writer)
@@ -424,7 +515,7 @@ class MainWindow(QMainWindow):
                 self.update_table()
 
     def update_writer_stats(self, writer_id, writer_name):
-        current_stats = self.stats.writers["stats"].get(writer_id, {"articles": 0, "views": 0})
+        current_stats = self.stats.get_stats(writer_id)
         dialog = UpdateStatsDialog(writer_name, current_stats, self)
         if dialog.exec():
             articles = dialog.articles_input.value()
@@ -439,6 +530,7 @@ class MainWindow(QMainWindow):
             self.update_table()
 
     def update_table(self):
+        self.shown_revision = getattr(self.stats, "revision", None)
         writer_stats = self.stats.get_writer_stats()
         self.table.setRowCount(len(writer_stats))
         
@@ -670,7 +762,7 @@ class MainWindow(QMainWindow):
 
 def main():
     app = QApplication(sys.argv)
-    window = MainWindow()
+    window = MainWindow(RemoteWriterStats(API_URL) if API_URL else None)
     window.show()
     sys.exit(app.exec())
 
@@ -0,0 +1,32 @@
+import logging
+import threading
+from pathlib import Path
+
+from eventlog import log_event
+
+# One row of square RGBA sprites: medals for ranks 1-3, then rank badges up to
+# rank 10. Drawn by assets/build_medals.py
+MEDAL_ATLAS = Path(__file__).resolve().parent / "assets" / "medals.png"
+
+_sprites = None
+_sprites_lock = threading.Lock()
+
+def load_medals():
+    """Return the medal sprites, slicing the atlas the first time they are needed.
+
+    Returns an empty list if the atlas is missing, so callers fall back to
+    plain rank numbers.
+    """
+    global _sprites
+    with _sprites_lock:
+        if _sprites is None:
+            from PIL import Image
+            try:
+                with Image.open(MEDAL_ATLAS) as atlas:
+                    atlas = atlas.convert("RGBA")
+                    size = atlas.height
+                    _sprites = [atlas.crop((x, 0, x + size, size)) for x in range(0, atlas.width, size)]
+            except OSError as e:
+                log_event("medal_atlas_failed", logging.WARNING, error=str(e))
+                _sprites = []
+        return _sprites
@@ -0,0 +1,120 @@
+import bisect
+import threading
+
+def average_views(articles, views):
+    return round(views / articles) if articles > 0 else 0
+
+# Leaderboard orderings by name. Each maps a writer's (articles, views) to a
+# key that sorts the best writer first; ties keep the roster order.
+SORT_KEYS = {
+    "articles": lambda articles, views: (-articles, -views),
+    "views": lambda articles, views: (-views, -articles),
+    "avg_views": lambda articles, views: (-average_views(articles, views), -views)
+}
+DEFAULT_SORT = "articles"
+
+def make_row(writer_id, name, articles, views):
+    return {
+        "id": writer_id,
+        "name": name,
+        "articles": articles,
+        "views": views,
+        "avg_views": average_views(articles, views)
+    }
+
+class Rankings:
+    """Writers ranked by each ordering in SORT_KEYS.
+
+    Every ordering is a sorted list of (*sort key, roster position, id)
+    entries, built the first time it is asked for. After that each edit
+    moves only the writers it touched, with a bisect per ordering, so
+    reading a leaderboard or a writer's rank never sorts. Totals for the
+    summary are kept the same way.
+
+    Each writer's row dict is built once per edit and handed to every
+    caller, so treat rows as read-only.
+    """
+
+    def __init__(self, writers=()):
+        # id -> (roster position, row)
+        self._writers = {}
+        for position, (writer_id, name, articles, views) in enumerate(writers):
+            self._writers[writer_id] = (position, make_row(writer_id, name, articles, views))
+        self._next_position = len(self._writers)
+        self._orders = {}
+        self._build_lock = threading.Lock()
+        self.total_articles = sum(row["articles"] for _, row in self._writers.values())
+        self.total_views = sum(row["views"] for _, row in self._writers.values())
+
+    def __len__(self):
+        return len(self._writers)
+
+    def __contains__(self, writer_id):
+        return writer_id in self._writers
+
+    def _entry(self, sort, writer_id, writer):
+        position, row = writer
+        return (*SORT_KEYS[sort](row["articles"], row["views"]), position, writer_id)
+
+    def _order(self, sort):
+        order = self._orders.get(sort)
+        if order is None:
+            # Readers share the store's lock, so two of them may ask for a new ordering at once
+            with self._build_lock:
+                order = self._orders.get(sort)
+                if order is None:
+                    order = sorted(self._entry(sort, writer_id, w) for writer_id, w in self._writers.items())
+                    self._orders[sort] = order
+        return order
+
+    def _insert(self, writer_id, writer):
+        self._writers[writer_id] = writer
+        self.total_articles += writer[1]["articles"]
+        self.total_views += writer[1]["views"]
+        for sort, order in self._orders.items():
+            bisect.insort(order, self._entry(sort, writer_id, writer))
+
+    def _delete(self, writer_id):
+        writer = self._writers.pop(writer_id, None)
+        if writer is not None:
+            self.total_articles -= writer[1]["articles"]
+            self.total_views -= writer[1]["views"]
+            for sort, order in self._orders.items():
+                del order[bisect.bisect_left(order, self._entry(sort, writer_id, writer))]
+        return writer
+
+    # The edits below are called with the store's write lock held
+
+    def add(self, writer_id, name, articles=0, views=0):
+        self._delete(writer_id)
+        self._insert(writer_id, (self._next_position, make_row(writer_id, name, articles, views)))
+        self._next_position += 1
+
+    def update(self, writer_id, articles, views):
+        # Stats for an id that is not on the roster are stored but never listed
+        writer = self._delete(writer_id)
+        if writer is not None:
+            self._insert(writer_id, (writer[0], make_row(writer_id, writer[1]["name"], articles, views)))
+
+    def remove(self, writer_id):
+        self._delete(writer_id)
+
+    def row(self, writer_id):
+        return self._writers[writer_id][1]
+
+    def rank(self, writer_id, sort=DEFAULT_SORT):
+        order = self._order(sort)
+        return bisect.bisect_left(order, self._entry(sort, writer_id, self._writers[writer_id])) + 1
+
+    def rows(self, sort=DEFAULT_SORT):
+        """Return every writer's row, best first by `sort`."""
+        writers = self._writers
+        return [writers[entry[-1]][1] for entry in self._order(sort)]
+
+    def summary(self):
+        return {
+            "total_writers": len(self._writers),
+            "total_articles": self.total_articles,
+            "total_views": self.total_views,
+            "avg_views_per_article": average_views(self.total_articles, self.total_views)
+        }
@@ -0,0 +1,42 @@
+import threading
+from collections import OrderedDict
+
+class RenderedReport:
+    """A drawn report image and the fingerprints of what was drawn on it."""
+
+    def __init__(self, image, header_key, card_key, row_keys):
+        self.image = image
+        self.header_key = header_key
+        self.card_key = card_key
+        self.row_keys = row_keys
+        self.rows_drawn = len(row_keys)
+
+    @property
+    def size_bytes(self):
+        return self.image.width * self.image.height * len(self.image.getbands())
+
+class RenderCache:
+    """The last rendered report image per key, within a memory budget.
+
+    A renderer takes the entry out while it draws on the image and encodes
+    it, then puts it back, so two requests never draw on the same image.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def take(self, key):
+        with self._lock:
+            return self._entries.pop(key, None)
+
+    def put(self, key, report):
+        if report.size_bytes > self.max_bytes:
+            return
+        with self._lock:
+            self._entries[key] = report
+            used = sum(r.size_bytes for r in self._entries.values())
+            while used > self.max_bytes:
+                _, old = self._entries.popitem(last=False)
+                used -= old.size_bytes
@@ -0,0 +1,218 @@
+import io
+import threading
+
+from reportlab.lib.colors import HexColor
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.utils import ImageReader
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.pdfgen import canvas
+
+from medals import load_medals
+
+# The PDF uses the PNG report's 1000 unit wide layout, scaled onto A4 pages
+LAYOUT_WIDTH = 1000
+SCALE = A4[0] / LAYOUT_WIDTH
+PAGE_HEIGHT = A4[1] / SCALE
+BOTTOM_MARGIN = 40
+
+# TrueType fonts are embedded as subsets; Helvetica is used when none are found
+FONT_CANDIDATES = [
+    ("C:/Windows/Fonts/arial.ttf", "C:/Windows/Fonts/arialbd.ttf"),
+    ("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"),
+]
+
+_fonts = None
+_fonts_lock = threading.Lock()
+_medal_images = None
+
+def load_fonts():
+    """Register the report fonts once per process and return (regular, bold)."""
+    global _fonts
+    with _fonts_lock:
+        if _fonts is None:
+            _fonts = ("Helvetica", "Helvetica-Bold")
+            for regular_path, bold_path in FONT_CANDIDATES:
+                try:
+                    pdfmetrics.registerFont(TTFont("ReportRegular", regular_path))
+                    pdfmetrics.registerFont(TTFont("ReportBold", bold_path))
+                    _fonts = ("ReportRegular", "ReportBold")
+                    break
+                except Exception:
+                    continue
+        return _fonts
+
+def load_medal_images():
+    """Wrap the medal sprites for reportlab once per process."""
+    global _medal_images
+    if _medal_images is None:
+        _medal_images = [(ImageReader(sprite), sprite.width) for sprite in load_medals()]
+    return _medal_images
+
+class ReportPage:
+    """Draw on a PDF page using the PNG layout's top-left coordinates."""
+
+    def __init__(self, pdf):
+        self.pdf = pdf
+        pdf.saveState()
+        pdf.scale(SCALE, SCALE)
+
+    def text(self, x, y, text, font, size, color):
+        # Pillow positions text by its top edge, PDF by its baseline
+        self.pdf.setFont(font, size)
+        self.pdf.setFillColor(HexColor(color))
+        self.pdf.drawString(x, PAGE_HEIGHT - y - size * 0.8, text)
+
+    def centered_text(self, x, width, y, text, font, size, color):
+        text_width = pdfmetrics.stringWidth(text, font, size)
+        self.text(x + (width - text_width) / 2, y, text, font, size, color)
+
+    def rect(self, x0, y0, x1, y1, fill=None, outline=None, width=1):
+        if fill:
+            self.pdf.setFillColor(HexColor(fill))
+        if outline:
+            self.pdf.setStrokeColor(HexColor(outline))
+            self.pdf.setLineWidth(width)
+        self.pdf.rect(x0, PAGE_HEIGHT - y1, x1 - x0, y1 - y0, stroke=1 if outline else 0, fill=1 if fill else 0)
+
+    def image(self, image, x, y, size):
+        self.pdf.drawImage(image, x, PAGE_HEIGHT - y - size, size, size, mask='auto')
+
+    def line(self, x0, y, x1, color, width=1):
+        self.pdf.setStrokeColor(HexColor(color))
+        self.pdf.setLineWidth(width)
+        self.pdf.line(x0, PAGE_HEIGHT - y, x1, PAGE_HEIGHT - y)
+
+    def triangle(self, points, color):
+        path = self.pdf.beginPath()
+        (x, y), rest = points[0], points[1:]
+        path.moveTo(x, PAGE_HEIGHT - y)
+        for x, y in rest:
+            path.lineTo(x, PAGE_HEIGHT - y)
+        path.close()
+        self.pdf.setFillColor(HexColor(color))
+        self.pdf.drawPath(path, stroke=0, fill=1)
+
+    def finish(self):
+        self.pdf.restoreState()
+        self.pdf.showPage()
+
+def generate_report_pdf(writer_stats, start_date=None, end_date=None):
+    """Render the report layout as a vector PDF, paginated onto A4 pages."""
+    regular, bold = load_fonts()
+
+    header_blue = '#2563EB'
+    text_gray = '#374151'
+    row_alt_bg = '#E8EDF5'
+    border_color = '#D1D5DB'
+    up_green = '#16A34A'
+    down_red = '#DC2626'
+
+    width = LAYOUT_WIDTH
+    header_height = 100
+    row_height = 50
+    row_spacing = 8
+
+    writers = writer_stats["writers"]
+    movements = writer_stats.get("movements")
+    views_growth = writer_stats.get("views_growth")
+
+    total_articles = sum(w["articles"] for w in writers)
+    total_views = sum(w["views"] for w in writers)
+    avg_views = round(total_views / total_articles) if total_articles > 0 else 0
+
+    pdf_bytes = io.BytesIO()
+    pdf = canvas.Canvas(pdf_bytes, pagesize=A4, pageCompression=1)
+    pdf.setTitle(f"Writer Reports {start_date} - {end_date}" if start_date and end_date else "Writer Reports")
+    page = ReportPage(pdf)
+
+    # Header
+    page.rect(0, 0, width, header_height, fill=header_blue)
+    page.text(40, 20, "Writer Reports", bold, 44, '#FFFFFF')
+    if start_date and end_date:
+        page.text(40, 65, f"{start_date} - {end_date}", bold, 32, '#FFFFFF')
+
+    # Summary cards
+    card_width = 230
+    card_height = 120
+    card_spacing = 20
+    cards_y = 120
+    cards_start_x = (width - (card_width * 4 + card_spacing * 3)) // 2
+
+    stats = [
+        ("Total Writers", str(len(writers))),
+        ("Total Articles", str(total_articles)),
+        ("Total Views", f"{total_views:,}"),
+        ("Avg Views/Article", str(avg_views))
+    ]
+    for i, (label, value) in enumerate(stats):
+        x = cards_start_x + i * (card_width + card_spacing)
+        page.rect(x + 3, cards_y + 3, x + card_width + 3, cards_y + card_height + 3, fill='#E5E7EB')
+        page.rect(x, cards_y, x + card_width, cards_y + card_height, fill='#FFFFFF', outline=border_color, width=2)
+        page.centered_text(x, card_width, cards_y + 25, value, bold, 32, '#000000')
+        page.centered_text(x, card_width, cards_y + 70, label, regular, 24, text_gray)
+        if label == "Total Views" and views_growth is not None:
+            page.centered_text(x, card_width, cards_y + 97, f"{views_growth:+d}% vs last period", bold, 16,
+                               up_green if views_growth >= 0 else down_red)
+
+    y = cards_y + 160
+    page.text(40, y, "Writer Leaderboard", bold, 32, '#000000')
+    y += 60
+
+    def draw_table_header(y):
+        for header, x in zip(["Writer", "Articles", "Views", "Avg Views/Article"], [40, 400, 600, 780]):
+            page.text(x, y, header, regular, 24, text_gray)
+        y += 35
+        page.line(40, y - 5, width - 40, border_color, 2)
+        page.line(40, y + 30, width - 40, border_color, 2)
+        return y + 40
+
+    medals = load_medal_images()
+    row_y = draw_table_header(y)
+    for i, writer in enumerate(writers):
+        # Start a new page, repeating the table header, when the row does not fit
+        if row_y + row_height > PAGE_HEIGHT - BOTTOM_MARGIN:
+            page.finish()
+            page = ReportPage(pdf)
+            row_y = draw_table_header(40)
+
+        if i % 2 == 1:
+            page.rect(40, row_y, width - 40, row_y + row_height, fill=row_alt_bg)
+        page.line(40, row_y + row_height, width - 40, border_color)
+
+        text_y = row_y + (row_height - 30) // 2
+        if i < len(medals):
+            medal, size = medals[i]
+            page.image(medal, 40, row_y + (row_height - size) // 2, size)
+            page.text(40 + size + 8, text_y, writer['name'], regular, 24, '#000000')
+        else:
+            page.text(40, text_y, f"{i+1}. {writer['name']}", regular, 24, '#000000')
+        page.text(400, text_y, str(writer["articles"]), regular, 24, '#000000')
+        views_text = f"{writer['views']:,}"
+        page.text(600, text_y, views_text, regular, 24, '#000000')
+        page.text(780, text_y, str(writer["avg_views"]), regular, 24, '#000000')
+
+        if movements:
+            movement = movements[i]
+            mid_y = row_y + row_height // 2
+            change = movement["rank_change"]
+            if movement["is_new"]:
+                page.text(330, mid_y - 9, "NEW", bold, 16, header_blue)
+            elif change > 0:
+                page.triangle([(330, mid_y + 6), (344, mid_y + 6), (337, mid_y - 6)], up_green)
+                page.text(348, mid_y - 9, str(change), bold, 16, up_green)
+            elif change < 0:
+                page.triangle([(330, mid_y - 6), (344, mid_y - 6), (337, mid_y + 6)], down_red)
+                page.text(348, mid_y - 9, str(-change), bold, 16, down_red)
+            growth = movement["views_growth"]
+            if growth is not None:
+                growth_x = 600 + pdfmetrics.stringWidth(views_text, regular, 24) + 8
+                page.text(growth_x, mid_y - 9, f"{growth:+d}%", bold, 16, up_green if growth >= 0 else down_red)
+
+        row_y += row_height + row_spacing
+
+    page.finish()
+    pdf.save()
+    pdf_bytes.seek(0)
+
+    return pdf_bytes
@@ -0,0 +1,149 @@
+import io
+from xml.sax.saxutils import escape
+
+WIDTH = 1000
+HEADER_HEIGHT = 100
+ROW_HEIGHT = 50
+ROW_SPACING = 8
+FONT_FAMILY = "Arial, Helvetica, sans-serif"
+
+HEADER_BLUE = '#2563EB'
+TEXT_GRAY = '#374151'
+ROW_ALT_BG = '#E8EDF5'
+BORDER_COLOR = '#D1D5DB'
+UP_GREEN = '#16A34A'
+DOWN_RED = '#DC2626'
+
+# Vector versions of the medal sprites in assets/medals.png: (face, rim)
+MEDAL_COLORS = [("#F5C542", "#B8860B"), ("#D9DEE4", "#8A939E"), ("#E0955A", "#9A5B2C")]
+
+MEDAL_SYMBOL = (
+    '<symbol id="medal{rank}" viewBox="0 0 40 40">'
+    '<polygon points="9,0 18,0 23,18 14,18" fill="#2563EB"/>'
+    '<polygon points="22,0 31,0 26,18 17,18" fill="#1E40AF"/>'
+    '<circle cx="20" cy="24.8" r="12.8" fill="{rim}"/>'
+    '<circle cx="20" cy="24.8" r="10.8" fill="{face}"/>'
+    '<text x="20" y="29.8" font-size="14" font-weight="bold" text-anchor="middle" fill="{rim}">{rank}</text>'
+    '</symbol>'
+)
+
+# Vector versions of the rank badges after the medals, up to LAST_BADGE_RANK
+LAST_BADGE_RANK = 10
+
+BADGE_SYMBOL = (
+    '<symbol id="medal{rank}" viewBox="0 0 40 40">'
+    '<circle cx="20" cy="20" r="14.4" fill="#2563EB"/>'
+    '<circle cx="20" cy="20" r="12.4" fill="#DBEAFE"/>'
+    '<text x="20" y="25" font-size="{font_size}" font-weight="bold" text-anchor="middle" fill="#2563EB">{rank}</text>'
+    '</symbol>'
+)
+
+def text(x, y, value, size, color, bold=False, anchor=None):
+    # y is the top of the text, as in the Pillow layout; SVG positions the baseline
+    weight = ' font-weight="bold"' if bold else ''
+    anchor_attr = f' text-anchor="{anchor}"' if anchor else ''
+    return f'<text x="{x}" y="{y + round(size * 0.8)}" font-size="{size}"{weight}{anchor_attr} fill="{color}">{escape(str(value))}</text>'
+
+def movement_marks(movement, row_y, growth_x):
+    mid_y = row_y + ROW_HEIGHT // 2
+    change = movement["rank_change"]
+    parts = []
+    if movement["is_new"]:
+        parts.append(text(330, mid_y - 9, "NEW", 16, HEADER_BLUE, bold=True))
+    elif change > 0:
+        parts.append(f'<polygon points="330,{mid_y + 6} 344,{mid_y + 6} 337,{mid_y - 6}" fill="{UP_GREEN}"/>')
+        parts.append(text(348, mid_y - 9, change, 16, UP_GREEN, bold=True))
+    elif change < 0:
+        parts.append(f'<polygon points="330,{mid_y - 6} 344,{mid_y - 6} 337,{mid_y + 6}" fill="{DOWN_RED}"/>')
+        parts.append(text(348, mid_y - 9, -change, 16, DOWN_RED, bold=True))
+    growth = movement["views_growth"]
+    if growth is not None:
+        parts.append(text(growth_x, mid_y - 9, f"{growth:+d}%", 16, UP_GREEN if growth >= 0 else DOWN_RED, bold=True))
+    return "".join(parts)
+
+def generate_report_svg(writer_stats, start_date=None, end_date=None):
+    """Render the report layout as an SVG document straight from the rows.
+
+    Nothing is rasterized, so the cost is a string template per row and the
+    output compresses well.
+    """
+    writers = writer_stats["writers"]
+    movements = writer_stats.get("movements")
+    views_growth = writer_stats.get("views_growth")
+
+    writers_section_height = (ROW_HEIGHT + ROW_SPACING) * len(writers) - ROW_SPACING
+    total_height = max(800, HEADER_HEIGHT + 250 + 140 + writers_section_height + 40)
+
+    total_articles = sum(w["articles"] for w in writers)
+    total_views = sum(w["views"] for w in writers)
+    avg_views = round(total_views / total_articles) if total_articles > 0 else 0
+
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{WIDTH}" height="{total_height}" '
+        f'viewBox="0 0 {WIDTH} {total_height}" font-family="{FONT_FAMILY}">',
+        '<defs>',
+        *(MEDAL_SYMBOL.format(rank=i + 1, face=face, rim=rim) for i, (face, rim) in enumerate(MEDAL_COLORS)),
+        *(BADGE_SYMBOL.format(rank=rank, font_size=14 if rank < 10 else 12)
+          for rank in range(len(MEDAL_COLORS) + 1, min(len(writers), LAST_BADGE_RANK) + 1)),
+        '</defs>',
+        f'<rect width="{WIDTH}" height="{total_height}" fill="white"/>',
+        f'<rect width="{WIDTH}" height="{HEADER_HEIGHT}" fill="{HEADER_BLUE}"/>',
+        text(40, 20, "Writer Reports", 44, "white", bold=True),
+    ]
+    if start_date and end_date:
+        parts.append(text(40, 65, f"{start_date} - {end_date}", 32, "white", bold=True))
+
+    # Summary cards
+    card_width = 230
+    card_height = 120
+    card_spacing = 20
+    cards_y = 120
+    cards_start_x = (WIDTH - (card_width * 4 + card_spacing * 3)) // 2
+    stats = [
+        ("Total Writers", str(len(writers))),
+        ("Total Articles", str(total_articles)),
+        ("Total Views", f"{total_views:,}"),
+        ("Avg Views/Article", str(avg_views))
+    ]
+    for i, (label, value) in enumerate(stats):
+        x = cards_start_x + i * (card_width + card_spacing)
+        center = x + card_width // 2
+        parts.append(f'<rect x="{x + 3}" y="{cards_y + 3}" width="{card_width}" height="{card_height}" fill="#E5E7EB"/>')
+        parts.append(f'<rect x="{x}" y="{cards_y}" width="{card_width}" height="{card_height}" fill="white" stroke="{BORDER_COLOR}" stroke-width="2"/>')
+        parts.append(text(center, cards_y + 25, value, 32, "black", bold=True, anchor="middle"))
+        parts.append(text(center, cards_y + 70, label, 24, TEXT_GRAY, anchor="middle"))
+        if label == "Total Views" and views_growth is not None:
+            parts.append(text(center, cards_y + 97, f"{views_growth:+d}% vs last period", 16,
+                              UP_GREEN if views_growth >= 0 else DOWN_RED, bold=True, anchor="middle"))
+
+    # Leaderboard table
+    y = cards_y + 160
+    parts.append(text(40, y, "Writer Leaderboard", 32, "black", bold=True))
+    y += 60
+    for header, x in zip(["Writer", "Articles", "Views", "Avg Views/Article"], [40, 400, 600, 780]):
+        parts.append(text(x, y, header, 24, TEXT_GRAY))
+    y += 35
+    parts.append(f'<path d="M40 {y - 5}H{WIDTH - 40}M40 {y + 30}H{WIDTH - 40}" stroke="{BORDER_COLOR}" stroke-width="2"/>')
+    y += 40
+
+    for i, writer in enumerate(writers):
+        row_y = y + (ROW_HEIGHT + ROW_SPACING) * i
+        text_y = row_y + (ROW_HEIGHT - 30) // 2
+        if i % 2 == 1:
+            parts.append(f'<rect x="40" y="{row_y}" width="{WIDTH - 80}" height="{ROW_HEIGHT}" fill="{ROW_ALT_BG}"/>')
+        parts.append(f'<path d="M40 {row_y + ROW_HEIGHT}H{WIDTH - 40}" stroke="{BORDER_COLOR}"/>')
+        if i < LAST_BADGE_RANK:
+            parts.append(f'<use href="#medal{i + 1}" x="40" y="{row_y + 5}" width="40" height="40"/>')
+            parts.append(text(88, text_y, writer["name"], 24, "black"))
+        else:
+            parts.append(text(40, text_y, f"{i + 1}. {writer['name']}", 24, "black"))
+        views_text = f"{writer['views']:,}"
+        parts.append(text(400, text_y, writer["articles"], 24, "black"))
+        parts.append(text(600, text_y, views_text, 24, "black"))
+        parts.append(text(780, text_y, writer["avg_views"], 24, "black"))
+        if movements:
+            # Without font metrics, estimate the views width at ~0.56em per character
+            parts.append(movement_marks(movements[i], row_y, 600 + round(len(views_text) * 24 * 0.56) + 8))
+
+    parts.append('</svg>')
+    return io.BytesIO("\n".join(parts).encode())
@@ -0,0 +1,114 @@
+import bisect
+import re
+from collections import defaultdict
+
+WORD = re.compile(r"\w+")
+
+def normalize(text):
+    # Apostrophes join words ("O'Brien" -> "obrien"); other punctuation separates them
+    return " ".join(WORD.findall(text.lower().replace("'", "")))
+
+def trigrams(text):
+    # Pad so short names and word starts still produce trigrams
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+class NameIndex:
+    """Prefix and fuzzy lookup of writer names.
+
+    Prefix matches come from a sorted list of (key, id) pairs, with one key
+    per word start, so "smi" finds "John Smith". Fuzzy matches score names
+    by the share of the query's trigrams found in them. Both structures are updated
+    one writer at a time as writers are added and removed.
+    """
+
+    def __init__(self, writers=(), min_similarity=0.5):
+        self.min_similarity = min_similarity
+        self._keys = []
+        self._names = {}
+        self._gram_counts = {}
+        self._trigrams = defaultdict(set)
+        # Build the initial index in bulk and sort the keys once
+        for writer_id, name in writers:
+            self._index(writer_id, normalize(name), self._keys.append)
+        self._keys.sort()
+
+    def _index(self, writer_id, name, add_key):
+        self._names[writer_id] = name
+        for key in self._word_keys(name):
+            add_key((key, writer_id))
+        grams = trigrams(name)
+        self._gram_counts[writer_id] = len(grams)
+        for gram in grams:
+            self._trigrams[gram].add(writer_id)
+
+    def _word_keys(self, name):
+        starts = [m.start() for m in re.finditer(r"\S+", name)]
+        return [name[start:] for start in starts]
+
+    def add(self, writer_id, name):
+        if writer_id in self._names:
+            self.remove(writer_id)
+        self._index(writer_id, normalize(name), lambda key: bisect.insort(self._keys, key))
+
+    def remove(self, writer_id):
+        name = self._names.pop(writer_id, None)
+        if name is None:
+            return
+        del self._gram_counts[writer_id]
+        for key in self._word_keys(name):
+            i = bisect.bisect_left(self._keys, (key, writer_id))
+            if i < len(self._keys) and self._keys[i] == (key, writer_id):
+                del self._keys[i]
+        for gram in trigrams(name):
+            ids = self._trigrams[gram]
+            ids.discard(writer_id)
+            if not ids:
+                del self._trigrams[gram]
+
+    def prefix(self, query, limit):
+        """Return ids of writers with a word starting with `query`, in name order."""
+        query = normalize(query)
+        if not query:
+            return []
+        found = []
+        seen = set()
+        keys = self._keys
+        # Walk from the first match by index; slicing (or islice) would cost O(n) per lookup
+        for i in range(bisect.bisect_left(keys, (query,)), len(keys)):
+            key, writer_id = keys[i]
+            if not key.startswith(query) or len(found) >= limit:
+                break
+            if writer_id not in seen:
+                seen.add(writer_id)
+                found.append(writer_id)
+        return found
+
+    def fuzzy(self, query, limit):
+        """Return (id, similarity) pairs for names sharing enough trigrams with `query`."""
+        query_grams = trigrams(normalize(query))
+        shared = defaultdict(int)
+        for gram in query_grams:
+            for writer_id in self._trigrams.get(gram, ()):
+                shared[writer_id] += 1
+        scored = []
+        for writer_id, count in shared.items():
+            similarity = count / len(query_grams)
+            if similarity >= self.min_similarity:
+                scored.append((writer_id, similarity))
+        # Among equally good matches, prefer names with less else in them
+        scored.sort(key=lambda s: (-s[1], self._gram_counts[s[0]], self._names[s[0]]))
+        return scored[:limit]
+
+    def search(self, query, limit=20):
+        """Prefix matches first, then fuzzy matches, as (id, match, score) tuples."""
+        results = [(writer_id, "prefix", 1.0) for writer_id in self.prefix(query, limit)]
+        if len(results) >= limit:
+            return results
+        seen = {writer_id for writer_id, _, _ in results}
+        for writer_id, similarity in self.fuzzy(query, limit):
+            if len(results) >= limit:
+                break
+            if writer_id not in seen:
+                results.append((writer_id, "fuzzy", round(similarity, 3)))
+        return results
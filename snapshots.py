@@ -0,0 +1,138 @@
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+# Snapshot records are (id, name, articles, views, rank) tuples sorted by id
+ID, NAME, ARTICLES, VIEWS, RANK = range(5)
+
+def period_key(start_date, end_date):
+    """Filename-friendly key for a period, e.g. 20241223_to_20241229."""
+    return f"{start_date.replace('-', '')}_to_{end_date.replace('-', '')}"
+
+def freeze_rows(writer_stats):
+    """Turn ranked get_writer_stats() rows into compact snapshot records."""
+    records = [
+        (w["id"], w["name"], w["articles"], w["views"], rank)
+        for rank, w in enumerate(writer_stats, start=1)
+    ]
+    records.sort(key=lambda r: r[ID])
+    return tuple(records)
+
+def rerank(records, key):
+    """Re-rank snapshot records by another ordering.
+
+    `key` maps (articles, views) to a sort key, best first. Ties keep id
+    order, since a snapshot does not record the roster order.
+    """
+    ordered = sorted(records, key=lambda r: key(r[ARTICLES], r[VIEWS]))
+    ranks = {r[ID]: rank for rank, r in enumerate(ordered, start=1)}
+    return tuple((r[ID], r[NAME], r[ARTICLES], r[VIEWS], ranks[r[ID]]) for r in records)
+
+def compare_snapshots(current, previous):
+    """Work out rank and view movement between two snapshots.
+
+    Both snapshots are sorted by id, so a single merge pass pairs every
+    current writer with their previous record. Returns one movement dict per
+    current writer, ordered by current rank.
+    """
+    movements = [None] * len(current)
+    i = j = 0
+    while i < len(current):
+        record = current[i]
+        while j < len(previous) and previous[j][ID] < record[ID]:
+            j += 1
+        if j < len(previous) and previous[j][ID] == record[ID]:
+            before = previous[j]
+            views_change = record[VIEWS] - before[VIEWS]
+            movement = {
+                "is_new": False,
+                "rank_change": before[RANK] - record[RANK],
+                "views_change": views_change,
+                "views_growth": round(views_change * 100 / before[VIEWS]) if before[VIEWS] > 0 else None
+            }
+        else:
+            movement = {
+                "is_new": True,
+                "rank_change": 0,
+                "views_change": record[VIEWS],
+                "views_growth": None
+            }
+        movements[record[RANK] - 1] = movement
+        i += 1
+    return movements
+
+class SnapshotStore:
+    """Immutable leaderboards for closed report periods, one file per period.
+
+    Snapshots are only read from disk when a report asks for them, and just
+    the most recently used ones are kept in memory.
+    """
+
+    def __init__(self, directory, cache_size=4):
+        self.directory = Path(directory)
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def path_for(self, key):
+        return self.directory / f"snapshot_{key}.json"
+
+    def periods(self):
+        """Return the stored periods as (start, end) YYYYMMDD pairs, oldest first."""
+        if not self.directory.exists():
+            return []
+        periods = []
+        for path in self.directory.glob("snapshot_*_to_*.json"):
+            start, _, end = path.stem[len("snapshot_"):].partition("_to_")
+            periods.append((start, end))
+        return sorted(periods, key=lambda p: (p[1], p[0]))
+
+    def freeze(self, writer_stats, start_date, end_date):
+        """Store the leaderboard for a closed period.
+
+        Raises FileExistsError if the period has already been frozen.
+        """
+        key = period_key(start_date, end_date)
+        path = self.path_for(key)
+        records = freeze_rows(writer_stats)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # The scheduler and POST /snapshots may freeze the same period at once
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump({"start_date": start_date, "end_date": end_date, "writers": records}, f, separators=(',', ':'))
+        try:
+            # Linking fails if the snapshot exists, which keeps frozen periods immutable
+            os.link(tmp_path, path)
+        finally:
+            os.remove(tmp_path)
+        return key
+
+    def load(self, key):
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+        with open(self.path_for(key), 'r') as f:
+            records = tuple(tuple(r) for r in json.load(f)["writers"])
+        with self._lock:
+            self._cache[key] = records
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return records
+
+    def previous_key(self, start_date):
+        """Return the key of the latest snapshot that ends before `start_date`, or None."""
+        start = start_date.replace('-', '')
+        earlier = [p for p in self.periods() if p[1] < start]
+        if not earlier:
+            return None
+        return "_to_".join(earlier[-1])
+
+    def previous(self, start_date):
+        """Return the latest snapshot that ends before `start_date`, or None."""
+        key = self.previous_key(start_date)
+        if key is None:
+            return None
+        return self.load(key)
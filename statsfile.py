@@ -0,0 +1,196 @@
+"""Compact binary format for the writer store, read through mmap.
+
+A store in this format opens without parsing anything: the header is read
+up front and every writer is decoded from the mapped file only when it is
+accessed. Layout, little endian:
+
+    header    magic b"WSTB", format version u16, reserved u16,
+              writer count u32, id table length u32, string table offset u64
+    records   one per writer in roster order: id u32, name offset u32,
+              name length u32, articles i64, views i64
+    id table  record position for each id, 0xFFFFFFFF for unused ids
+    strings   the writers' names, UTF-8, back to back
+
+Convert a store with
+
+    python statsfile.py writer_stats.json writer_stats.bin
+    python statsfile.py writer_stats.bin writer_stats.json
+"""
+import argparse
+import json
+import mmap
+import struct
+from collections.abc import Mapping, Sequence
+
+MAGIC = b"WSTB"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sHHIIQ")
+RECORD = struct.Struct("<IIIqq")
+SLOT = struct.Struct("<I")
+UNUSED = 0xFFFFFFFF
+
+def iter_rows(data):
+    """Yield (id, name, articles, views) for each writer in roster order.
+
+    `data` is either the JSON store's dict or an open StatsFile.
+    """
+    if isinstance(data, StatsFile):
+        yield from data.rows()
+        return
+    stats = data.get("stats", {})
+    for writer in data["writers"]:
+        writer_stats = stats.get(writer["id"], {"articles": 0, "views": 0})
+        yield writer["id"], writer["name"], writer_stats["articles"], writer_stats["views"]
+
+def encode(data):
+    """Serialize a store to the binary format.
+
+    Ids must be distinct decimal numbers, as the JSON store assigns them.
+    Raises ValueError otherwise.
+    """
+    records = []
+    names = bytearray()
+    positions = {}
+    for position, (writer_id, name, articles, views) in enumerate(iter_rows(data)):
+        if not writer_id.isdigit() or str(int(writer_id)) != writer_id or int(writer_id) >= UNUSED:
+            raise ValueError(f"Writer id {writer_id!r} is not a number the binary format can store")
+        if int(writer_id) in positions:
+            raise ValueError(f"Duplicate writer id {writer_id!r}")
+        positions[int(writer_id)] = position
+        encoded = name.encode("utf-8")
+        records.append(RECORD.pack(int(writer_id), len(names), len(encoded), articles, views))
+        names += encoded
+
+    id_table = [UNUSED] * (max(positions) + 1 if positions else 0)
+    for writer_id, position in positions.items():
+        id_table[writer_id] = position
+    strings_offset = HEADER.size + RECORD.size * len(records) + SLOT.size * len(id_table)
+    return b"".join([
+        HEADER.pack(MAGIC, FORMAT_VERSION, 0, len(records), len(id_table), strings_offset),
+        *records,
+        struct.pack(f"<{len(id_table)}I", *id_table),
+        bytes(names)
+    ])
+
+class StatsFile:
+    """A binary store mapped into memory.
+
+    Indexing it with "writers" and "stats" gives read-only views shaped like
+    the JSON store's lists and dicts, so readers can use either. Nothing is
+    decoded until a view is read; to change the store, copy it with to_dict().
+    """
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, self.count, self._id_slots, self._strings = HEADER.unpack_from(self._map)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self._map.close()
+            raise ValueError(f"{path} is not a version {FORMAT_VERSION} binary writer store")
+        self._id_table = HEADER.size + RECORD.size * self.count
+        self._views = {"writers": _WriterList(self), "stats": _StatsMap(self)}
+
+    def __getitem__(self, key):
+        return self._views[key]
+
+    def __contains__(self, key):
+        return key in self._views
+
+    def close(self):
+        self._map.close()
+
+    def record(self, position):
+        """Decode one writer as (id, name, articles, views)."""
+        writer_id, offset, length, articles, views = RECORD.unpack_from(self._map, HEADER.size + RECORD.size * position)
+        start = self._strings + offset
+        return str(writer_id), self._map[start:start + length].decode("utf-8"), articles, views
+
+    def position(self, writer_id):
+        """Return the record position of `writer_id`, or None."""
+        if not writer_id.isdigit() or int(writer_id) >= self._id_slots or str(int(writer_id)) != writer_id:
+            return None
+        position, = SLOT.unpack_from(self._map, self._id_table + SLOT.size * int(writer_id))
+        return None if position == UNUSED else position
+
+    def rows(self):
+        # One pass over the record block, far cheaper than decoding records one at a time
+        strings = self._map[self._strings:]
+        block = self._map[HEADER.size:self._id_table]
+        for writer_id, offset, length, articles, views in RECORD.iter_unpack(block):
+            yield str(writer_id), strings[offset:offset + length].decode("utf-8"), articles, views
+
+    def to_dict(self):
+        """Decode the whole store into the JSON store's structure."""
+        writers = []
+        stats = {}
+        for writer_id, name, articles, views in self.rows():
+            writers.append({"id": writer_id, "name": name})
+            stats[writer_id] = {"articles": articles, "views": views}
+        return {"writers": writers, "stats": stats}
+
+class _WriterList(Sequence):
+    def __init__(self, store):
+        self._store = store
+
+    def __len__(self):
+        return self._store.count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("writer index out of range")
+        writer_id, name, _, _ = self._store.record(index)
+        return {"id": writer_id, "name": name}
+
+    def __iter__(self):
+        for writer_id, name, _, _ in self._store.rows():
+            yield {"id": writer_id, "name": name}
+
+class _StatsMap(Mapping):
+    def __init__(self, store):
+        self._store = store
+
+    def __len__(self):
+        return self._store.count
+
+    def __getitem__(self, writer_id):
+        position = self._store.position(writer_id) if isinstance(writer_id, str) else None
+        if position is None:
+            raise KeyError(writer_id)
+        _, _, articles, views = self._store.record(position)
+        return {"articles": articles, "views": views}
+
+    def __iter__(self):
+        for writer_id, _, _, _ in self._store.rows():
+            yield writer_id
+
+def is_binary(path):
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+def convert(source, destination):
+    """Convert a store between the JSON and binary formats, whichever `source` is in."""
+    if is_binary(source):
+        store = StatsFile(source)
+        try:
+            payload = json.dumps(store.to_dict(), indent=2).encode("utf-8")
+        finally:
+            store.close()
+    else:
+        with open(source, "r") as f:
+            payload = encode(json.load(f))
+    with open(destination, "wb") as f:
+        f.write(payload)
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert a writer store between the JSON and binary formats.")
+    parser.add_argument("source")
+    parser.add_argument("destination")
+    args = parser.parse_args()
+    convert(args.source, args.destination)
+
+if __name__ == "__main__":
+    main()
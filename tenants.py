@@ -0,0 +1,130 @@
+import re
+import threading
+from collections import OrderedDict
+
+TENANT_KEY = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+DEFAULT_TENANT = "default"
+
+class TenantRegistry:
+    """Keep recently used tenants in memory and load the rest on demand.
+
+    `loader(key)` builds a tenant, which must provide `memory_estimate()`
+    (bytes) and `close()`. Least recently used tenants are closed and dropped
+    once there are more than `max_tenants` of them or their estimated memory
+    exceeds `memory_budget`. A tenant whose own estimate exceeds
+    `tenant_budget` is evicted first, as soon as nothing holds it, so one
+    oversized tenant cannot push the others out. It is then loaded for each
+    request instead of being kept. The tenant being requested is never evicted, and
+    neither is one pinned by acquire() until it is released: a request that
+    still held an evicted tenant would edit a closed copy while a reloaded
+    one served everyone else, and its edits would be lost.
+    """
+
+    def __init__(self, loader, max_tenants=32, memory_budget=256 * 1024 * 1024, tenant_budget=64 * 1024 * 1024):
+        self.loader = loader
+        self.max_tenants = max_tenants
+        self.memory_budget = memory_budget
+        self.tenant_budget = tenant_budget
+        self._tenants = OrderedDict()
+        self._loading = {}
+        # key -> number of holders that pinned the tenant with acquire()
+        self._pins = {}
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def get(self, key):
+        return self._get(key, pin=False)
+
+    def acquire(self, key):
+        """Return the tenant for `key`, kept loaded until release(key)."""
+        return self._get(key, pin=True)
+
+    def release(self, key):
+        with self._lock:
+            pins = self._pins.get(key, 0) - 1
+            if pins > 0:
+                self._pins[key] = pins
+                return
+            self._pins.pop(key, None)
+            # Tenants kept over the limits while pinned can go now
+            evicted = self._evict()
+        for old in evicted:
+            old.close()
+
+    def _get(self, key, pin):
+        if not TENANT_KEY.match(key):
+            raise ValueError(f"Invalid tenant key '{key}'")
+
+        with self._lock:
+            tenant = self._tenants.get(key)
+            if tenant is not None:
+                self._tenants.move_to_end(key)
+                if pin:
+                    self._pins[key] = self._pins.get(key, 0) + 1
+                return tenant
+            loading = self._loading.setdefault(key, threading.Lock())
+
+        # Load outside the registry lock so other tenants keep being served
+        evicted = []
+        with loading:
+            with self._lock:
+                tenant = self._tenants.get(key)
+                if tenant is not None:
+                    if pin:
+                        self._pins[key] = self._pins.get(key, 0) + 1
+                    return tenant
+            tenant = self.loader(key)
+            with self._lock:
+                self._tenants[key] = tenant
+                self._loading.pop(key, None)
+                if pin:
+                    self._pins[key] = self._pins.get(key, 0) + 1
+                evicted = self._evict(keep=key)
+
+        for old in evicted:
+            old.close()
+        return tenant
+
+    def _evict(self, keep=None):
+        evicted = []
+        estimates = {key: t.memory_estimate() for key, t in self._tenants.items()}
+        # Tenants over their own budget go first, whatever the totals
+        for key, estimate in estimates.items():
+            if estimate > self.tenant_budget and key != keep and not self._pins.get(key):
+                evicted.append(self._tenants.pop(key))
+        used = sum(estimates[key] for key in self._tenants)
+        for key in list(self._tenants):
+            if len(self._tenants) <= 1 or (len(self._tenants) <= self.max_tenants and used <= self.memory_budget):
+                break
+            if key == keep or self._pins.get(key):
+                continue
+            evicted.append(self._tenants.pop(key))
+            used -= estimates[key]
+        self.evictions += len(evicted)
+        return evicted
+
+    def loaded(self):
+        with self._lock:
+            return list(self._tenants.values())
+
+    def close_all(self):
+        with self._lock:
+            tenants = list(self._tenants.values())
+            self._tenants.clear()
+        for tenant in tenants:
+            tenant.close()
+
+class TenantPrefixMiddleware:
+    """Route /t/<tenant>/<path> to /<path>, remembering the tenant in the environ."""
+
+    def __init__(self, wsgi_app):
+        self.wsgi_app = wsgi_app
+
+    def __call__(self, environ, start_response):
+        path = environ.get('PATH_INFO', '')
+        if path.startswith('/t/'):
+            key, _, rest = path[3:].partition('/')
+            environ['writer_reports.tenant'] = key
+            environ['PATH_INFO'] = '/' + rest
+            environ['SCRIPT_NAME'] = environ.get('SCRIPT_NAME', '') + '/t/' + key
+        return self.wsgi_app(environ, start_response)
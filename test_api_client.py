@@ -0,0 +1,118 @@
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from werkzeug.serving import make_server
+
+from api_client import ConnectionPool, RemoteWriterStats
+
+class StandInServer:
+    """The API app served from a background thread, for exercising the client."""
+
+    def __init__(self, port=0):
+        import app
+
+        # Stores are opened relative to the working directory, so start each server with fresh tenants
+        app.tenants.close_all()
+        self.server = make_server("127.0.0.1", port, app.create_app(warm=False), threaded=True)
+        self.port = self.server.server_port
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+# Keep the request log out of the results
+logging.getLogger("werkzeug").setLevel(logging.ERROR)
+
+def wait_until(condition, timeout=10):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.02)
+
+def test_api_client():
+    """Edit through RemoteWriterStats against a stand-in server, including while it is down."""
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            server = StandInServer()
+            url = f"http://127.0.0.1:{server.port}"
+            cache = Path(tmp) / "writer_cache.json"
+            other = ConnectionPool(url)
+
+            client = RemoteWriterStats(url, cache, poll_interval=0.2, flush_delay=0.05)
+            wait_until(lambda: client.version is not None)
+
+            # Edits show straight away, before the server has them
+            local_id = client.add_writer("Ada")
+            client.update_stats(local_id, 3, 300)
+            client.add_writer("Grace")
+            assert [w["name"] for w in client.get_writer_stats()] == ["Ada", "Grace"]
+            wait_until(lambda: client.pending_count == 0)
+            on_server = other.request("GET", "/writers")["writers"]
+            assert [(w["name"], w["articles"], w["views"]) for w in on_server] == [("Ada", 3, 300), ("Grace", 0, 0)]
+            assert {w["id"] for w in client.get_writer_stats()} == {w["id"] for w in on_server}
+
+            # A batch resent with the same id (say after a timeout) is applied once
+            resend = {"batch_id": "resent-batch", "operations": [{"op": "add", "name": "Linus"}]}
+            first = other.request("POST", "/writers/batch", resend)
+            again = other.request("POST", "/writers/batch", resend)
+            assert first["ids"] == again["ids"]
+            on_server = other.request("GET", "/writers")["writers"]
+            assert [w["name"] for w in on_server].count("Linus") == 1
+            other.request("DELETE", f"/writers/{first['ids'][0]}")
+            wait_until(lambda: len(client.get_writer_stats()) == 2)
+
+            # So is one the client resends because the response to it was lost
+            send = client.pool.request
+            lost = []
+
+            def lose_first_batch_response(method, path, body=None, headers=None):
+                result = send(method, path, body, headers)
+                if path == "/writers/batch" and not lost:
+                    lost.append(body["batch_id"])
+                    raise TimeoutError("timed out")
+                return result
+
+            client.pool.request = lose_first_batch_response
+            client.add_writer("Barbara")
+            wait_until(lambda: lost and client.pending_count == 0)
+            client.pool.request = send
+            on_server = other.request("GET", "/writers")["writers"]
+            assert [w["name"] for w in on_server].count("Barbara") == 1
+            barbara = next(w["id"] for w in on_server if w["name"] == "Barbara")
+            other.request("DELETE", f"/writers/{barbara}")
+            wait_until(lambda: len(client.get_writer_stats()) == 2)
+
+            # Someone else's edit arrives through /writers/changes
+            grace = next(w["id"] for w in on_server if w["name"] == "Grace")
+            other.request("PUT", f"/writers/{grace}", {"articles": 9, "views": 10})
+            wait_until(lambda: client.get_writer_stats()[0]["name"] == "Grace")
+
+            # Edits made while the server is down are kept and sent once it is back
+            server.stop()
+            client.update_stats(grace, 10, 10)
+            wait_until(lambda: not client.online)
+            client.close(timeout=1)
+            assert client.pending_count == 1
+
+            server = StandInServer(server.port)
+            restarted = RemoteWriterStats(url, cache, poll_interval=0.2, flush_delay=0.05)
+            assert restarted.get_stats(grace) == {"articles": 10, "views": 10}
+            wait_until(lambda: restarted.pending_count == 0)
+            on_server = other.request("GET", "/writers")["writers"]
+            assert (on_server[0]["id"], on_server[0]["articles"]) == (grace, 10)
+            restarted.close()
+            server.stop()
+        finally:
+            os.chdir(cwd)
+    print("api client: optimistic edits, incremental refresh, offline queue and batch resends ok")
+
+if __name__ == "__main__":
+    test_api_client()
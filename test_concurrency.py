@@ -0,0 +1,95 @@
+import json
+import random
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from app import WriterStats
+
+def test_concurrency(threads=16, seconds=3.0, write_delay=0):
+    """Hammer one WriterStats with mixed reads and writes from many threads."""
+    with tempfile.TemporaryDirectory() as tmp:
+        data_file = Path(tmp) / "writer_stats.json"
+        stats = WriterStats(data_file, write_delay=write_delay)
+        for i in range(50):
+            stats.add_writer(f"Seed {i}")
+
+        deadline = time.monotonic() + seconds
+        counts = {"reads": 0, "writes": 0}
+        counts_lock = threading.Lock()
+        errors = []
+
+        def check_rows(rows):
+            ids = [w["id"] for w in rows]
+            assert len(ids) == len(set(ids)), "duplicate writer ids"
+            for w in rows:
+                # Every update writes views as ten times articles
+                assert w["views"] == w["articles"] * 10, f"torn row {w}"
+            keys = [(w["articles"], w["views"]) for w in rows]
+            assert keys == sorted(keys, reverse=True), "rows out of rank order"
+
+        def reader(seed):
+            rng = random.Random(seed)
+            last_version = 0
+            reads = 0
+            while time.monotonic() < deadline:
+                version, rows = stats.get_versioned_writer_stats()
+                assert version >= last_version, "version went backwards"
+                last_version = version
+                check_rows(rows)
+                changes = stats.changes_since(version - rng.randint(0, 20))
+                if changes is not None:
+                    assert changes["version"] >= version
+                    check_rows(changes["writers"])
+                reads += 1
+            with counts_lock:
+                counts["reads"] += reads
+
+        def writer(seed):
+            rng = random.Random(seed)
+            writes = 0
+            while time.monotonic() < deadline:
+                op = rng.random()
+                rows = stats.get_writer_stats()
+                if op < 0.2 or not rows:
+                    stats.add_writer(f"Writer {seed}-{writes}")
+                elif op < 0.3:
+                    stats.remove_writer(rng.choice(rows)["id"])
+                else:
+                    articles = rng.randint(0, 100)
+                    stats.update_stats(rng.choice(rows)["id"], articles, articles * 10)
+                writes += 1
+            with counts_lock:
+                counts["writes"] += writes
+
+        def run(target, seed):
+            try:
+                target(seed)
+            except Exception as e:
+                errors.append(e)
+
+        workers = [
+            threading.Thread(target=run, args=(reader if i % 2 else writer, i))
+            for i in range(threads)
+        ]
+        for t in workers:
+            t.start()
+        for t in workers:
+            t.join()
+
+        stats.close()
+        with open(data_file, 'r') as f:
+            on_disk = json.load(f)
+        assert not errors, errors
+        assert on_disk == stats.writers, "file does not match the store"
+        # Updates racing a removal may leave stats behind, but never a writer without stats
+        assert {w["id"] for w in on_disk["writers"]} <= set(on_disk["stats"])
+
+        print(f"{threads} threads, write delay {write_delay}s: "
+              f"{counts['reads']} reads, {counts['writes']} writes, "
+              f"{len(on_disk['writers'])} writers at the end")
+
+if __name__ == "__main__":
+    test_concurrency()
+    test_concurrency(write_delay=0.05)
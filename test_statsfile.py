@@ -0,0 +1,87 @@
+import json
+import tempfile
+from pathlib import Path
+
+from app import WriterStats
+from statsfile import UNUSED, StatsFile, convert, encode
+
+def test_statsfile():
+    """Round-trip stores through the binary format and edit one through WriterStats."""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        store = {
+            "writers": [
+                {"id": "3", "name": "Zoë Łukasiewicz"},
+                {"id": "1", "name": "李雷"},
+                {"id": "10", "name": "Ada 🚀"},
+                {"id": "4", "name": ""}
+            ],
+            "stats": {
+                "3": {"articles": 12, "views": 3400},
+                "1": {"articles": 0, "views": 0},
+                "10": {"articles": 7, "views": 2 ** 40}
+            }
+        }
+        # Writers without stats come back with zeros
+        expected = {**store, "stats": {**store["stats"], "4": {"articles": 0, "views": 0}}}
+
+        # JSON -> binary -> JSON keeps names, roster order and stats
+        json_file, bin_file, back_file = tmp / "store.json", tmp / "store.bin", tmp / "back.json"
+        json_file.write_text(json.dumps(store), encoding="utf-8")
+        convert(json_file, bin_file)
+        convert(bin_file, back_file)
+        assert json.loads(back_file.read_text(encoding="utf-8")) == expected
+
+        mapped = StatsFile(bin_file)
+        try:
+            assert list(mapped["writers"]) == store["writers"]
+            assert mapped["writers"][-1] == {"id": "4", "name": ""}
+            assert dict(mapped["stats"]) == expected["stats"]
+
+            # Ids that are not stored, not canonical numbers or not strings are simply missing
+            assert mapped.position("10") == 2
+            for writer_id in ["2", "11", "99999", "abc", "", "03", "-1", "1.0", " 1", "١"]:
+                assert mapped.position(writer_id) is None, writer_id
+                assert writer_id not in mapped["stats"]
+            assert 1 not in mapped["stats"]
+        finally:
+            mapped.close()
+
+        # Ids the format cannot store are refused when encoding
+        for writer_id in ["abc", "01", "", str(UNUSED), "-5"]:
+            try:
+                encode({"writers": [{"id": writer_id, "name": "x"}], "stats": {}})
+            except ValueError:
+                pass
+            else:
+                raise AssertionError(f"id {writer_id!r} was encoded")
+        try:
+            encode({"writers": [{"id": "1", "name": "a"}, {"id": "1", "name": "b"}], "stats": {}})
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("duplicate ids were encoded")
+
+        # A mapped store is thawed on its first edit and saved back in the binary format
+        stats = WriterStats(bin_file, write_delay=0)
+        assert isinstance(stats.writers, StatsFile)
+        assert [w["name"] for w in stats.get_writer_stats()] == ["Zoë Łukasiewicz", "Ada 🚀", "李雷", ""]
+        stats.update_stats("1", 20, 100)
+        assert not isinstance(stats.writers, StatsFile)
+        new_id = stats.add_writer("Grace Hopper")
+        stats.remove_writer("4")
+        stats.close()
+
+        reopened = StatsFile(bin_file)
+        try:
+            assert reopened.to_dict() == stats.writers
+            assert [w["name"] for w in reopened["writers"]] == ["Zoë Łukasiewicz", "李雷", "Ada 🚀", "Grace Hopper"]
+            assert reopened["stats"]["1"] == {"articles": 20, "views": 100}
+            assert reopened["stats"][new_id] == {"articles": 0, "views": 0}
+        finally:
+            reopened.close()
+
+    print("statsfile: round trip, id lookups, rejected ids and thaw-then-save ok")
+
+if __name__ == "__main__":
+    test_statsfile()